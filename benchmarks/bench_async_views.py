@@ -0,0 +1,118 @@
+"""Compares the sync WSGI list endpoint under gunicorn with the async ASGI
+list endpoint under uvicorn, at growing numbers of concurrent clients.
+
+Servers that are not installed are skipped (pip install gunicorn uvicorn).
+
+Usage:
+    python -m benchmarks.bench_async_views --users 10 100 500 --duration 10
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+
+import django
+
+os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+
+
+def prepare_database(path: Path, rows: int) -> None:
+    os.environ["BENCHMARK_DATABASE"] = str(path)
+    django.setup()
+
+    from django.core.management import call_command
+
+    from benchmarks.bench_list_rendering import populate
+
+    call_command("migrate", verbosity=0)
+    populate(rows)
+
+
+def servers(port: int, workers: int, threads: int) -> dict:
+    return {
+        "gunicorn (WSGI, sync)": (
+            "gunicorn",
+            [
+                "gunicorn",
+                "src.wsgi:application",
+                f"--bind=127.0.0.1:{port}",
+                f"--workers={workers}",
+                f"--threads={threads}",
+                "--log-level=warning",
+            ],
+            "/api/reports/",
+        ),
+        "uvicorn (ASGI, async)": (
+            "uvicorn",
+            [
+                "uvicorn",
+                "src.asgi:application",
+                "--host=127.0.0.1",
+                f"--port={port}",
+                f"--workers={workers}",
+                "--log-level=warning",
+                "--no-access-log",
+            ],
+            "/api/async/reports/",
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    from benchmarks.load import (
+        HTTPRequest,
+        free_port,
+        run_load,
+        start_server,
+        stop_server,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        prepare_database(Path(directory) / "bench.sqlite3", args.rows)
+        port = free_port()
+
+        print(f"{'server':<24}{'users':>7}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+        for name, (module, command, path) in servers(
+            port, args.workers, args.threads
+        ).items():
+            if importlib.util.find_spec(module) is None:
+                print(f"{name:<24}skipped, {module} is not installed")
+                continue
+
+            request = HTTPRequest("GET", f"{path}?per_page={args.per_page}")
+            process = start_server(command, port, dict(os.environ))
+            try:
+                for users in args.users:
+                    result = asyncio.run(
+                        run_load(
+                            "127.0.0.1",
+                            port,
+                            lambda number, body: request,
+                            users,
+                            args.duration,
+                        )
+                    )
+                    print(
+                        f"{name:<24}{users:>7}{result.requests_per_second:>10.0f}"
+                        f"{result.percentile(50) * 1000:>9.1f}"
+                        f"{result.percentile(99) * 1000:>9.1f}"
+                        + (f"  {result.errors} errors" if result.errors else "")
+                    )
+            finally:
+                stop_server(process)
+
+
+if __name__ == "__main__":
+    main()
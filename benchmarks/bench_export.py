@@ -0,0 +1,71 @@
+"""Measures throughput and peak Python memory of streaming the report export
+at growing table sizes.
+
+Usage:
+    python -m benchmarks.bench_export --sizes 10000 100000
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from benchmarks.bench_list_rendering import populate  # noqa: E402
+from src.report.models import ReportModel  # noqa: E402
+from src.report.views import ReportViewSet  # noqa: E402
+
+
+def export(format: str) -> tuple[int, float, int]:
+    # The router passes the action options, like its renderers, to the view
+    view = ReportViewSet.as_view({"get": "export"}, **ReportViewSet.export.kwargs)
+    request = APIRequestFactory().get(f"/reports/export/?format={format}")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = view(request)
+    size = sum(len(chunk) for chunk in response.streaming_content)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, peak
+
+
+def run(size: int) -> None:
+    ReportModel.objects.all().delete()
+    populate(size)
+
+    print(f"\n{size:,} rows")
+    print(f"{'format':<8}{'MB':>10}{'rows/s':>12}{'peak MB':>10}")
+    for format in ("ndjson", "csv"):
+        length, elapsed, peak = export(format)
+        print(
+            f"{format:<8}{length / 1e6:>10.1f}{size / elapsed:>12,.0f}"
+            f"{peak / 1e6:>10.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        for size in args.sizes:
+            run(size)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compares hydrating reports with full validation against the trusted
+persistence path used by ReportModelMapper.to_entity.
+
+Usage:
+    python -m benchmarks.bench_hydration --sizes 50 100000
+"""
+
+import argparse
+import os
+import random
+import time
+from uuid import uuid4
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
+django.setup()
+
+from src.report.domain.report import Report  # noqa: E402
+from src.report.domain.value_objects import ReportStatus, ReportType  # noqa: E402
+from src.report.models import ReportModel  # noqa: E402
+from src.report.repository import ReportModelMapper  # noqa: E402
+
+WORDS = (
+    "leak data breach password credential server customer bank account email "
+    "phishing malware exposed database backup invoice login portal access token"
+).split()
+
+
+def make_models(size: int, seed: int = 42) -> list[ReportModel]:
+    rng = random.Random(seed)
+    return [
+        ReportModel(
+            id=uuid4(),
+            title=" ".join(rng.choices(WORDS, k=4)).capitalize(),
+            complaint=" ".join(rng.choices(WORDS, k=40)),
+            report_type=rng.choice(list(ReportType)).name,
+            report_status=rng.choice(list(ReportStatus)).name,
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+        )
+        for index in range(size)
+    ]
+
+
+def validated(model: ReportModel) -> Report:
+    return Report(
+        id=model.id,
+        title=model.title,
+        complaint=model.complaint,
+        name=model.name,
+        email=model.email,
+        report_type=model.report_type,
+        report_status=model.report_status,
+    )
+
+
+def timed(function, models: list[ReportModel], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for model in models:
+            function(model)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(size: int, repeat: int) -> None:
+    models = make_models(size)
+    validated_time = timed(validated, models, repeat)
+    trusted_time = timed(ReportModelMapper.to_entity, models, repeat)
+
+    print(f"\n{size:,} rows")
+    print(f"{'path':<12}{'total ms':>12}{'per row µs':>14}")
+    for name, elapsed in (("validated", validated_time), ("trusted", trusted_time)):
+        print(f"{name:<12}{elapsed * 1000:>12.2f}{elapsed / size * 1e6:>14.2f}")
+    print(f"speedup {validated_time / trusted_time:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compares in-memory report search by full scan against the n-gram index.
+
+Usage:
+    python -m benchmarks.bench_in_memory_search --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.infrastructure.in_memory_report_repository import (
+    InMemoryReportRepository,
+)
+from src.report.infrastructure.in_memory_search_index import ReportSearchIndex
+
+WORDS = (
+    "leak data breach password credential server customer bank account email "
+    "phishing malware exposed database backup invoice login portal access token "
+    "report security incident employee vendor payment card identity"
+).split()
+
+QUERIES = ["credential", "phishing attempt", "user4242", "zzzz"]
+
+
+def make_reports(size: int, seed: int = 42) -> list[Report]:
+    rng = random.Random(seed)
+    return [
+        Report(
+            id=uuid4(),
+            title=" ".join(rng.choices(WORDS, k=4)).capitalize(),
+            complaint=" ".join(rng.choices(WORDS, k=40)),
+            report_type=rng.choice(list(ReportType)),
+            report_status=rng.choice(list(ReportStatus)),
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+        )
+        for index in range(size)
+    ]
+
+
+def timed(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(size: int, repeat: int) -> None:
+    reports = make_reports(size)
+
+    start = time.perf_counter()
+    scan_repository = InMemoryReportRepository(reports)
+    scan_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed_repository = InMemoryReportRepository(
+        reports, search_index=ReportSearchIndex()
+    )
+    indexed_build = time.perf_counter() - start
+
+    print(
+        f"\n{size:,} reports (build: scan {scan_build:.2f}s, index {indexed_build:.2f}s)"
+    )
+    print(f"{'query':<20}{'matches':>10}{'scan ms':>12}{'index ms':>12}{'speedup':>10}")
+    for query in QUERIES:
+
+        def scan():
+            scan_repository.list("title", 1, 10, query)
+            scan_repository.count(query)
+
+        def indexed():
+            indexed_repository.list("title", 1, 10, query)
+            indexed_repository.count(query)
+
+        scan_time = timed(scan, repeat)
+        indexed_time = timed(indexed, repeat)
+        print(
+            f"{query:<20}{indexed_repository.count(query):>10}"
+            f"{scan_time * 1000:>12.2f}{indexed_time * 1000:>12.2f}"
+            f"{scan_time / indexed_time:>9.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
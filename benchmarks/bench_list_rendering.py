@@ -0,0 +1,122 @@
+"""Compares requests per second on the list endpoint between the serializer
+and JSONRenderer path and the plain dict and orjson path.
+
+Usage:
+    python -m benchmarks.bench_list_rendering --per-page 50 --requests 500
+"""
+
+import argparse
+import os
+import random
+import time
+from contextlib import ExitStack
+from unittest.mock import patch
+from uuid import uuid4
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    override_settings,
+    setup_test_environment,
+)
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from src.renderers import ORJSONRenderer  # noqa: E402
+from src.report.domain.value_objects import ReportStatus, ReportType  # noqa: E402
+from src.report.models import ReportModel  # noqa: E402
+from src.report.serializers import (  # noqa: E402
+    ListReportResponseSerializer,
+)
+from src.report.views import ReportViewSet  # noqa: E402
+
+WORDS = (
+    "leak data breach password credential server customer bank account email "
+    "phishing malware exposed database backup invoice login portal access token"
+).split()
+
+
+def populate(size: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    ReportModel.objects.bulk_create(
+        ReportModel(
+            id=uuid4(),
+            title=" ".join(rng.choices(WORDS, k=4)).capitalize(),
+            complaint=" ".join(rng.choices(WORDS, k=40)),
+            report_type=rng.choice(list(ReportType)).name,
+            report_status=rng.choice(list(ReportStatus)).name,
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+        )
+        for index in range(size)
+    )
+
+
+def serializer_data(output):
+    return ListReportResponseSerializer(output).data
+
+
+def requests_per_second(view, per_page: int, requests: int) -> float:
+    factory = APIRequestFactory()
+    path = f"/reports/?per_page={per_page}"
+
+    def get():
+        response = view(factory.get(path))
+        response.render()
+        return response
+
+    # Warm up, which also fills the list cache
+    assert get().status_code == 200
+    start = time.perf_counter()
+    for _ in range(requests):
+        get()
+    return requests / (time.perf_counter() - start)
+
+
+def run(per_page: int, requests: int, cached: bool) -> None:
+    paths = {
+        "serializer": (serializer_data, JSONRenderer),
+        "plain dict": (None, JSONRenderer),
+        "plain+orjson": (None, ORJSONRenderer),
+    }
+    list_timeout = 60 if cached else None
+
+    print(f"\nper_page={per_page}, list cache {'on' if cached else 'off'}")
+    print(f"{'path':<14}{'req/s':>10}")
+    baseline = None
+    for name, (data, renderer) in paths.items():
+        with ExitStack() as stack:
+            stack.enter_context(
+                override_settings(REPORT_LIST_CACHE_TIMEOUT=list_timeout)
+            )
+            if data is not None:
+                stack.enter_context(patch("src.report.views.list_report_data", data))
+            view = ReportViewSet.as_view({"get": "list"}, renderer_classes=[renderer])
+            rate = requests_per_second(view, per_page, requests)
+        baseline = baseline or rate
+        print(f"{name:<14}{rate:>10.0f}  {rate / baseline:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        populate(args.rows)
+        for cached in (True, False):
+            run(args.per_page, args.requests, cached)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
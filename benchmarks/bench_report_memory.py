@@ -0,0 +1,57 @@
+"""Measures the memory held per Report instance with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_report_memory --sizes 10000 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from uuid import uuid4
+
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+
+def make_fields(size: int) -> list[dict]:
+    return [
+        {
+            "id": uuid4(),
+            "title": f"Report {index}",
+            "complaint": f"Complaint {index}",
+            "report_type": ReportType.DATA_LEAK,
+            "report_status": ReportStatus.PENDING,
+            "name": f"User {index}",
+            "email": f"user{index}@example.com",
+        }
+        for index in range(size)
+    ]
+
+
+def measure(size: int, build) -> float:
+    # Field values are allocated up front so only the report objects are counted
+    fields = make_fields(size)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    reports = [build(values) for values in fields]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del reports
+    return (after - before) / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'reports':>10}{'validated B/report':>22}{'stored B/report':>20}")
+    for size in args.sizes:
+        validated = measure(size, lambda values: Report(**values))
+        stored = measure(size, lambda values: Report.from_persistence(**values))
+        print(f"{size:>10,}{validated:>22.0f}{stored:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Compares mixed read/write throughput on a SQLite file with SQLite's defaults
+and with the REPORT_SQLITE_PRAGMAS performance profile, at growing numbers of
+concurrent threads.
+
+Every thread has its own connection and loops over reads by id, list pages
+and report inserts, a share of --writes of the operations being inserts.
+
+Usage:
+    python -m benchmarks.bench_sqlite_profile --threads 1 4 16 --duration 5
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import django
+
+os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+DIRECTORY = tempfile.mkdtemp()
+DATABASE = Path(DIRECTORY) / "bench.sqlite3"
+os.environ["BENCHMARK_DATABASE"] = str(DATABASE)
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import OperationalError, connection, connections  # noqa: E402
+
+from benchmarks.bench_list_rendering import populate  # noqa: E402
+from src.report.domain.report import Report  # noqa: E402
+from src.report.domain.value_objects import ReportStatus, ReportType  # noqa: E402
+from src.report.models import ReportModel  # noqa: E402
+from src.report.repository import DjangoORMReportRepository  # noqa: E402
+
+PROFILES = {
+    "defaults": None,
+    "profile": settings.REPORT_SQLITE_PRAGMAS,
+}
+
+
+def prepare(template: Path, rows: int) -> list:
+    settings.REPORT_SQLITE_PRAGMAS = None
+    call_command("migrate", verbosity=0)
+    populate(rows)
+    ids = list(ReportModel.objects.values_list("id", flat=True))
+    connection.close()
+    shutil.copyfile(DATABASE, template)
+    return ids
+
+
+def reset(template: Path) -> None:
+    # Every run starts from the same file, in rollback journal mode
+    connections.close_all()
+    for suffix in ("-wal", "-shm"):
+        Path(f"{DATABASE}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(template, DATABASE)
+
+
+def worker(ids: list, write_ratio: float, deadline: float, results: list) -> None:
+    repository = DjangoORMReportRepository()
+    rng = random.Random()
+    operations = errors = 0
+    latencies = []
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                if rng.random() < write_ratio:
+                    repository.save(
+                        Report(
+                            title="Benchmark report",
+                            complaint="Written while others read",
+                            report_type=ReportType.OTHER,
+                            report_status=ReportStatus.PENDING,
+                            name="Benchmark",
+                            email="benchmark@example.com",
+                        )
+                    )
+                elif rng.random() < 0.5:
+                    repository.get_by_id(rng.choice(ids))
+                else:
+                    repository.list("-title", rng.randint(1, 50), 20)
+                operations += 1
+            except OperationalError:
+                # "database is locked" once the busy timeout ran out
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+    results.append((operations, errors, latencies))
+
+
+def run(ids: list, threads: int, write_ratio: float, duration: float) -> tuple:
+    results = []
+    deadline = time.perf_counter() + duration
+    workers = [
+        threading.Thread(target=worker, args=(ids, write_ratio, deadline, results))
+        for _ in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    operations = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    latencies = sorted(latency for result in results for latency in result[2])
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    return operations / duration, errors, p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--writes", type=float, default=0.2)
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    template = Path(DIRECTORY) / "template.sqlite3"
+    try:
+        ids = prepare(template, args.rows)
+
+        print(f"{'pragmas':<10}{'threads':>8}{'ops/s':>10}{'p99 ms':>9}{'errors':>8}")
+        for name, pragmas in PROFILES.items():
+            settings.REPORT_SQLITE_PRAGMAS = pragmas
+            for threads in args.threads:
+                reset(template)
+                per_second, errors, p99 = run(ids, threads, args.writes, args.duration)
+                print(
+                    f"{name:<10}{threads:>8}{per_second:>10,.0f}"
+                    f"{p99 * 1000:>9.1f}{errors:>8}"
+                )
+    finally:
+        connections.close_all()
+        shutil.rmtree(DIRECTORY)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Minimal asyncio HTTP/1.1 load generator shared by the server benchmarks.
+
+Each virtual user keeps one keep-alive connection and sends requests back to
+back until the duration is over, so the number of users is the number of
+requests in flight."""
+
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class HTTPRequest:
+    method: str
+    path: str
+    body: Optional[bytes] = None
+    headers: tuple[tuple[str, str], ...] = ()
+    # Requests with a name are also accounted for under it in the result
+    name: str = ""
+
+
+@dataclass
+class LoadResult:
+    requests: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+    endpoints: dict[str, "LoadResult"] = field(default_factory=dict)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def failures(self) -> int:
+        """Connection errors and error responses."""
+        return self.errors + sum(
+            count for status, count in self.statuses.items() if status >= 400
+        )
+
+    @property
+    def failure_rate(self) -> float:
+        attempts = self.requests + self.errors
+        return self.failures / attempts if attempts else 0.0
+
+    def record(self, name: str, status: int, latency: float) -> None:
+        for result in self._accounts(name):
+            result.requests += 1
+            result.latencies.append(latency)
+            result.statuses[status] = result.statuses.get(status, 0) + 1
+
+    def record_error(self, name: str) -> None:
+        for result in self._accounts(name):
+            result.errors += 1
+
+    def _accounts(self, name: str) -> list["LoadResult"]:
+        if not name:
+            return [self]
+        return [self, self.endpoints.setdefault(name, LoadResult())]
+
+    def percentile(self, percent: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the server")
+    status = int(status_line.split()[1])
+
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            body += await reader.readexactly(size)
+            await reader.readline()
+        await reader.readline()
+        return status, bytes(body)
+
+    return status, await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+def _encode(request: HTTPRequest, host: str) -> bytes:
+    lines = [f"{request.method} {request.path} HTTP/1.1", f"Host: {host}"]
+    lines += [f"{name}: {value}" for name, value in request.headers]
+    body = request.body or b""
+    if body or request.method in ("POST", "PUT", "PATCH"):
+        lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+async def run_load(
+    host: str,
+    port: int,
+    next_request: Callable[[int, Optional[bytes]], HTTPRequest],
+    users: int,
+    duration: float,
+) -> LoadResult:
+    """Runs `users` concurrent clients for `duration` seconds. `next_request`
+    gets the user number and the previous response body, if any."""
+    result = LoadResult()
+    deadline = time.perf_counter() + duration
+
+    async def user(number: int) -> None:
+        reader = writer = None
+        body = None
+        while time.perf_counter() < deadline:
+            request = next_request(number, body)
+            start = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                writer.write(_encode(request, f"{host}:{port}"))
+                status, body = await _read_response(reader)
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+                result.record_error(request.name)
+                if writer is not None:
+                    writer.close()
+                reader = writer = body = None
+                await asyncio.sleep(0.01)
+                continue
+
+            result.record(request.name, status, time.perf_counter() - start)
+
+        if writer is not None:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user(number) for number in range(users)))
+    result.elapsed = time.perf_counter() - start
+    for endpoint in result.endpoints.values():
+        endpoint.elapsed = result.elapsed
+    return result
+
+
+async def send(host: str, port: int, request: HTTPRequest) -> tuple[int, bytes]:
+    """Sends a single request on a new connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(_encode(request, f"{host}:{port}"))
+        return await _read_response(reader)
+    finally:
+        writer.close()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(command: list[str], port: int, env: dict, timeout: float = 30):
+    """Starts a server with `python -m <command>` and waits until it accepts
+    connections on the port."""
+    process = subprocess.Popen([sys.executable, "-m", *command], env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{command[0]} exited with {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"{command[0]} did not start within {timeout}s")
+
+
+def stop_server(process) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def json_body(data) -> bytes:
+    return json.dumps(data).encode()
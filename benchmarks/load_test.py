@@ -0,0 +1,284 @@
+"""Replays the request mix documented in api.http against a local server with
+concurrent users, and reports throughput, latency percentiles and error
+rates per endpoint.
+
+By default a server is started on a throwaway SQLite database and seeded with
+--reports reports through the bulk endpoint. With --port the load goes to a
+server that is already running on 127.0.0.1 instead.
+
+Deletes only remove reports created by the same user, and retrieves and
+updates only target seeded reports, so every error response is a failure.
+
+Usage:
+    python -m benchmarks.load_test --users 10 50 --duration 20
+    python -m benchmarks.load_test --server gunicorn --workers 4 \\
+        --mix list=30,search=10,retrieve=50,create=5,update=4,delete=1
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
+
+from benchmarks.load import (
+    HTTPRequest,
+    LoadResult,
+    free_port,
+    json_body,
+    run_load,
+    send,
+    start_server,
+    stop_server,
+)
+from src import config
+
+HOST = "127.0.0.1"
+JSON_HEADERS = (("Content-Type", "application/json"),)
+
+# Reads outnumber writes by about 20 to 1
+DEFAULT_MIX = (
+    "list=25,search=10,filter=5,order=5,paginate=5,retrieve=45,"
+    "create=2,update=2,delete=1"
+)
+
+SEARCH_TERMS = ("leak", "phishing", "password", "bank", "server", "malware")
+REPORT_TYPES = (
+    "DATA_LEAK",
+    "INAPPROPRIATE_PRACTICES",
+    "SUSPICIOUS_ACTIVITIES",
+    "OTHER",
+)
+REPORT_STATUSES = ("PENDING", "PROCESSING", "COMPLETED")
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in Scenario.requests:
+            raise argparse.ArgumentTypeError(
+                f"unknown request {name.strip()!r}, "
+                f"expected one of {', '.join(Scenario.requests)}"
+            )
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def report_data(rng: random.Random, number: int) -> dict:
+    return {
+        "title": f"Load test report {number}",
+        "complaint": " ".join(rng.choices(SEARCH_TERMS, k=20)),
+        "report_type": rng.choice(REPORT_TYPES),
+        "report_status": rng.choice(REPORT_STATUSES),
+        "name": f"User {number}",
+        "email": f"user{number}@example.com",
+    }
+
+
+class Scenario:
+    """Picks the next request of every user from the weighted mix."""
+
+    requests = (
+        "list",
+        "search",
+        "filter",
+        "order",
+        "paginate",
+        "retrieve",
+        "create",
+        "update",
+        "delete",
+    )
+
+    def __init__(self, mix: dict[str, float], ids: list[str], seed: int = 42):
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.ids = ids
+        self.rng = random.Random(seed)
+        # Reports created by each user, which only that user deletes
+        self.created: dict[int, list[str]] = {}
+        self.last: dict[int, str] = {}
+
+    def __call__(self, user: int, body: Optional[bytes]) -> HTTPRequest:
+        if self.last.get(user) == "create" and body:
+            try:
+                self.created.setdefault(user, []).append(json.loads(body)["id"])
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        name = self.rng.choices(self.names, self.weights)[0]
+        if name == "delete" and not self.created.get(user):
+            name = "create"
+        self.last[user] = name
+        return getattr(self, name)(user)
+
+    def list(self, user: int) -> HTTPRequest:
+        return HTTPRequest("GET", "/api/reports/", name="list")
+
+    def search(self, user: int) -> HTTPRequest:
+        query = urlencode({"search_query": self.rng.choice(SEARCH_TERMS)})
+        return HTTPRequest("GET", f"/api/reports/?{query}", name="search")
+
+    def filter(self, user: int) -> HTTPRequest:
+        query = urlencode(
+            {
+                "report_status": "PENDING,PROCESSING",
+                "report_type": self.rng.choice(REPORT_TYPES),
+            }
+        )
+        return HTTPRequest("GET", f"/api/reports/?{query}", name="filter")
+
+    def order(self, user: int) -> HTTPRequest:
+        order_by = self.rng.choice(("title", "-title", "report_status"))
+        return HTTPRequest("GET", f"/api/reports/?order_by={order_by}", name="order")
+
+    def paginate(self, user: int) -> HTTPRequest:
+        page = self.rng.randint(1, 10)
+        return HTTPRequest(
+            "GET", f"/api/reports/?per_page=20&current_page={page}", name="paginate"
+        )
+
+    def retrieve(self, user: int) -> HTTPRequest:
+        id = self.rng.choice(self.ids)
+        return HTTPRequest("GET", f"/api/reports/{id}/", name="retrieve")
+
+    def create(self, user: int) -> HTTPRequest:
+        return HTTPRequest(
+            "POST",
+            "/api/reports/",
+            json_body(report_data(self.rng, user)),
+            JSON_HEADERS,
+            name="create",
+        )
+
+    def update(self, user: int) -> HTTPRequest:
+        id = self.rng.choice(self.ids)
+        body = json_body({"report_status": self.rng.choice(REPORT_STATUSES)})
+        return HTTPRequest(
+            "PATCH", f"/api/reports/{id}/", body, JSON_HEADERS, name="update"
+        )
+
+    def delete(self, user: int) -> HTTPRequest:
+        id = self.created[user].pop()
+        return HTTPRequest("DELETE", f"/api/reports/{id}/", name="delete")
+
+
+async def seed(port: int, count: int) -> list[str]:
+    """Creates `count` reports through the bulk endpoint and returns their ids."""
+    rng = random.Random(0)
+    ids = []
+    for start in range(0, count, config.MAX_BULK_CREATE_SIZE):
+        reports = [
+            report_data(rng, number)
+            for number in range(start, min(count, start + config.MAX_BULK_CREATE_SIZE))
+        ]
+        status, body = await send(
+            HOST,
+            port,
+            HTTPRequest("POST", "/api/reports/bulk/", json_body(reports), JSON_HEADERS),
+        )
+        if status != 201:
+            raise RuntimeError(f"seeding failed with {status}: {body[:200]!r}")
+        ids += [result["id"] for result in json.loads(body)["data"]]
+    return ids
+
+
+def server_command(server: str, port: int, workers: int, threads: int) -> list:
+    if server == "gunicorn":
+        return [
+            "gunicorn",
+            "src.wsgi:application",
+            f"--bind={HOST}:{port}",
+            f"--workers={workers}",
+            f"--threads={threads}",
+            "--log-level=warning",
+        ]
+    if server == "uvicorn":
+        return [
+            "uvicorn",
+            "src.asgi:application",
+            f"--host={HOST}",
+            f"--port={port}",
+            f"--workers={workers}",
+            "--log-level=warning",
+            "--no-access-log",
+        ]
+    # Django's development server, always available but single process
+    return ["django", "runserver", f"{HOST}:{port}", "--noreload", "--skip-checks"]
+
+
+def report(users: int, result: LoadResult) -> None:
+    print(f"\n{users} users, {result.elapsed:.1f}s")
+    print(
+        f"{'endpoint':<10}{'requests':>10}{'req/s':>9}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}"
+    )
+    rows = sorted(result.endpoints.items())
+    for name, endpoint in [*rows, ("total", result)]:
+        print(
+            f"{name:<10}{endpoint.requests:>10,}{endpoint.requests_per_second:>9.1f}"
+            f"{endpoint.percentile(50) * 1000:>9.1f}"
+            f"{endpoint.percentile(95) * 1000:>9.1f}"
+            f"{endpoint.percentile(99) * 1000:>9.1f}"
+            f"{endpoint.failure_rate:>9.2%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--reports", type=int, default=2000)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument(
+        "--server", choices=("runserver", "gunicorn", "uvicorn"), default="runserver"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--port", type=int, help="load a server already running on this port"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    process = None
+    directory = tempfile.TemporaryDirectory()
+    try:
+        port = args.port
+        if port is None:
+            module = "django" if args.server == "runserver" else args.server
+            if importlib.util.find_spec(module) is None:
+                parser.error(f"{args.server} is not installed")
+
+            from benchmarks.bench_async_views import prepare_database
+
+            # Migrates the database, the server then runs on the same file
+            prepare_database(Path(directory.name) / "load.sqlite3", 0)
+            port = free_port()
+            process = start_server(
+                server_command(args.server, port, args.workers, args.threads),
+                port,
+                dict(os.environ),
+            )
+
+        ids = asyncio.run(seed(port, args.reports))
+        print(f"seeded {len(ids):,} reports, mix {args.mix}")
+
+        for users in args.users:
+            scenario = Scenario(args.mix, ids, args.seed)
+            result = asyncio.run(run_load(HOST, port, scenario, users, args.duration))
+            report(users, result)
+    finally:
+        if process is not None:
+            stop_server(process)
+        directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Settings for benchmarks that serve the app from separate server processes,
+on the throwaway database named by BENCHMARK_DATABASE."""
+
+import os
+
+from src.settings import *  # noqa: F401, F403
+from src.settings import DATABASES
+
+DEBUG = False
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+DATABASES = {
+    "default": {
+        **DATABASES["default"],
+        "NAME": os.environ.get("BENCHMARK_DATABASE", ":memory:"),
+    }
+}
+
+# Measure the database round trips rather than the report cache
+REPORT_CACHE_ALIAS = None
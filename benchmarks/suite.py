@@ -0,0 +1,336 @@
+"""Runs the benchmark suite over the domain, every use case on both
+repositories and the HTTP layer, at several dataset sizes.
+
+Results are printed and can be written as JSON with --output. With
+--baseline the run is compared against a saved JSON result, and the command
+exits with status 1 when a benchmark is slower than the baseline by more
+than --threshold.
+
+Usage:
+    python -m benchmarks.suite --sizes 100 10000 --output baseline.json
+    python -m benchmarks.suite --sizes 100 10000 --baseline baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, Optional
+
+import django
+
+os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from benchmarks.bench_hydration import make_models  # noqa: E402
+from benchmarks.bench_list_rendering import populate  # noqa: E402
+from src.report.application.use_cases.create_report import (  # noqa: E402
+    CreateReport,
+    CreateReportRequest,
+)
+from src.report.application.use_cases.delete_report import (  # noqa: E402
+    DeleteReport,
+    DeleteReportRequest,
+)
+from src.report.application.use_cases.get_report import (  # noqa: E402
+    GetReport,
+    GetReportRequest,
+)
+from src.report.application.use_cases.list_report import (  # noqa: E402
+    ListReport,
+    ListReportRequest,
+)
+from src.report.application.use_cases.update_report import (  # noqa: E402
+    UpdateReport,
+    UpdateReportRequest,
+)
+from src.report.domain.report import Report  # noqa: E402
+from src.report.domain.value_objects import (  # noqa: E402
+    Email,
+    ReportStatus,
+    ReportType,
+)
+from src.report.infrastructure.in_memory_report_repository import (  # noqa: E402
+    InMemoryReportRepository,
+)
+from src.report.models import ReportModel  # noqa: E402
+from src.report.repository import (  # noqa: E402
+    DjangoORMReportRepository,
+    ReportModelMapper,
+)
+
+REPORT = {
+    "title": "Exposed customer database",
+    "complaint": "A backup of the customer database is publicly accessible.",
+    "report_type": ReportType.DATA_LEAK,
+    "name": "Benchmark",
+    "email": "benchmark@example.com",
+    "report_status": ReportStatus.PENDING,
+}
+
+# Fraction by which a benchmark may be slower than the baseline
+DEFAULT_THRESHOLD = 0.1
+
+
+def measure(
+    operation: Callable[[], object],
+    number: int,
+    repeat: int,
+    prepare: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """Times `number` calls of `operation`, `repeat` times, with the garbage
+    collector off as timeit does. `prepare` runs untimed before each round."""
+    timings = []
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare(number)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                operation()
+            timings.append((time.perf_counter() - start) / number)
+        finally:
+            gc.enable()
+
+    return {
+        "median_us": statistics.median(timings) * 1e6,
+        "min_us": min(timings) * 1e6,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def domain_benchmarks() -> dict[str, Callable]:
+    addresses = cycle(Email(f"user{index}@example.com") for index in range(1000))
+    models = cycle(make_models(1000))
+    return {
+        "domain/report_construction": lambda: Report(**REPORT),
+        "domain/email_validate": lambda: next(addresses).validate(),
+        "domain/model_mapper_to_entity": lambda: ReportModelMapper.to_entity(
+            next(models)
+        ),
+    }
+
+
+def use_case_benchmarks(repository) -> list[tuple[str, Callable, Optional[Callable]]]:
+    ids = cycle(report.id for report in repository.list(per_page=1000, current_page=1))
+    victims = []
+
+    def prepare_delete(number: int) -> None:
+        reports = [Report(**REPORT) for _ in range(number)]
+        repository.save_many(reports)
+        victims.extend(report.id for report in reports)
+
+    return [
+        (
+            "GetReport",
+            lambda: GetReport(repository).execute(GetReportRequest(id=next(ids))),
+            None,
+        ),
+        (
+            "ListReport",
+            lambda: ListReport(repository).execute(ListReportRequest(order_by="title")),
+            None,
+        ),
+        (
+            "UpdateReport",
+            lambda: UpdateReport(repository).execute(
+                UpdateReportRequest(id=next(ids), report_status=ReportStatus.COMPLETED)
+            ),
+            None,
+        ),
+        (
+            "CreateReport",
+            lambda: CreateReport(repository).execute(CreateReportRequest(**REPORT)),
+            None,
+        ),
+        (
+            "DeleteReport",
+            lambda: DeleteReport(repository).execute(
+                DeleteReportRequest(id=victims.pop())
+            ),
+            prepare_delete,
+        ),
+    ]
+
+
+def http_benchmarks() -> list[tuple[str, Callable, Optional[Callable]]]:
+    client = Client()
+    ids = cycle(ReportModel.objects.values_list("id", flat=True)[:1000])
+    victims = []
+    body = {**REPORT, "report_type": "DATA_LEAK", "report_status": "PENDING"}
+
+    def expect(response, status: int):
+        if response.status_code != status:
+            raise RuntimeError(
+                f"{response.request['REQUEST_METHOD']} {response.request['PATH_INFO']}"
+                f" returned {response.status_code}, expected {status}"
+            )
+
+    def prepare_delete(number: int) -> None:
+        models = make_models(number)
+        ReportModel.objects.bulk_create(models)
+        victims.extend(model.id for model in models)
+
+    return [
+        ("list", lambda: expect(client.get("/api/reports/"), 200), None),
+        (
+            "retrieve",
+            lambda: expect(client.get(f"/api/reports/{next(ids)}/"), 200),
+            None,
+        ),
+        (
+            "update",
+            lambda: expect(
+                client.put(
+                    f"/api/reports/{next(ids)}/",
+                    body,
+                    content_type="application/json",
+                ),
+                204,
+            ),
+            None,
+        ),
+        (
+            "create",
+            lambda: expect(
+                client.post("/api/reports/", body, content_type="application/json"),
+                201,
+            ),
+            None,
+        ),
+        (
+            "delete",
+            lambda: expect(client.delete(f"/api/reports/{victims.pop()}/"), 204),
+            prepare_delete,
+        ),
+    ]
+
+
+def in_memory_repository(size: int) -> InMemoryReportRepository:
+    return InMemoryReportRepository(
+        [ReportModelMapper.to_entity(model) for model in make_models(size, seed=size)]
+    )
+
+
+def django_repository(size: int) -> DjangoORMReportRepository:
+    ReportModel.objects.all().delete()
+    populate(size)
+    return DjangoORMReportRepository()
+
+
+def run(sizes: list[int], number: int, repeat: int, only: Optional[str]) -> dict:
+    results = {}
+
+    def record(name: str, operation: Callable, prepare=None) -> None:
+        if only and only not in name:
+            return
+        results[name] = measure(operation, number, repeat, prepare)
+        print(
+            f"{name:<48}{results[name]['median_us']:>12.1f}"
+            f"{results[name]['min_us']:>12.1f}",
+            flush=True,
+        )
+
+    print(f"{'benchmark':<48}{'median µs':>12}{'min µs':>12}")
+    for name, operation in domain_benchmarks().items():
+        record(name, operation)
+
+    for size in sizes:
+        for backend, factory in (
+            ("in_memory", in_memory_repository),
+            ("django", django_repository),
+        ):
+            repository = factory(size)
+            for name, operation, prepare in use_case_benchmarks(repository):
+                record(f"use_case/{name}/{backend}/{size}", operation, prepare)
+
+        # The HTTP layer runs on the Django repository, still populated
+        for name, operation, prepare in http_benchmarks():
+            record(f"http/{name}/{size}", operation, prepare)
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Prints how every benchmark changed against the baseline and returns
+    the ones that got slower by more than the threshold. The fastest rounds
+    are compared, they are the least affected by noise on the machine."""
+    regressions = []
+    print(f"\n{'benchmark':<48}{'baseline µs':>12}{'current µs':>12}{'change':>9}")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<48}{'-':>12}{result['min_us']:>12.1f}{'new':>9}")
+            continue
+
+        change = result["min_us"] / previous["min_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  slower"
+        print(
+            f"{name:<48}{previous['min_us']:>12.1f}{result['min_us']:>12.1f}"
+            f"{change:>+9.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="run the benchmarks whose name contains it")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline is not None:
+        if not args.baseline.exists():
+            parser.error(f"baseline {args.baseline} does not exist")
+        baseline = json.loads(args.baseline.read_text())["benchmarks"]
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        results = run(args.sizes, args.number, args.repeat, args.only)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    if args.output is not None:
+        document = {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "platform": platform.platform(),
+                "sizes": args.sizes,
+            },
+            "benchmarks": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            sys.exit(f"\nSlower than the baseline: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import os
 
 import django
+import pytest
 from django.conf import settings
 
 # Set the default Django settings module
@@ -14,7 +15,12 @@ def pytest_configure():
             "default": {
                 "ENGINE": "django.db.backends.sqlite3",
                 "NAME": ":memory:",
-            }
+            },
+            # Separate database for the read replica routing tests
+            "replica": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+            },
         },
         INSTALLED_APPS=[
             "django.contrib.contenttypes",
@@ -25,5 +31,22 @@ def pytest_configure():
         SECRET_KEY="test_secret_key",
         DEFAULT_AUTO_FIELD="django.db.models.BigAutoField",
         ROOT_URLCONF="src.urls",
+        REPORT_SEARCH_BACKEND="src.report.search.SQLiteFTS5SearchBackend",
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        },
+        REPORT_CACHE_ALIAS="default",
+        REPORT_CACHE_TIMEOUT=300,
+        REPORT_CACHE_MISSING_TIMEOUT=30,
+        REPORT_LIST_CACHE_TIMEOUT=60,
     )
     django.setup()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+
+    cache.clear()
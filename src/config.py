@@ -1,2 +1,5 @@
 DEFAULT_PAGINATION_SIZE = 10
 MAX_PAGINATION_SIZE = 50
+MAX_BULK_CREATE_SIZE = 5000
+BULK_CREATE_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 2000
@@ -0,0 +1,445 @@
+"""Request, database and use case metrics in the Prometheus text format.
+
+Metrics live in the memory of each process, so every worker process serves
+its own values at /metrics and Prometheus is expected to scrape them all.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import AsyncIterable, Callable, Iterable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from src.report.cache import report_cache_stats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Label for requests that did not resolve to a view
+UNMATCHED = "unmatched"
+
+# Methods labelled as they are, any other method is labelled OTHER_METHOD so
+# that clients cannot create new series
+METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+OTHER_METHOD = "other"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple) -> str:
+    return ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _sample(name: str, labels: str, value) -> str:
+    return (
+        f"{name}{{{labels}}} {_format_value(value)}"
+        if labels
+        else f"{name} {_format_value(value)}"
+    )
+
+
+class _CounterChild:
+    __slots__ = ("labels", "value", "_lock")
+
+    def __init__(self, labels: str):
+        self.labels = labels
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str) -> Iterator[str]:
+        yield _sample(name, self.labels, self.value)
+
+
+class _HistogramChild:
+    __slots__ = ("labels", "buckets", "counts", "sum", "_lock")
+
+    def __init__(self, labels: str, buckets: tuple):
+        self.labels = labels
+        self.buckets = buckets
+        # One slot per bucket plus +Inf, allocated once per label set
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def samples(self, name: str) -> Iterator[str]:
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+
+        prefix = f"{self.labels}," if self.labels else ""
+        cumulative = 0
+        for bound, count in zip((*self.buckets, float("inf")), counts):
+            cumulative += count
+            yield _sample(
+                f"{name}_bucket", f'{prefix}le="{_format_value(bound)}"', cumulative
+            )
+        yield _sample(f"{name}_sum", self.labels, total)
+        yield _sample(f"{name}_count", self.labels, cumulative)
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        # Children are created on the first use of a label set and reused,
+        # observing only costs a dict lookup on the label values
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._child(_format_labels(self.labelnames, values))
+                    self._children[values] = child
+        return child
+
+    def _child(self, labels: str):
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+        for child in list(self._children.values()):
+            yield from child.samples(self.name)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _child(self, labels: str) -> _CounterChild:
+        return _CounterChild(labels)
+
+    def inc(self, amount=1) -> None:
+        self.labels().inc(amount)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _child(self, labels: str) -> _HistogramChild:
+        return _HistogramChild(labels, self.buckets)
+
+    def observe(self, value) -> None:
+        self.labels().observe(value)
+
+
+class FunctionMetric(Metric):
+    """Reports the value returned by `function` at every scrape."""
+
+    def __init__(self, name: str, documentation: str, type: str, function: Callable):
+        super().__init__(name, documentation)
+        self.type = type
+        self.function = function
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+        yield _sample(self.name, "", self.function())
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = [line for metric in self.metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time spent handling requests, by view and action.",
+        ("view", "action"),
+    )
+)
+REQUESTS = REGISTRY.register(
+    Counter(
+        "http_requests_total",
+        "Requests handled, by view, action and status code.",
+        ("view", "action", "status"),
+    )
+)
+REQUEST_QUERIES = REGISTRY.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL queries executed per request, by view and action.",
+        ("view", "action"),
+        QUERY_COUNT_BUCKETS,
+    )
+)
+REQUEST_QUERY_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_db_duration_seconds",
+        "Time spent in SQL queries per request, by view and action.",
+        ("view", "action"),
+    )
+)
+RESPONSE_SIZE = REGISTRY.register(
+    Histogram(
+        "http_response_size_bytes",
+        "Size of response bodies, by view and action.",
+        ("view", "action"),
+        SIZE_BUCKETS,
+    )
+)
+USE_CASE_DURATION = REGISTRY.register(
+    Histogram(
+        "use_case_duration_seconds",
+        "Time spent executing use cases, by use case.",
+        ("use_case",),
+    )
+)
+
+REGISTRY.register(
+    FunctionMetric(
+        "report_cache_hits_total",
+        "Report cache lookups answered from the cache.",
+        "counter",
+        lambda: report_cache_stats.hits,
+    )
+)
+REGISTRY.register(
+    FunctionMetric(
+        "report_cache_misses_total",
+        "Report cache lookups that queried the database.",
+        "counter",
+        lambda: report_cache_stats.misses,
+    )
+)
+
+
+def execute_use_case(use_case, *args, **kwargs):
+    start = time.perf_counter()
+    try:
+        return use_case.execute(*args, **kwargs)
+    finally:
+        USE_CASE_DURATION.labels(type(use_case).__name__).observe(
+            time.perf_counter() - start
+        )
+
+
+async def aexecute_use_case(use_case, *args, **kwargs):
+    start = time.perf_counter()
+    try:
+        return await use_case.execute(*args, **kwargs)
+    finally:
+        USE_CASE_DURATION.labels(type(use_case).__name__).observe(
+            time.perf_counter() - start
+        )
+
+
+class _QueryRecorder:
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+# Queries of the current request, the recorder is mutated rather than replaced
+# so that queries run in sync_to_async threads are recorded as well
+_queries: ContextVar[Optional[_QueryRecorder]] = ContextVar("queries", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    queries = _queries.get()
+    if queries is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        queries.count += 1
+        queries.duration += time.perf_counter() - start
+
+
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    """Wraps every query of the connection, connected to connection_created."""
+    if _record_query not in connection.execute_wrappers:
+        # First, so that popping a temporary execute_wrapper() leaves it be
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+def _route(request: HttpRequest) -> tuple[str, str]:
+    method = request.method if request.method in METHODS else OTHER_METHOD
+    match = request.resolver_match
+    if match is None:
+        return UNMATCHED, method
+    # DRF viewsets map methods to actions, plain views are labelled by method
+    actions = getattr(match.func, "actions", None)
+    action = actions.get(method.lower()) if actions else None
+    return match.view_name or UNMATCHED, action or method
+
+
+# Marks the end of a streamed body
+_END = object()
+
+
+def _streamed(content: Iterable[bytes], queries: _QueryRecorder, done: Callable):
+    # The request context is gone by the time the body is sent, so the recorder
+    # is set again around every chunk, queries run while streaming are recorded
+    iterator = iter(content)
+    size = 0
+    try:
+        while True:
+            token = _queries.set(queries)
+            try:
+                chunk = next(iterator, _END)
+            finally:
+                _queries.reset(token)
+            if chunk is _END:
+                return
+            size += len(chunk)
+            yield chunk
+    finally:
+        done(size)
+
+
+async def _astreamed(
+    content: AsyncIterable[bytes], queries: _QueryRecorder, done: Callable
+):
+    iterator = aiter(content)
+    size = 0
+    try:
+        while True:
+            token = _queries.set(queries)
+            try:
+                chunk = await anext(iterator, _END)
+            finally:
+                _queries.reset(token)
+            if chunk is _END:
+                return
+            size += len(chunk)
+            yield chunk
+    finally:
+        done(size)
+
+
+class MetricsMiddleware:
+    """Records latency, query count and time, and response size per request.
+    Should come first in MIDDLEWARE to time the other middleware as well."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        queries = _QueryRecorder()
+        token = _queries.set(queries)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _queries.reset(token)
+        self._record(request, response, start, queries)
+        return response
+
+    async def __acall__(self, request):
+        queries = _QueryRecorder()
+        token = _queries.set(queries)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _queries.reset(token)
+        self._record(request, response, start, queries)
+        return response
+
+    @staticmethod
+    def _record(
+        request: HttpRequest,
+        response: HttpResponse,
+        start: float,
+        queries: _QueryRecorder,
+    ) -> None:
+        view, action = _route(request)
+        REQUESTS.labels(view, action, response.status_code).inc()
+
+        def done(size: int) -> None:
+            REQUEST_DURATION.labels(view, action).observe(time.perf_counter() - start)
+            REQUEST_QUERIES.labels(view, action).observe(queries.count)
+            REQUEST_QUERY_DURATION.labels(view, action).observe(queries.duration)
+            RESPONSE_SIZE.labels(view, action).observe(size)
+
+        if not response.streaming:
+            done(len(response.content))
+        else:
+            # Streamed bodies are recorded once they have been sent or closed
+            streamed = _astreamed if response.is_async else _streamed
+            response.streaming_content = streamed(
+                response.streaming_content, queries, done
+            )
+
+
+def metrics_view(request: HttpRequest, registry: Optional[Registry] = None):
+    return HttpResponse((registry or REGISTRY).render(), content_type=CONTENT_TYPE)
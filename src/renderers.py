@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Renders JSON with orjson when it is installed, falling back to the
+    standard renderer otherwise and for indented output."""
+
+    # Datetimes and dataclasses are left to DRF's encoder so that they are
+    # rendered exactly as JSONRenderer would
+    options = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_NON_STR_KEYS
+        if orjson
+        else 0
+    )
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=self.encoder.default, option=self.options)
+
+
+def _batches(rows: Iterable, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renders newline delimited JSON, one object per line. Rows can be
+    streamed in batches with `stream`."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        return b"".join(self._line(item) for item in items)
+
+    def stream(
+        self, fields: Sequence[str], rows: Iterable[tuple], batch_size: int
+    ) -> Iterator[bytes]:
+        for batch in _batches(rows, batch_size):
+            yield b"".join(self._line(dict(zip(fields, row))) for row in batch)
+
+    def _line(self, item) -> bytes:
+        if orjson is None:
+            line = json.dumps(
+                item, default=self.encoder.default, ensure_ascii=False
+            ).encode()
+        else:
+            line = orjson.dumps(item, default=self.encoder.default)
+        return line + b"\n"
+
+
+class CSVRenderer(BaseRenderer):
+    """Renders CSV with a header row. Rows can be streamed in batches with
+    `stream`."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not data:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        fields = list(items[0])
+        rows = [[item.get(field) for field in fields] for item in items]
+        return b"".join(self.stream(fields, rows, len(rows)))
+
+    def stream(
+        self, fields: Sequence[str], rows: Iterable[tuple], batch_size: int
+    ) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        for batch in _batches(rows, batch_size):
+            writer.writerows(batch)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Only the header when there are no rows
+        if buffer.tell():
+            yield buffer.getvalue().encode()
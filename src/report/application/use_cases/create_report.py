@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.report.application.use_cases.exceptions import InvalidReport
+from src.report.domain.async_report_repository import AsyncReportRepository
 from src.report.domain.report import Report
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
@@ -22,22 +23,35 @@ class CreateReportResponse:
     id: UUID
 
 
+def _new_report(request: CreateReportRequest) -> Report:
+    try:
+        return Report(
+            title=request.title,
+            complaint=request.complaint,
+            report_type=request.report_type,
+            name=request.name,
+            email=request.email,
+            report_status=request.report_status,
+        )
+    except ValueError as err:
+        raise InvalidReport(err)
+
+
 class CreateReport:
     def __init__(self, repository: ReportRepository):
         self.repository = repository
 
     def execute(self, request: CreateReportRequest) -> CreateReportResponse:
-        try:
-            report = Report(
-                title=request.title,
-                complaint=request.complaint,
-                report_type=request.report_type,
-                name=request.name,
-                email=request.email,
-                report_status=request.report_status,
-            )
-        except ValueError as err:
-            raise InvalidReport(err)
-
+        report = _new_report(request)
         self.repository.save(report)
         return CreateReportResponse(id=report.id)
+
+
+class AsyncCreateReport:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
+
+    async def execute(self, request: CreateReportRequest) -> CreateReportResponse:
+        report = _new_report(request)
+        await self.repository.asave(report)
+        return CreateReportResponse(id=report.id)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src import config
+from src.report.application.use_cases.create_report import (
+    CreateReportRequest,
+    _new_report,
+)
+from src.report.application.use_cases.exceptions import InvalidReport
+from src.report.domain.report import Report
+from src.report.domain.report_repository import ReportRepository
+
+
+@dataclass
+class CreateReportsRequest:
+    reports: list[CreateReportRequest] = field(default_factory=list)
+
+
+@dataclass
+class CreateReportsResult:
+    id: UUID | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CreateReportsResponse:
+    results: list[CreateReportsResult] = field(default_factory=list)
+
+    @property
+    def created(self) -> int:
+        return sum(1 for result in self.results if result.id is not None)
+
+
+class CreateReports:
+    def __init__(self, repository: ReportRepository):
+        self.repository = repository
+
+    def execute(self, request: CreateReportsRequest) -> CreateReportsResponse:
+        if len(request.reports) > config.MAX_BULK_CREATE_SIZE:
+            raise InvalidReport(
+                f"cannot create more than {config.MAX_BULK_CREATE_SIZE} reports at once"
+            )
+
+        reports: list[Report] = []
+        results: list[CreateReportsResult] = []
+
+        for item in request.reports:
+            try:
+                report = _new_report(item)
+            except InvalidReport as err:
+                results.append(CreateReportsResult(errors=str(err).split(",")))
+                continue
+
+            reports.append(report)
+            results.append(CreateReportsResult(id=report.id))
+
+        if reports:
+            self.repository.save_many(reports)
+
+        return CreateReportsResponse(results=results)
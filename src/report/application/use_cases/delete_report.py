@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.report.application.use_cases.exceptions import ReportNotFound
+from src.report.domain.async_report_repository import AsyncReportRepository
 from src.report.domain.report_repository import ReportRepository
 
 
@@ -15,9 +16,14 @@ class DeleteReport:
         self.repository = repository
 
     def execute(self, request: DeleteReportRequest) -> None:
-        report = self.repository.get_by_id(request.id)
-
-        if report is None:
+        if not self.repository.delete(request.id):
             raise ReportNotFound(f"Report with {request.id} not found")
 
-        self.repository.delete(report.id)
+
+class AsyncDeleteReport:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
+
+    async def execute(self, request: DeleteReportRequest) -> None:
+        if not await self.repository.adelete(request.id):
+            raise ReportNotFound(f"Report with {request.id} not found")
@@ -4,3 +4,11 @@ class InvalidReport(Exception):
 
 class ReportNotFound(Exception):
     pass
+
+
+class InvalidListReportRequest(Exception):
+    pass
+
+
+class ConcurrentModification(Exception):
+    pass
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.report.application.use_cases.list_report import (
+    enum_members,
+    validate_order_by,
+)
+from src.report.domain.report_repository import EXPORT_FIELDS, ReportRepository
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+
+@dataclass
+class ExportReportsRequest:
+    order_by: str = "title"
+    search_query: str | None = None
+    report_status: list[ReportStatus | str] | None = None
+    report_type: list[ReportType | str] | None = None
+
+
+@dataclass
+class ExportReportsResponse:
+    fields: tuple[str, ...]
+    # Lazily fetched rows of values in the order of fields
+    rows: Iterator[tuple]
+
+
+class ExportReports:
+    """Exports every report matching the list filters, as rows streamed
+    from the repository rather than pages of entities."""
+
+    def __init__(self, repository: ReportRepository) -> None:
+        self.repository = repository
+
+    def execute(self, request: ExportReportsRequest) -> ExportReportsResponse:
+        validate_order_by(request.order_by)
+
+        rows = self.repository.export(
+            request.order_by,
+            request.search_query,
+            report_status=enum_members(ReportStatus, request.report_status),
+            report_type=enum_members(ReportType, request.report_type),
+        )
+        return ExportReportsResponse(fields=EXPORT_FIELDS, rows=rows)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from src.report.application.use_cases.exceptions import ReportNotFound
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.report import ReportVersion
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
@@ -20,6 +23,42 @@ class GetReportResponse:
     name: str
     email: str
     report_status: ReportStatus
+    version: int = 1
+    updated_at: datetime | None = None
+
+
+@dataclass
+class GetReportVersionResponse:
+    id: UUID
+    version: int
+    updated_at: datetime | None = None
+
+
+def _get_report_response(report) -> GetReportResponse:
+    return GetReportResponse(
+        id=report.id,
+        name=report.name,
+        email=report.email,
+        title=report.title,
+        complaint=report.complaint,
+        report_type=report.report_type,
+        report_status=report.report_status,
+        version=report.version,
+        updated_at=report.updated_at,
+    )
+
+
+def _version_response(
+    request: GetReportRequest, version: ReportVersion | None
+) -> GetReportVersionResponse:
+    if version is None:
+        raise ReportNotFound(f"Report with {request.id} not found")
+
+    return GetReportVersionResponse(
+        id=version.id,
+        version=version.version,
+        updated_at=version.updated_at,
+    )
 
 
 class GetReport:
@@ -32,12 +71,38 @@ class GetReport:
         if report is None:
             raise ReportNotFound(f"Report with {request.id} not found")
 
-        return GetReportResponse(
-            id=report.id,
-            name=report.name,
-            email=report.email,
-            title=report.title,
-            complaint=report.complaint,
-            report_type=report.report_type,
-            report_status=report.report_status,
+        return _get_report_response(report)
+
+
+class GetReportVersion:
+    """Looks up only the version of a report, enough to answer conditional
+    requests without fetching the whole report."""
+
+    def __init__(self, repository: ReportRepository):
+        self.repository = repository
+
+    def execute(self, request: GetReportRequest) -> GetReportVersionResponse:
+        return _version_response(request, self.repository.get_version(request.id))
+
+
+class AsyncGetReport:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
+
+    async def execute(self, request: GetReportRequest) -> GetReportResponse:
+        report = await self.repository.aget_by_id(request.id)
+
+        if report is None:
+            raise ReportNotFound(f"Report with {request.id} not found")
+
+        return _get_report_response(report)
+
+
+class AsyncGetReportVersion:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
+
+    async def execute(self, request: GetReportRequest) -> GetReportVersionResponse:
+        return _version_response(
+            request, await self.repository.aget_version(request.id)
         )
@@ -1,12 +1,19 @@
 from abc import ABC
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Generic, TypeVar
 from uuid import UUID
 
 from src import config
-from src.report.domain.report_repository import ReportRepository
+from src.report.application.use_cases.exceptions import InvalidListReportRequest
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.cursor import Cursor
+from src.report.domain.report_repository import ORDER_BY_RELEVANCE, ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
+# Fields reports can be ordered by, each backed by an index in the repositories
+SORTABLE_FIELDS = ("title", "report_type", "report_status", "email")
+
 
 @dataclass
 class ReportOutput:
@@ -17,6 +24,8 @@ class ReportOutput:
     name: str
     email: str
     report_status: ReportStatus
+    version: int = 1
+    updated_at: datetime | None = None
 
 
 @dataclass
@@ -25,13 +34,20 @@ class ListReportRequest:
     current_page: int = 1
     per_page: int = config.DEFAULT_PAGINATION_SIZE
     search_query: str | None = None
+    cursor: str | None = None
+    report_status: list[ReportStatus | str] | None = None
+    report_type: list[ReportType | str] | None = None
+    # Cursor pages skip the COUNT(*) for the total unless it is asked for
+    include_total: bool = False
 
 
 @dataclass
 class ListOutputMeta:
     current_page: int = 1
     per_page: int = config.DEFAULT_PAGINATION_SIZE
-    total: int = 0
+    # None for cursor pages listed without their total
+    total: int | None = 0
+    next_cursor: str | None = None
 
 
 T = TypeVar("T")
@@ -48,23 +64,124 @@ class ListReportResponse(ListOutput[ReportOutput]):
     pass
 
 
-class ListReport:
-    def __init__(self, repository: ReportRepository) -> None:
-        self.repository = repository
+def validate_order_by(order_by: str) -> None:
+    if order_by != ORDER_BY_RELEVANCE and order_by.lstrip("-") not in SORTABLE_FIELDS:
+        raise InvalidListReportRequest(
+            f"order_by must be one of {', '.join(SORTABLE_FIELDS)} "
+            f"or {ORDER_BY_RELEVANCE}"
+        )
 
-    def execute(self, request: ListReportRequest) -> ListReportResponse:
+
+def enum_members(enum_class, values) -> list | None:
+    if not values:
+        return None
+
+    members = []
+    for value in values:
+        errors = enum_class.validate(value)
+        if errors:
+            raise InvalidListReportRequest(",".join(errors))
+        members.append(value if isinstance(value, enum_class) else enum_class[value])
+    return members
+
+
+class _ListReportPages:
+    """Validation and paging shared by ListReport and AsyncListReport."""
+
+    def _prepare(self, request: ListReportRequest) -> Cursor | None:
+        # Validates the request and decodes its cursor, if any
         if request.per_page > config.MAX_PAGINATION_SIZE:
             request.per_page = config.MAX_PAGINATION_SIZE
 
-        reports = self.repository.list(
+        validate_order_by(request.order_by)
+        request.report_status = enum_members(ReportStatus, request.report_status)
+        request.report_type = enum_members(ReportType, request.report_type)
+
+        if not request.cursor:
+            return None
+
+        try:
+            cursor = Cursor.decode(request.cursor)
+        except ValueError as error:
+            raise InvalidListReportRequest(error)
+
+        if cursor.order_by != request.order_by:
+            raise InvalidListReportRequest("cursor does not match order_by")
+
+        if cursor.order_by == ORDER_BY_RELEVANCE:
+            raise InvalidListReportRequest("cursor cannot be used with relevance order")
+
+        return cursor
+
+    # The repository methods are passed in so that the async use case can
+    # share the arguments, the calls then return coroutines
+
+    @staticmethod
+    def _list(list_reports, request: ListReportRequest, cursor: Cursor | None):
+        if cursor is None:
+            return list_reports(
+                request.order_by,
+                request.current_page,
+                request.per_page,
+                request.search_query,
+                report_status=request.report_status,
+                report_type=request.report_type,
+            )
+
+        # Fetch one extra report to know whether there is a next page
+        return list_reports(
             request.order_by,
-            request.current_page,
-            request.per_page,
+            None,
+            request.per_page + 1,
+            request.search_query,
+            cursor=cursor,
+            report_status=request.report_status,
+            report_type=request.report_type,
+        )
+
+    @staticmethod
+    def _counts(request: ListReportRequest, cursor: Cursor | None) -> bool:
+        # Offset pages need the total to know whether there is a next page
+        return cursor is None or request.include_total
+
+    @staticmethod
+    def _count(count_reports, request: ListReportRequest):
+        return count_reports(
             request.search_query,
+            report_status=request.report_status,
+            report_type=request.report_type,
         )
 
+    def _page(
+        self,
+        request: ListReportRequest,
+        cursor: Cursor | None,
+        reports,
+        total: int | None,
+    ) -> ListReportResponse:
+        if cursor is not None:
+            return self._build_response(
+                request,
+                reports[: request.per_page],
+                total=total,
+                has_next=len(reports) > request.per_page,
+            )
+
         page_offset = (request.current_page - 1) * request.per_page
-        reports_page = reports[page_offset : page_offset + request.per_page]
+        has_next = page_offset + len(reports) < total
+        return self._build_response(request, reports, total=total, has_next=has_next)
+
+    def _build_response(
+        self,
+        request: ListReportRequest,
+        reports_page,
+        total: int | None,
+        has_next: bool,
+    ) -> ListReportResponse:
+        next_cursor = None
+        keyset_ordered = request.order_by and request.order_by != ORDER_BY_RELEVANCE
+        if has_next and reports_page and keyset_ordered:
+            next_cursor = Cursor.for_report(reports_page[-1], request.order_by).encode()
 
         return ListReportResponse(
             [
@@ -76,12 +193,41 @@ class ListReport:
                     complaint=report.complaint,
                     report_type=report.report_type,
                     report_status=report.report_status,
+                    version=report.version,
+                    updated_at=report.updated_at,
                 )
                 for report in reports_page
             ],
             meta=ListOutputMeta(
                 current_page=request.current_page,
                 per_page=request.per_page,
-                total=len(reports),
+                total=total,
+                next_cursor=next_cursor,
             ),
         )
+
+
+class ListReport(_ListReportPages):
+    def __init__(self, repository: ReportRepository) -> None:
+        self.repository = repository
+
+    def execute(self, request: ListReportRequest) -> ListReportResponse:
+        cursor = self._prepare(request)
+        reports = self._list(self.repository.list, request, cursor)
+        total = None
+        if self._counts(request, cursor):
+            total = self._count(self.repository.count, request)
+        return self._page(request, cursor, reports, total)
+
+
+class AsyncListReport(_ListReportPages):
+    def __init__(self, repository: AsyncReportRepository) -> None:
+        self.repository = repository
+
+    async def execute(self, request: ListReportRequest) -> ListReportResponse:
+        cursor = self._prepare(request)
+        reports = await self._list(self.repository.alist, request, cursor)
+        total = None
+        if self._counts(request, cursor):
+            total = await self._count(self.repository.acount, request)
+        return self._page(request, cursor, reports, total)
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.report.application.use_cases.exceptions import InvalidReport, ReportNotFound
+from src.report.application.use_cases.exceptions import (
+    ConcurrentModification,
+    InvalidReport,
+    ReportNotFound,
+)
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.report import UPDATABLE_FIELDS, Report, ReportVersion
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
@@ -15,54 +21,183 @@ class UpdateReportRequest:
     name: str | None = None
     email: str | None = None
     report_status: ReportStatus | None = None
+    # Version the client based its changes on, the update fails if it is stale
+    version: int | None = None
+
+
+@dataclass
+class UpdateReportResponse:
+    id: UUID
+    version: int | None = None
+
+
+def _concurrent_modification(id: UUID, expected: int, found: int):
+    return ConcurrentModification(
+        f"Report with {id} was modified, expected version {expected} "
+        f"but found {found}"
+    )
+
+
+def _raise_update_failed(id: UUID, expected: int, current: ReportVersion | None):
+    # A conditional update affects no row if the report is gone or has changed
+    if current is None:
+        raise ReportNotFound(f"Report with {id} not found")
+    raise _concurrent_modification(id, expected, current.version)
+
+
+def _apply_update(report: Report | None, request: UpdateReportRequest) -> int:
+    """Applies the request to the loaded report and returns the version it was
+    loaded at."""
+    if report is None:
+        raise ReportNotFound(f"Report with {request.id} not found")
+
+    if request.version is not None and request.version != report.version:
+        raise _concurrent_modification(request.id, request.version, report.version)
+    loaded_version = report.version
+
+    try:
+        current_title = report.title
+        current_complaint = report.complaint
+        current_report_type = report.report_type
+        current_report_status = report.report_status
+        current_name = report.name
+        current_email = report.email
+
+        if request.title is not None:
+            current_title = request.title
+
+        if request.complaint is not None:
+            current_complaint = request.complaint
+
+        if request.report_type is not None:
+            current_report_type = request.report_type
+
+        if request.report_status is not None:
+            current_report_status = request.report_status
+
+        if request.name is not None:
+            current_name = request.name
+
+        if request.email is not None:
+            current_email = request.email
+
+        report.update_report(
+            title=current_title,
+            complaint=current_complaint,
+            report_type=current_report_type,
+            report_status=current_report_status,
+            name=current_name,
+            email=current_email,
+        )
+
+    except ValueError as error:
+        raise InvalidReport(error)
+
+    return loaded_version
 
 
 class UpdateReport:
     def __init__(self, repository: ReportRepository):
         self.repository = repository
 
-    def execute(self, request: UpdateReportRequest) -> None:
+    def execute(self, request: UpdateReportRequest) -> UpdateReportResponse:
         report = self.repository.get_by_id(request.id)
+        loaded_version = _apply_update(report, request)
+
+        # The update only applies if nobody changed the report since it was read
+        if not self.repository.update(report):
+            _raise_update_failed(
+                request.id, loaded_version, self.repository.get_version(request.id)
+            )
+
+        return UpdateReportResponse(id=report.id, version=report.version)
+
+
+class AsyncUpdateReport:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
+
+    async def execute(self, request: UpdateReportRequest) -> UpdateReportResponse:
+        report = await self.repository.aget_by_id(request.id)
+        loaded_version = _apply_update(report, request)
+
+        if not await self.repository.aupdate(report):
+            _raise_update_failed(
+                request.id,
+                loaded_version,
+                await self.repository.aget_version(request.id),
+            )
 
-        if report is None:
-            raise ReportNotFound(f"Report with {request.id} not found")
+        return UpdateReportResponse(id=report.id, version=report.version)
 
-        try:
-            current_title = report.title
-            current_complaint = report.complaint
-            current_report_type = report.report_type
-            current_report_status = report.report_status
-            current_name = report.name
-            current_email = report.email
 
-            if request.title is not None:
-                current_title = request.title
+class PartialUpdateReport:
+    """Writes the requested fields in a single query, without loading the
+    report first. A missing report is detected from the affected rows."""
 
-            if request.complaint is not None:
-                current_complaint = request.complaint
+    def __init__(self, repository: ReportRepository):
+        self.repository = repository
+
+    def execute(self, request: UpdateReportRequest) -> UpdateReportResponse:
+        changes = _validated_changes(request)
 
-            if request.report_type is not None:
-                current_report_type = request.report_type
+        if request.version is None:
+            if not self.repository.update_fields(request.id, changes):
+                raise ReportNotFound(f"Report with {request.id} not found")
+            return UpdateReportResponse(id=request.id)
+
+        if not self.repository.update_fields(
+            request.id, changes, version=request.version
+        ):
+            _raise_update_failed(
+                request.id, request.version, self.repository.get_version(request.id)
+            )
 
-            if request.report_status is not None:
-                current_report_status = request.report_status
+        return _partial_update_response(request, changes)
 
-            if request.name is not None:
-                current_name = request.name
 
-            if request.email is not None:
-                current_email = request.email
+class AsyncPartialUpdateReport:
+    def __init__(self, repository: AsyncReportRepository):
+        self.repository = repository
 
-            report.update_report(
-                title=current_title,
-                complaint=current_complaint,
-                report_type=current_report_type,
-                report_status=current_report_status,
-                name=current_name,
-                email=current_email,
+    async def execute(self, request: UpdateReportRequest) -> UpdateReportResponse:
+        changes = _validated_changes(request)
+
+        if request.version is None:
+            if not await self.repository.aupdate_fields(request.id, changes):
+                raise ReportNotFound(f"Report with {request.id} not found")
+            return UpdateReportResponse(id=request.id)
+
+        if not await self.repository.aupdate_fields(
+            request.id, changes, version=request.version
+        ):
+            _raise_update_failed(
+                request.id,
+                request.version,
+                await self.repository.aget_version(request.id),
             )
 
-        except ValueError as error:
-            raise InvalidReport(error)
+        return _partial_update_response(request, changes)
+
+
+def _validated_changes(request: UpdateReportRequest) -> dict:
+    changes = {
+        name: getattr(request, name)
+        for name in UPDATABLE_FIELDS
+        if getattr(request, name) is not None
+    }
+
+    try:
+        Report.validate_changes(changes)
+    except ValueError as error:
+        raise InvalidReport(error)
+    return changes
+
 
-        self.repository.update(report)
+def _partial_update_response(
+    request: UpdateReportRequest, changes: dict
+) -> UpdateReportResponse:
+    return UpdateReportResponse(
+        id=request.id,
+        version=request.version + 1 if changes else request.version,
+    )
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
 
 
 class ReportConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.report"
+
+    def ready(self):
+        from src.metrics import install_query_recorder
+        from src.report.sqlite import apply_sqlite_profile, optimize_sqlite_connections
+
+        connection_created.connect(install_query_recorder)
+        connection_created.connect(apply_sqlite_profile)
+        request_finished.connect(optimize_sqlite_connections)
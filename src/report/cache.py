@@ -0,0 +1,459 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+from uuid import UUID
+
+from django.core.cache import BaseCache
+
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.cursor import Cursor
+from src.report.domain.report import Report, ReportVersion
+from src.report.domain.report_repository import ReportRepository
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+KEY_PREFIX = "report:v2"
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+# Present while replicas may not have the last write yet, see replication_lag
+WRITTEN_KEY = f"{KEY_PREFIX}:written"
+
+# Cached in place of a report to remember that an id does not exist
+MISSING = "missing"
+
+# Left in place of a report for INVALIDATION_TIMEOUT seconds after it was
+# changed. Reads only fill the cache with add(), so a read that started before
+# the write cannot store the row it loaded over the newer state.
+INVALIDATED = "invalidated"
+INVALIDATION_TIMEOUT = 2
+
+# How long a worker may hold the lock while loading a list page, and how
+# often the other workers check whether the page was cached meanwhile
+LOAD_LOCK_TIMEOUT = 5
+LOAD_WAIT_INTERVAL = 0.05
+
+# Striped locks collapsing concurrent misses of the same key in this process
+_load_locks = [threading.Lock() for _ in range(64)]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# Shared by every repository instance, views build one per request
+report_cache_stats = CacheStats()
+
+
+class CachedReportRepository(ReportRepository, AsyncReportRepository):
+    """Read-through cache in front of another repository. Reports are cached
+    by id and invalidated one by one, list pages and counts are keyed on a
+    generation that every write through the repository bumps. The async
+    methods need a repository implementing AsyncReportRepository.
+
+    Misses may be loaded from replicas lagging up to `replication_lag` seconds
+    behind the primary. Reads do not fill the cache for that long after a
+    write, so that they cannot cache what the write replaced."""
+
+    def __init__(
+        self,
+        repository: ReportRepository,
+        cache: BaseCache,
+        timeout: Optional[int] = None,
+        missing_timeout: Optional[int] = None,
+        list_timeout: Optional[int] = None,
+        stats: Optional[CacheStats] = None,
+        replication_lag: int = 0,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.timeout = timeout
+        self.missing_timeout = missing_timeout
+        self.list_timeout = list_timeout
+        self.stats = stats or report_cache_stats
+        self.replication_lag = replication_lag
+
+    def save(self, report: Report) -> None:
+        self.repository.save(report)
+        self._forget([report.id])
+        self._bump_generation()
+
+    def save_many(self, reports: List[Report]) -> None:
+        self.repository.save_many(reports)
+        self._forget([report.id for report in reports])
+        self._bump_generation()
+
+    def get_by_id(self, id: UUID) -> Report | None:
+        key = self._key(id)
+        cached = self.cache.get(key)
+        if cached is not None and cached != INVALIDATED:
+            self.stats.hits += 1
+            return None if cached == MISSING else _from_cache(cached)
+
+        self.stats.misses += 1
+        report = self.repository.get_by_id(id)
+        entry = self._entry(report)
+        if cached != INVALIDATED and entry is not None:
+            self.cache.add(key, *entry)
+        return report
+
+    def get_version(self, id: UUID) -> ReportVersion | None:
+        # A cached report is as recent as its version, writes invalidate it
+        cached = self.cache.get(self._key(id))
+        if cached is None or cached == INVALIDATED:
+            return self.repository.get_version(id)
+        if cached == MISSING:
+            return None
+        report = _from_cache(cached)
+        return ReportVersion(report.id, report.version, report.updated_at)
+
+    def delete(self, id: UUID) -> bool:
+        deleted = self.repository.delete(id)
+        self._invalidate(id)
+        if deleted:
+            self._bump_generation()
+        return deleted
+
+    def list(
+        self,
+        order_by: Optional[str] = None,
+        current_page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> List[Report]:
+        def load() -> List[Report]:
+            return self.repository.list(
+                order_by,
+                current_page,
+                per_page,
+                search_query,
+                cursor=cursor,
+                report_status=report_status,
+                report_type=report_type,
+            )
+
+        if not self.list_timeout:
+            return load()
+
+        key = self._query_key(
+            "list",
+            order_by,
+            current_page,
+            per_page,
+            search_query,
+            cursor.encode() if cursor else None,
+            _names(report_status),
+            _names(report_type),
+        )
+        cached = self._get_or_load(
+            key, lambda: [_to_cache(report) for report in load()]
+        )
+        return [_from_cache(values) for values in cached]
+
+    def export(
+        self,
+        order_by: Optional[str] = None,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> Iterator[tuple]:
+        # Exports stream the whole table, they are never cached
+        return self.repository.export(
+            order_by, search_query, report_status=report_status, report_type=report_type
+        )
+
+    def count(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        def load() -> int:
+            return self.repository.count(
+                search_query, report_status=report_status, report_type=report_type
+            )
+
+        if not self.list_timeout:
+            return load()
+
+        key = self._query_key(
+            "count", search_query, _names(report_status), _names(report_type)
+        )
+        return self._get_or_load(key, load)
+
+    def update(self, report: Report) -> bool:
+        unchanged = report.tracks_changes and not report.changes
+        updated = self.repository.update(report)
+        if updated and unchanged:
+            return True
+        self._invalidate(report.id)
+        if updated:
+            self._bump_generation()
+        return updated
+
+    def update_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        updated = self.repository.update_fields(id, changes, version)
+        self._invalidate(id)
+        if updated:
+            self._bump_generation()
+        return updated
+
+    # Async counterparts on the cache's async API. List pages and counts are
+    # not cached for async callers, the single-flight load blocks on locks,
+    # but their writes invalidate the pages cached by sync callers.
+
+    async def asave(self, report: Report) -> None:
+        await self.repository.asave(report)
+        await self._aforget([report.id])
+        await self._abump_generation()
+
+    async def asave_many(self, reports: List[Report]) -> None:
+        await self.repository.asave_many(reports)
+        await self._aforget([report.id for report in reports])
+        await self._abump_generation()
+
+    async def aget_by_id(self, id: UUID) -> Report | None:
+        key = self._key(id)
+        cached = await self.cache.aget(key)
+        if cached is not None and cached != INVALIDATED:
+            self.stats.hits += 1
+            return None if cached == MISSING else _from_cache(cached)
+
+        self.stats.misses += 1
+        report = await self.repository.aget_by_id(id)
+        entry = self._entry(report)
+        if cached != INVALIDATED and entry is not None:
+            await self.cache.aadd(key, *entry)
+        return report
+
+    async def aget_version(self, id: UUID) -> ReportVersion | None:
+        cached = await self.cache.aget(self._key(id))
+        if cached is None or cached == INVALIDATED:
+            return await self.repository.aget_version(id)
+        if cached == MISSING:
+            return None
+        report = _from_cache(cached)
+        return ReportVersion(report.id, report.version, report.updated_at)
+
+    async def adelete(self, id: UUID) -> bool:
+        deleted = await self.repository.adelete(id)
+        await self._ainvalidate(id)
+        if deleted:
+            await self._abump_generation()
+        return deleted
+
+    async def alist(
+        self,
+        order_by: Optional[str] = None,
+        current_page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> List[Report]:
+        return await self.repository.alist(
+            order_by,
+            current_page,
+            per_page,
+            search_query,
+            cursor=cursor,
+            report_status=report_status,
+            report_type=report_type,
+        )
+
+    async def acount(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        return await self.repository.acount(
+            search_query, report_status=report_status, report_type=report_type
+        )
+
+    async def aupdate(self, report: Report) -> bool:
+        unchanged = report.tracks_changes and not report.changes
+        updated = await self.repository.aupdate(report)
+        if updated and unchanged:
+            return True
+        await self._ainvalidate(report.id)
+        if updated:
+            await self._abump_generation()
+        return updated
+
+    async def aupdate_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        updated = await self.repository.aupdate_fields(id, changes, version)
+        await self._ainvalidate(id)
+        if updated:
+            await self._abump_generation()
+        return updated
+
+    @staticmethod
+    def _key(id: UUID) -> str:
+        return f"{KEY_PREFIX}:{id}"
+
+    def _entry(self, report: Report | None) -> tuple | None:
+        """The value and timeout to cache for a loaded report, if any."""
+        if report is not None:
+            return _to_cache(report), self.timeout
+        if self.missing_timeout:
+            return MISSING, self.missing_timeout
+        return None
+
+    def _invalidation_timeout(self) -> float:
+        return max(INVALIDATION_TIMEOUT, self.replication_lag)
+
+    def _invalidate(self, id: UUID) -> None:
+        self.cache.set(self._key(id), INVALIDATED, self._invalidation_timeout())
+
+    async def _ainvalidate(self, id: UUID) -> None:
+        await self.cache.aset(self._key(id), INVALIDATED, self._invalidation_timeout())
+
+    def _forget(self, ids: List[UUID]) -> None:
+        # New ids are only known once created, no read can race on them unless
+        # it reads from a replica that does not have them yet
+        keys = [self._key(id) for id in ids]
+        if self.replication_lag:
+            self.cache.set_many(
+                dict.fromkeys(keys, INVALIDATED), self._invalidation_timeout()
+            )
+        else:
+            self.cache.delete_many(keys)
+
+    async def _aforget(self, ids: List[UUID]) -> None:
+        keys = [self._key(id) for id in ids]
+        if self.replication_lag:
+            await self.cache.aset_many(
+                dict.fromkeys(keys, INVALIDATED), self._invalidation_timeout()
+            )
+        else:
+            await self.cache.adelete_many(keys)
+
+    def _query_key(self, *parts) -> str:
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+        return f"{KEY_PREFIX}:{parts[0]}:{self._generation()}:{digest}"
+
+    def _generation(self) -> int:
+        generation = self.cache.get(GENERATION_KEY)
+        if generation is None:
+            # Start from the clock so that an evicted counter never goes back
+            # to a generation that may still have cached pages
+            self.cache.add(GENERATION_KEY, time.time_ns(), None)
+            generation = self.cache.get(GENERATION_KEY)
+        return generation
+
+    def _bump_generation(self) -> None:
+        try:
+            self.cache.incr(GENERATION_KEY)
+        except ValueError:
+            self.cache.add(GENERATION_KEY, time.time_ns(), None)
+        if self.replication_lag:
+            self.cache.set(WRITTEN_KEY, 1, self.replication_lag)
+
+    async def _abump_generation(self) -> None:
+        try:
+            await self.cache.aincr(GENERATION_KEY)
+        except ValueError:
+            await self.cache.aadd(GENERATION_KEY, time.time_ns(), None)
+        if self.replication_lag:
+            await self.cache.aset(WRITTEN_KEY, 1, self.replication_lag)
+
+    def _get_or_load(self, key: str, load: Callable):
+        """Returns the cached value or loads it, letting a single caller
+        across threads and processes run the query on a miss."""
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+
+        with _load_locks[hash(key) % len(_load_locks)]:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.hits += 1
+                return cached
+
+            lock_key = f"{key}:lock"
+            locked = self.cache.add(lock_key, 1, LOAD_LOCK_TIMEOUT)
+            if not locked:
+                cached = self._wait_for(key)
+                if cached is not None:
+                    self.stats.hits += 1
+                    return cached
+
+            self.stats.misses += 1
+            try:
+                value = load()
+                # The page may come from a replica without the last write
+                if not (self.replication_lag and self.cache.get(WRITTEN_KEY)):
+                    self.cache.set(key, value, self.list_timeout)
+            finally:
+                if locked:
+                    self.cache.delete(lock_key)
+            return value
+
+    def _wait_for(self, key: str):
+        # Another process is loading the same key, wait for its result
+        deadline = time.monotonic() + LOAD_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(LOAD_WAIT_INTERVAL)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        return None
+
+
+def _names(members) -> Optional[tuple[str, ...]]:
+    return tuple(sorted(member.name for member in members)) if members else None
+
+
+def _to_cache(report: Report) -> tuple:
+    return (
+        report.id,
+        report.title,
+        report.complaint,
+        report.report_type,
+        report.name,
+        str(report.email),
+        report.report_status,
+        report.version,
+        report.updated_at,
+    )
+
+
+def _from_cache(values: tuple) -> Report:
+    (
+        id,
+        title,
+        complaint,
+        report_type,
+        name,
+        email,
+        report_status,
+        version,
+        updated_at,
+    ) = values
+    return Report.from_persistence(
+        id=id,
+        title=title,
+        complaint=complaint,
+        report_type=report_type,
+        name=name,
+        email=email,
+        report_status=report_status,
+        version=version,
+        updated_at=updated_at,
+    )
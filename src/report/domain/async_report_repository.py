@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from src.report.domain.cursor import Cursor
+from src.report.domain.report import Report, ReportVersion
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+
+class AsyncReportRepository(ABC):
+    """Coroutine counterpart of ReportRepository, for async views. Methods
+    follow Django's naming, with an `a` prefix, so that one repository can
+    implement both interfaces."""
+
+    @abstractmethod
+    async def asave(self, report: Report) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def asave_many(self, reports: List[Report]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aget_by_id(self, id: UUID) -> Report | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aget_version(self, id: UUID) -> ReportVersion | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adelete(self, id: UUID) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist(
+        self,
+        order_by: Optional[str] = None,
+        current_page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> List[Report]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def acount(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aupdate(self, report: Report) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aupdate_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        raise NotImplementedError
@@ -0,0 +1,48 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.report.domain.report import Report
+
+
+def sort_value(report: Report, field: str) -> str:
+    value = getattr(report, field)
+    return "" if value is None else str(value)
+
+
+@dataclass(frozen=True)
+class Cursor:
+    order_by: str
+    value: str
+    id: UUID
+
+    @property
+    def field(self) -> str:
+        return self.order_by.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.order_by.startswith("-")
+
+    @classmethod
+    def for_report(cls, report: Report, order_by: str) -> "Cursor":
+        return cls(
+            order_by=order_by,
+            value=sort_value(report, order_by.lstrip("-")),
+            id=report.id,
+        )
+
+    def encode(self) -> str:
+        payload = json.dumps([self.order_by, self.value, str(self.id)])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            order_by, value, id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(order_by=str(order_by), value=str(value), id=UUID(id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise ValueError("cursor is not valid")
@@ -1,10 +1,29 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
 
 from src.report.domain.value_objects import ReportStatus, ReportType, Email
 from src.shared.domain.entity import Entity
+from src.shared.domain.notification import Notification
 
+UPDATABLE_FIELDS = (
+    "title",
+    "complaint",
+    "report_type",
+    "report_status",
+    "name",
+    "email",
+)
 
-@dataclass(eq=False)
+
+@dataclass(frozen=True, slots=True)
+class ReportVersion:
+    id: UUID
+    version: int
+    updated_at: datetime | None = None
+
+
+@dataclass(eq=False, slots=True)
 class Report(Entity):
     title: str
     complaint: str
@@ -12,47 +31,129 @@ class Report(Entity):
     name: str = ""
     email: str | Email = ""
     report_status: ReportStatus = ReportStatus.PENDING
+    # Incremented by the repositories on every update
+    version: int = 1
+    updated_at: datetime | None = None
+    # None until the report is loaded or persisted, changes are tracked after
+    _changed_fields: set[str] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if isinstance(self.email, str):
             self.email = Email(self.email)
         self.validate()
 
-    def validate(self):
-        if len(self.name) > 100:
-            self.notification.add_error("name cannot be longer than 100")
-
-        if len(self.title) > 255:
-            self.notification.add_error("title cannot be longer than 255")
-
-        if not self.title:
-            self.notification.add_error("title cannot be empty")
-
-        if not self.complaint:
-            self.notification.add_error("complaint cannot be empty")
-
-        if len(self.complaint) > 1024:
-            self.notification.add_error("complaint cannot be longer than 1024")
-
-        if not self.report_type:
-            self.notification.add_error("report_type cannot be empty")
-
-        if isinstance(self.email, Email):
-            email_errors = self.email.validate()
-            if email_errors:
-                self.notification.add_errors(email_errors)
-
-        type_errors = ReportType.validate(self.report_type)
-        if type_errors:
-            self.notification.add_errors(type_errors)
+    @classmethod
+    def from_persistence(
+        cls,
+        id,
+        title,
+        complaint,
+        report_type,
+        name="",
+        email="",
+        report_status=ReportStatus.PENDING,
+        version=1,
+        updated_at=None,
+    ) -> "Report":
+        """Rebuilds a report from already validated stored data, skipping
+        validation."""
+        report = cls.__new__(cls)
+        report.id = id
+        report.title = title
+        report.complaint = complaint
+        report.report_type = report_type
+        report.name = name
+        report.email = Email(email) if isinstance(email, str) else email
+        report.report_status = report_status
+        report.version = version
+        report.updated_at = updated_at
+        report.notification = Notification()
+        report._changed_fields = set()
+        return report
 
-        status_errors = ReportStatus.validate(self.report_status)
-        if status_errors:
-            self.notification.add_errors(status_errors)
+    def validate(self):
+        for name in UPDATABLE_FIELDS:
+            self.notification.add_errors(self.field_errors(name, getattr(self, name)))
 
         if self.notification.has_errors:
             raise ValueError(self.notification.messages)
 
+    @staticmethod
+    def field_errors(name: str, value) -> list[str]:
+        errors: list[str] = []
+
+        if name == "name" and len(value) > 100:
+            errors.append("name cannot be longer than 100")
+
+        if name == "title":
+            if len(value) > 255:
+                errors.append("title cannot be longer than 255")
+            if not value:
+                errors.append("title cannot be empty")
+
+        if name == "complaint":
+            if not value:
+                errors.append("complaint cannot be empty")
+            if len(value) > 1024:
+                errors.append("complaint cannot be longer than 1024")
+
+        if name == "report_type":
+            if not value:
+                errors.append("report_type cannot be empty")
+            errors.extend(ReportType.validate(value))
+
+        if name == "email":
+            email = Email(value) if isinstance(value, str) else value
+            errors.extend(email.validate())
+
+        if name == "report_status":
+            errors.extend(ReportStatus.validate(value))
+
+        return errors
+
+    @classmethod
+    def validate_changes(cls, changes: dict) -> None:
+        """Validates only the given fields, without loading the report."""
+        errors = [
+            error
+            for name, value in changes.items()
+            for error in cls.field_errors(name, value)
+        ]
+        if errors:
+            raise ValueError(",".join(errors))
+
+    @property
+    def changes(self) -> dict:
+        """Fields modified since the report was loaded or last persisted."""
+        if not self._changed_fields:
+            return {}
+        return {
+            name: str(self.email) if name == "email" else getattr(self, name)
+            for name in UPDATABLE_FIELDS
+            if name in self._changed_fields
+        }
+
+    @property
+    def tracks_changes(self) -> bool:
+        """Whether `changes` lists every modification, which is the case for
+        reports loaded from a repository or updated through one."""
+        return self._changed_fields is not None
+
+    def clear_changes(self) -> None:
+        self._changed_fields = set()
+
+    def change(self, **changes) -> None:
+        for name, value in changes.items():
+            if name == "email" and isinstance(value, str):
+                value = Email(value)
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                if self._changed_fields is None:
+                    self._changed_fields = set()
+                self._changed_fields.add(name)
+
+        self.validate()
+
     def update_report(
         self,
         title,
@@ -62,14 +163,14 @@ class Report(Entity):
         name="",
         email="",
     ):
-        self.title = title
-        self.complaint = complaint
-        self.report_type = report_type
-        self.report_status = report_status
-        self.name = name
-        self.email = Email(email) if isinstance(email, str) else email
-
-        self.validate()
+        self.change(
+            title=title,
+            complaint=complaint,
+            report_type=report_type,
+            report_status=report_status,
+            name=name,
+            email=email,
+        )
 
     def __str__(self):
         return f"{self.title}"
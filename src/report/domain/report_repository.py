@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from src.report.domain.report import Report
+from src.report.domain.cursor import Cursor
+from src.report.domain.report import Report, ReportVersion
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+# Orders search results by how well they match the search query
+ORDER_BY_RELEVANCE = "relevance"
+
+# Columns of the rows yielded by ReportRepository.export, in order
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "report_type",
+    "report_status",
+    "name",
+    "email",
+    "complaint",
+)
 
 
 class ReportRepository(ABC):
@@ -10,12 +26,20 @@ class ReportRepository(ABC):
     def save(self, report: Report):
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, reports: List[Report]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Report | None:
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def get_version(self, id: UUID) -> ReportVersion | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, id: UUID) -> bool:
         raise NotImplementedError
 
     @abstractmethod
@@ -25,9 +49,39 @@ class ReportRepository(ABC):
         current_page: Optional[int] = None,
         per_page: Optional[int] = None,
         search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
     ) -> list[Report]:
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, report: Report) -> None:
+    def export(
+        self,
+        order_by: Optional[str] = None,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> Iterator[tuple]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        raise NotImplementedError
+
+    # Updates are conditional on the version the report was read at, they
+    # return False when the report is gone or was modified in the meantime
+    @abstractmethod
+    def update(self, report: Report) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
         raise NotImplementedError
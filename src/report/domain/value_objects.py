@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import StrEnum, unique
+from functools import lru_cache
 import re
 
 
@@ -32,28 +33,38 @@ class ReportType(StrEnum):
         return errors
 
 
-@dataclass(frozen=True)
+EMAIL_MAX_LENGTH = 255
+EMAIL_VALIDATION_CACHE_SIZE = 1024
+
+# RFC 5322 Official Standard regex
+EMAIL_REGEX = re.compile(
+    r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])""",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=EMAIL_VALIDATION_CACHE_SIZE)
+def _address_errors(address: str) -> tuple[str, ...]:
+    # Every address matching the regex has an "@", so skip it for the rest
+    if "@" not in address or not EMAIL_REGEX.match(address):
+        return ("email is not valid",)
+    return ()
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     address: str = ""
 
     def validate(self) -> list[str]:
-        errors: list[str] = []
-
         if not self.address:
-            return errors
+            return []
 
-        if len(self.address) > 255:
-            errors.append("email cannot be longer than 255")
+        # Over-long input is rejected before the regex, which keeps its
+        # backtracking bounded and unbounded input out of the cache
+        if len(self.address) > EMAIL_MAX_LENGTH:
+            return ["email cannot be longer than 255"]
 
-        # RFC 5322 Official Standard regex
-        rfc_regex = re.compile(
-            r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])""",
-            re.IGNORECASE,
-        )
-        if not bool(rfc_regex.match(self.address)):
-            errors.append("email is not valid")
-
-        return errors
+        return list(_address_errors(self.address))
 
     def __str__(self) -> str:
         return self.address
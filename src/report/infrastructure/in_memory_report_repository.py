@@ -1,24 +1,110 @@
-from typing import Optional
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import datetime, timezone
+from enum import StrEnum
+from itertools import islice
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from src.report.domain.report import Report
-from src.report.domain.report_repository import ReportRepository
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.cursor import Cursor, sort_value
+from src.report.domain.report import Report, ReportVersion
+from src.report.domain.report_repository import (
+    EXPORT_FIELDS,
+    ORDER_BY_RELEVANCE,
+    ReportRepository,
+)
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.infrastructure.in_memory_search_index import ReportSearchIndex
 
+SortKey = tuple[str, UUID]
 
-class InMemoryReportRepository(ReportRepository):
-    def __init__(self, reports: list[Report] = None):
-        self.reports: list[Report] = reports or []
+
+def _member_name(value) -> str:
+    return value.name if isinstance(value, StrEnum) else str(value)
+
+
+def _copy(report: Report) -> Report:
+    return Report.from_persistence(
+        id=report.id,
+        title=report.title,
+        complaint=report.complaint,
+        report_type=report.report_type,
+        name=report.name,
+        email=report.email,
+        report_status=report.report_status,
+        version=report.version,
+        updated_at=report.updated_at,
+    )
+
+
+class InMemoryReportRepository(ReportRepository, AsyncReportRepository):
+    """Stores copies of the reports and hands out copies, like a database, so
+    that changing a report never bypasses the indexes."""
+
+    # Fields with a maintained sorted index of (value, id) keys
+    INDEXED_FIELDS = ("title", "report_type", "report_status", "email")
+    # Fields with a maintained hash index of member name -> ids
+    FILTER_FIELDS = ("report_status", "report_type")
+
+    def __init__(
+        self,
+        reports: list[Report] = None,
+        search_index: Optional[ReportSearchIndex] = None,
+    ):
+        self._reports: dict[UUID, Report] = {}
+        self._search_index = search_index
+        self._sort_indexes: dict[str, list[SortKey]] = {
+            field: [] for field in self.INDEXED_FIELDS
+        }
+        self._filter_indexes: dict[str, dict[str, set[UUID]]] = {
+            field: defaultdict(set) for field in self.FILTER_FIELDS
+        }
+        # Keys a report was indexed with, as reports may be mutated in place
+        self._sort_keys: dict[UUID, dict[str, SortKey]] = {}
+        self._filter_keys: dict[UUID, dict[str, str]] = {}
+
+        # Bulk load: sort each index once instead of inserting report by report
+        for report in reports or []:
+            self._reports[report.id] = stored = _copy(report)
+            self._index(stored, bulk=True)
+
+        for index in self._sort_indexes.values():
+            index.sort()
+
+    @property
+    def reports(self) -> list[Report]:
+        return [_copy(report) for report in self._reports.values()]
 
     def save(self, report: Report) -> None:
-        self.reports.append(report)
+        if report.id in self._reports:
+            self._unindex(report.id)
+
+        report.updated_at = datetime.now(timezone.utc)
+        self._reports[report.id] = stored = _copy(report)
+        self._index(stored)
+
+    def save_many(self, reports: List[Report]) -> None:
+        for report in reports:
+            self.save(report)
 
     def get_by_id(self, id: UUID) -> Report | None:
-        return next((report for report in self.reports if report.id == id), None)
+        report = self._reports.get(id)
+        return None if report is None else _copy(report)
 
-    def delete(self, id: UUID) -> None:
-        report = self.get_by_id(id)
-        if report:
-            self.reports.remove(report)
+    def get_version(self, id: UUID) -> ReportVersion | None:
+        report = self._reports.get(id)
+        if report is None:
+            return None
+        return ReportVersion(report.id, report.version, report.updated_at)
+
+    def delete(self, id: UUID) -> bool:
+        if id not in self._reports:
+            return False
+
+        self._unindex(id)
+        del self._reports[id]
+        return True
 
     def list(
         self,
@@ -26,34 +112,314 @@ class InMemoryReportRepository(ReportRepository):
         current_page: Optional[int] = None,
         per_page: Optional[int] = None,
         search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
     ) -> list[Report]:
-        # Start with all reports
-        filtered_reports = self.reports
+        reports = self._list(
+            order_by,
+            current_page,
+            per_page,
+            search_query,
+            cursor,
+            report_status,
+            report_type,
+        )
+        return [_copy(report) for report in reports]
+
+    def _list(
+        self,
+        order_by: Optional[str],
+        current_page: Optional[int],
+        per_page: Optional[int],
+        search_query: Optional[str],
+        cursor: Optional[Cursor],
+        report_status: Optional[List[ReportStatus]],
+        report_type: Optional[List[ReportType]],
+    ) -> List[Report]:
+        # Returns the stored reports themselves
+        order_by = order_by or (cursor.order_by if cursor else None)
+        query = search_query.lower() if search_query else None
+        candidates, unapplied_query = self._candidates(
+            query, report_status, report_type
+        )
+
+        # Pagination window over the ordered (and filtered) reports
+        start, stop = 0, None
+        if cursor is not None:
+            stop = per_page
+        elif current_page is not None and per_page is not None:
+            start = (current_page - 1) * per_page
+            stop = start + per_page
+
+        if candidates is not None:
+            # The indexes already narrowed the reports down, sort only those
+            reports = iter(
+                self._sorted(
+                    order_by, query, cursor, [self._reports[id] for id in candidates]
+                )
+            )
+        elif order_by and order_by.lstrip("-") in self._sort_indexes:
+            # Without a search filter the index walk can jump straight to the page
+            offset = 0 if unapplied_query else start
+            reports = self._iter_indexed(order_by, cursor, offset=offset)
+            start -= offset
+            stop = None if stop is None else stop - offset
+        else:
+            reports = iter(self._sorted(order_by, query, cursor))
 
         # Apply search query
-        if search_query:
-            filtered_reports = [
-                report
-                for report in filtered_reports
-                if search_query.lower() in report.title.lower()
-                or search_query.lower() in report.complaint.lower()
-                or search_query.lower() in report.name.lower()
-                or search_query.lower() in str(report.email).lower()
-            ]
+        if unapplied_query:
+            reports = (
+                report for report in reports if self._matches(report, unapplied_query)
+            )
+
+        return list(islice(reports, start, stop))
+
+    def export(
+        self,
+        order_by: Optional[str] = None,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> Iterator[tuple]:
+        reports = self._list(
+            order_by, None, None, search_query, None, report_status, report_type
+        )
+        for report in reports:
+            # Emails are stored as plain strings, like in the database
+            yield tuple(
+                str(report.email) if field == "email" else getattr(report, field)
+                for field in EXPORT_FIELDS
+            )
+
+    def count(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        query = search_query.lower() if search_query else None
+        candidates, unapplied_query = self._candidates(
+            query, report_status, report_type
+        )
+
+        if not unapplied_query:
+            return len(self._reports) if candidates is None else len(candidates)
+
+        reports = (
+            self._reports.values()
+            if candidates is None
+            else (self._reports[id] for id in candidates)
+        )
+        return sum(1 for report in reports if self._matches(report, unapplied_query))
+
+    def update(self, report: Report) -> bool:
+        stored = self._reports.get(report.id)
+        if stored is None or stored.version != report.version:
+            return False
+        if report.tracks_changes and not report.changes:
+            return True
+
+        self._unindex(report.id)
+        self._touch(report)
+        self._reports[report.id] = stored = _copy(report)
+        self._index(stored)
+        report.clear_changes()
+        return True
 
-        # Sort reports
-        if order_by:
-            # Dynamically sort based on the order_by parameter
+    def update_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        report = self._reports.get(id)
+        if report is None or version not in (None, report.version):
+            return False
+
+        self._unindex(id)
+        try:
+            report.change(**changes)
+        finally:
+            self._index(report)
+        if changes:
+            self._touch(report)
+        report.clear_changes()
+        return True
+
+    # Async counterparts, nothing needs to be awaited in memory
+
+    async def asave(self, report: Report) -> None:
+        self.save(report)
+
+    async def asave_many(self, reports: List[Report]) -> None:
+        self.save_many(reports)
+
+    async def aget_by_id(self, id: UUID) -> Report | None:
+        return self.get_by_id(id)
+
+    async def aget_version(self, id: UUID) -> ReportVersion | None:
+        return self.get_version(id)
+
+    async def adelete(self, id: UUID) -> bool:
+        return self.delete(id)
+
+    async def alist(self, *args, **kwargs) -> List[Report]:
+        return self.list(*args, **kwargs)
+
+    async def acount(self, *args, **kwargs) -> int:
+        return self.count(*args, **kwargs)
+
+    async def aupdate(self, report: Report) -> bool:
+        return self.update(report)
+
+    async def aupdate_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        return self.update_fields(id, changes, version)
+
+    @staticmethod
+    def _touch(report: Report) -> None:
+        report.version += 1
+        report.updated_at = datetime.now(timezone.utc)
+
+    def _index(self, report: Report, bulk: bool = False) -> None:
+        keys = {}
+        for field, index in self._sort_indexes.items():
+            key = (sort_value(report, field), report.id)
+            if bulk:
+                index.append(key)
+            else:
+                insort(index, key)
+            keys[field] = key
+        self._sort_keys[report.id] = keys
+
+        filter_keys = {}
+        for field, index in self._filter_indexes.items():
+            key = _member_name(getattr(report, field))
+            index[key].add(report.id)
+            filter_keys[field] = key
+        self._filter_keys[report.id] = filter_keys
+
+        if self._search_index is not None:
+            self._search_index.add(report)
+
+    def _unindex(self, id: UUID) -> None:
+        for field, key in self._sort_keys.pop(id).items():
+            index = self._sort_indexes[field]
+            del index[bisect_left(index, key)]
+
+        for field, key in self._filter_keys.pop(id).items():
+            self._filter_indexes[field][key].discard(id)
+
+        if self._search_index is not None:
+            self._search_index.remove(id)
+
+    def _candidates(
+        self,
+        query: Optional[str],
+        report_status: Optional[List[ReportStatus]],
+        report_type: Optional[List[ReportType]],
+    ) -> tuple[Optional[set[UUID]], Optional[str]]:
+        """Resolves filters and search from the indexes. Returns the candidate
+        ids (None for all reports) and the search query still to be scanned."""
+        candidates = None
+        for field, members in (
+            ("report_status", report_status),
+            ("report_type", report_type),
+        ):
+            if members:
+                index = self._filter_indexes[field]
+                ids = set().union(*(index.get(member.name, ()) for member in members))
+                candidates = ids if candidates is None else candidates & ids
+
+        matches = self._search(query)
+        if matches is not None:
+            candidates = matches if candidates is None else candidates & matches
+            query = None
+
+        return candidates, query
+
+    def _search(self, query: Optional[str]) -> Optional[set[UUID]]:
+        if not query or self._search_index is None:
+            return None
+        return self._search_index.search(query)
+
+    def _iter_indexed(
+        self, order_by: str, cursor: Optional[Cursor], offset: int = 0
+    ) -> Iterator[Report]:
+        index = self._sort_indexes[order_by.lstrip("-")]
+
+        if order_by.startswith("-"):
+            start = len(index) - 1
+            if cursor is not None:
+                start = bisect_left(index, (cursor.value, cursor.id)) - 1
+            positions = range(start - offset, -1, -1)
+        else:
+            start = 0
+            if cursor is not None:
+                start = bisect_right(index, (cursor.value, cursor.id))
+            positions = range(start + offset, len(index))
+
+        return (self._reports[index[position][1]] for position in positions)
+
+    def _sorted(
+        self,
+        order_by: Optional[str],
+        query: Optional[str],
+        cursor: Optional[Cursor],
+        reports: Optional[List[Report]] = None,
+    ) -> List[Report]:
+        if reports is None:
+            reports = list(self._reports.values())
+
+        # Sort reports on the composite (order_by, id) key
+        if order_by == ORDER_BY_RELEVANCE:
+            reports.sort(
+                key=lambda report: (-self._relevance(report, query), report.id)
+            )
+        elif order_by:
+            field = order_by.lstrip("-")
             try:
-                filtered_reports = sorted(filtered_reports, key=lambda report: getattr(report, order_by))
+                reports.sort(
+                    key=lambda report: (sort_value(report, field), report.id),
+                    reverse=order_by.startswith("-"),
+                )
             except AttributeError:
                 # Fallback to original order if attribute doesn't exist
                 pass
 
-        return filtered_reports
+        if cursor is not None:
+            boundary = (cursor.value, cursor.id)
+            reports = [
+                report
+                for report in reports
+                if (
+                    (sort_value(report, cursor.field), report.id) < boundary
+                    if cursor.descending
+                    else (sort_value(report, cursor.field), report.id) > boundary
+                )
+            ]
+
+        return reports
+
+    @staticmethod
+    def _relevance(report: Report, query: Optional[str]) -> int:
+        if not query:
+            return 0
+        return sum(
+            value.lower().count(query)
+            for value in (
+                report.title,
+                report.complaint,
+                report.name,
+                str(report.email),
+            )
+        )
 
-    def update(self, report: Report) -> None:
-        old_report = self.get_by_id(report.id)
-        if old_report:
-            self.reports.remove(old_report)
-            self.reports.append(report)
+    @staticmethod
+    def _matches(report: Report, query: str) -> bool:
+        return (
+            query in report.title.lower()
+            or query in report.complaint.lower()
+            or query in report.name.lower()
+            or query in str(report.email).lower()
+        )
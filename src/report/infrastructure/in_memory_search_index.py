@@ -0,0 +1,79 @@
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from src.report.domain.report import Report
+
+NGRAM_SIZE = 3
+
+# Above this share of candidate reports a plain scan is cheaper than the index
+MAX_CANDIDATE_RATIO = 0.2
+MIN_CANDIDATES_FOR_SCAN = 1000
+
+
+def ngrams(text: str) -> set[str]:
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class ReportSearchIndex:
+    """Inverted n-gram index answering case-insensitive substring searches over
+    the same report fields the in-memory repository scans."""
+
+    def __init__(self, reports: Iterable[Report] = ()):
+        self._postings: dict[str, set[UUID]] = defaultdict(set)
+        self._texts: dict[UUID, tuple[str, ...]] = {}
+
+        for report in reports:
+            self.add(report)
+
+    def add(self, report: Report) -> None:
+        if report.id in self._texts:
+            self.remove(report.id)
+
+        texts = self._searchable_texts(report)
+        self._texts[report.id] = texts
+        for gram in set().union(*(ngrams(text) for text in texts)):
+            self._postings[gram].add(report.id)
+
+    def remove(self, id: UUID) -> None:
+        texts = self._texts.pop(id, None)
+        if texts is None:
+            return
+
+        for gram in set().union(*(ngrams(text) for text in texts)):
+            posting = self._postings[gram]
+            posting.discard(id)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query: str) -> set[UUID] | None:
+        """Returns the ids of matching reports, or None when the query is too
+        short or too common to be answered efficiently from the index."""
+        query = query.lower()
+        if len(query) < NGRAM_SIZE:
+            return None
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in ngrams(query)), key=len
+        )
+        scan_threshold = max(
+            len(self._texts) * MAX_CANDIDATE_RATIO, MIN_CANDIDATES_FOR_SCAN
+        )
+        if len(postings[0]) > scan_threshold:
+            return None
+
+        candidates = set.intersection(*postings)
+
+        # n-grams may match in different places, so confirm the substring
+        return {
+            id for id in candidates if any(query in text for text in self._texts[id])
+        }
+
+    @staticmethod
+    def _searchable_texts(report: Report) -> tuple[str, ...]:
+        return (
+            report.title.lower(),
+            report.complaint.lower(),
+            report.name.lower(),
+            str(report.email).lower(),
+        )
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+from src.report import search
+
+
+def create_search_index(apps, schema_editor):
+    statements = {
+        "sqlite": search.SQLITE_FTS_SETUP,
+        "postgresql": search.POSTGRES_SEARCH_SETUP,
+    }.get(schema_editor.connection.vendor, [])
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    statements = {
+        "sqlite": search.SQLITE_FTS_TEARDOWN,
+        "postgresql": search.POSTGRES_SEARCH_TEARDOWN,
+    }.get(schema_editor.connection.vendor, [])
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("report", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
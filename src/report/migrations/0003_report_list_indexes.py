@@ -0,0 +1,44 @@
+# Generated by Django 5.1.7 on 2026-10-18 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("report", "0002_report_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(fields=["title", "id"], name="report_title_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(fields=["report_type", "id"], name="report_type_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(
+                fields=["report_status", "id"], name="report_status_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(fields=["email", "id"], name="report_email_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(
+                fields=["report_status", "title", "id"],
+                name="report_status_title_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reportmodel",
+            index=models.Index(
+                fields=["report_type", "title", "id"], name="report_type_title_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.7 on 2026-10-18 08:24
+
+from django.db import migrations, models
+
+from src.report import search
+
+
+def restore_sqlite_search_index(apps, schema_editor):
+    # SQLite adds these columns by rebuilding the report table, which drops the
+    # triggers keeping the full-text index in sync and renumbers the rowids
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for statement in search.SQLITE_FTS_SETUP:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("report", "0003_report_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_sqlite_search_index),
+        migrations.AddField(
+            model_name="reportmodel",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="reportmodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(restore_sqlite_search_index, migrations.RunPython.noop),
+    ]
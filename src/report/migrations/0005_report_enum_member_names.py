@@ -0,0 +1,31 @@
+# Generated by Django 5.1.7 on 2026-10-18 11:02
+
+from django.db import migrations
+from django.db.models import F
+
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+
+def store_member_names(apps, schema_editor):
+    # Reports saved from enum members stored their value, the API stores the
+    # member name. Filters match a single stored name, so the values are
+    # rewritten, bumping the version as the representation changes
+    ReportModel = apps.get_model("report", "ReportModel")
+    for field, enum in (("report_type", ReportType), ("report_status", ReportStatus)):
+        for member in enum:
+            if member.name == member.value:
+                continue
+            ReportModel.objects.filter(**{field: member.value}).update(
+                **{field: member.name}, version=F("version") + 1
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("report", "0004_report_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(store_member_names, migrations.RunPython.noop),
+    ]
@@ -20,11 +20,29 @@ class ReportModel(models.Model):
     report_status = models.CharField(
         max_length=50, choices=STATUS_CHOICES, default=ReportStatus.PENDING
     )
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Denúncia"
         verbose_name_plural = "Denúncias"
         db_table = "report"
+        # Every sortable field is paired with the id tie-breaker used for
+        # pagination, and the status/type filters with the default title order.
+        indexes = [
+            models.Index(fields=["title", "id"], name="report_title_id_idx"),
+            models.Index(fields=["report_type", "id"], name="report_type_id_idx"),
+            models.Index(fields=["report_status", "id"], name="report_status_id_idx"),
+            models.Index(fields=["email", "id"], name="report_email_id_idx"),
+            models.Index(
+                fields=["report_status", "title", "id"],
+                name="report_status_title_id_idx",
+            ),
+            models.Index(
+                fields=["report_type", "title", "id"],
+                name="report_type_title_id_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.status}"
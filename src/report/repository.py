@@ -1,20 +1,53 @@
-from typing import Optional
+from enum import StrEnum
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from django.db.models import Q
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F, Q
+from django.utils import timezone
 
-from src.report.domain.report import Report
-from src.report.domain.report_repository import ReportRepository
+from src import config
+
+from src.report.cache import CachedReportRepository
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.cursor import Cursor
+from src.report.domain.report import Report, ReportVersion
+from src.report.domain.report_repository import (
+    EXPORT_FIELDS,
+    ORDER_BY_RELEVANCE,
+    ReportRepository,
+)
+from src.report.domain.value_objects import ReportStatus, ReportType
 from src.report.models import ReportModel
+from src.report.search import ReportSearchBackend, get_search_backend
 
 
-class DjangoORMReportRepository(ReportRepository):
-    def __init__(self, model: ReportModel | None = None):
+class DjangoORMReportRepository(ReportRepository, AsyncReportRepository):
+    def __init__(
+        self,
+        model: ReportModel | None = None,
+        search_backend: ReportSearchBackend | None = None,
+        batch_size: int | None = None,
+        export_chunk_size: int | None = None,
+    ):
         self.model = model or ReportModel
+        self.search_backend = search_backend or get_search_backend()
+        self.batch_size = batch_size or config.BULK_CREATE_BATCH_SIZE
+        self.export_chunk_size = export_chunk_size or config.EXPORT_CHUNK_SIZE
 
     def save(self, report: Report) -> None:
         report_model = ReportModelMapper.to_model(report)
         report_model.save()
+        report.updated_at = report_model.updated_at
+
+    def save_many(self, reports: List[Report]) -> None:
+        report_models = self.model.objects.bulk_create(
+            [ReportModelMapper.to_model(report) for report in reports],
+            batch_size=self.batch_size,
+        )
+        for report, report_model in zip(reports, report_models):
+            report.updated_at = report_model.updated_at
 
     def get_by_id(self, id: UUID) -> Report | None:
         try:
@@ -24,8 +57,19 @@ class DjangoORMReportRepository(ReportRepository):
         except self.model.DoesNotExist:
             return None
 
-    def delete(self, id: UUID) -> None:
-        self.model.objects.filter(id=id).delete()
+    def get_version(self, id: UUID) -> ReportVersion | None:
+        row = (
+            self.model.objects.filter(pk=id)
+            .values_list("version", "updated_at")
+            .first()
+        )
+        return None if row is None else ReportVersion(id, *row)
+
+    def delete(self, id: UUID) -> bool:
+        # Reports have no relations or delete signals, so Django skips the
+        # collector and issues a single DELETE returning the affected rows
+        deleted, _ = self.model.objects.filter(id=id).delete()
+        return deleted > 0
 
     def list(
         self,
@@ -33,52 +77,283 @@ class DjangoORMReportRepository(ReportRepository):
         current_page: Optional[int] = None,
         per_page: Optional[int] = None,
         search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
     ) -> list[Report]:
+        queryset = self._page_queryset(
+            order_by,
+            current_page,
+            per_page,
+            search_query,
+            cursor,
+            report_status,
+            report_type,
+        )
+        return [ReportModelMapper.to_entity(report) for report in list(queryset)]
 
-        queryset = self.model.objects.all()
+    def export(
+        self,
+        order_by: Optional[str] = None,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> Iterator[tuple]:
+        queryset = self._filter(
+            self.model.objects.all(), search_query, report_status, report_type
+        )
+        queryset = self._ordered(queryset, order_by, search_query)
+        # Rows are fetched in chunks from a single query and never hydrated
+        # into models or entities, so memory does not grow with the table
+        return queryset.values_list(*EXPORT_FIELDS).iterator(
+            chunk_size=self.export_chunk_size
+        )
+
+    def count(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        return self._filter(
+            self.model.objects.all(), search_query, report_status, report_type
+        ).count()
 
-        # Search
+    def _filter(
+        self,
+        queryset,
+        search_query: Optional[str],
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ):
+        # Equality filters first, they are served by the composite indexes
+        if report_status:
+            queryset = queryset.filter(**_member_lookup("report_status", report_status))
+        if report_type:
+            queryset = queryset.filter(**_member_lookup("report_type", report_type))
         if search_query:
-            queryset = queryset.filter(
-                Q(email__icontains=search_query)
-                | Q(title__icontains=search_query)
-                | Q(complaint__icontains=search_query)
-                | Q(report_type__icontains=search_query)
-                | Q(report_status__icontains=search_query)
-            )
-
-        # Ordering
-        if order_by:
-            if order_by.startswith("-"):
-                order_by = order_by[1:]
-                queryset = queryset.order_by(f"-{order_by}")
-            else:
-                queryset = queryset.order_by(order_by)
+            queryset = self.search_backend.filter(queryset, search_query)
+        return queryset
+
+    def _page_queryset(
+        self,
+        order_by: Optional[str],
+        current_page: Optional[int],
+        per_page: Optional[int],
+        search_query: Optional[str],
+        cursor: Optional[Cursor],
+        report_status: Optional[List[ReportStatus]],
+        report_type: Optional[List[ReportType]],
+    ):
+        queryset = self._filter(
+            self.model.objects.all(), search_query, report_status, report_type
+        )
+
+        order_by = order_by or (cursor.order_by if cursor else None)
+        queryset = self._ordered(queryset, order_by, search_query)
+
+        # Keyset pagination
+        if cursor is not None:
+            queryset = self._after_cursor(queryset, cursor)
+            if per_page is not None:
+                queryset = queryset[:per_page]
 
-        # Pagination
-        if current_page is not None and per_page is not None:
+        # Offset pagination
+        elif current_page is not None and per_page is not None:
             start = (current_page - 1) * per_page
             end = start + per_page
             queryset = queryset[start:end]
 
-        return [ReportModelMapper.to_entity(report) for report in list(queryset)]
+        return queryset
 
-    def update(self, report: Report) -> None:
-        self.model.objects.filter(pk=report.id).update(
-            id=report.id,
-            title=report.title,
-            complaint=report.complaint,
-            name=report.name,
-            email=report.email,
-            report_type=report.report_type,
-            report_status=report.report_status,
+    def _ordered(self, queryset, order_by: Optional[str], search_query: Optional[str]):
+        # id breaks ties so that every page boundary is stable
+        if order_by == ORDER_BY_RELEVANCE:
+            if search_query:
+                queryset = self.search_backend.rank(queryset, search_query)
+                return queryset.order_by("-search_rank", "id")
+            return queryset.order_by("id")
+        if order_by:
+            if order_by.startswith("-"):
+                return queryset.order_by(order_by, "-id")
+            return queryset.order_by(order_by, "id")
+        return queryset
+
+    @staticmethod
+    def _after_cursor(queryset, cursor: Cursor):
+        lookup = "lt" if cursor.descending else "gt"
+        return queryset.filter(
+            Q(**{f"{cursor.field}__{lookup}": cursor.value})
+            | Q(**{cursor.field: cursor.value, f"id__{lookup}": cursor.id})
         )
 
+    def update(self, report: Report) -> bool:
+        changes = _report_changes(report)
+        if not changes:
+            # Nothing to write, the version and updated_at are left as they are
+            return self._matching(report.id, report.version).exists()
+        updated_at = timezone.now()
+        updated = self._update(report.id, changes, updated_at, report.version)
+        if updated:
+            _written(report, updated_at)
+        return updated
+
+    def update_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        if not changes:
+            return self._matching(id, version).exists()
+        return self._update(id, changes, timezone.now(), version)
+
+    def _update(
+        self, id: UUID, changes: dict, updated_at, version: Optional[int]
+    ) -> bool:
+        return (
+            self._matching(id, version).update(**_update_values(changes, updated_at))
+            > 0
+        )
+
+    def _matching(self, id: UUID, version: Optional[int]):
+        # UPDATE ... WHERE id = %s AND version = %s, for optimistic locking
+        queryset = self.model.objects.filter(pk=id)
+        if version is not None:
+            queryset = queryset.filter(version=version)
+        return queryset
+
+    # Async counterparts on Django's async ORM, querysets are built the same
+    # way and only evaluated with await
+
+    async def asave(self, report: Report) -> None:
+        report_model = ReportModelMapper.to_model(report)
+        await report_model.asave()
+        report.updated_at = report_model.updated_at
+
+    async def asave_many(self, reports: List[Report]) -> None:
+        report_models = await self.model.objects.abulk_create(
+            [ReportModelMapper.to_model(report) for report in reports],
+            batch_size=self.batch_size,
+        )
+        for report, report_model in zip(reports, report_models):
+            report.updated_at = report_model.updated_at
+
+    async def aget_by_id(self, id: UUID) -> Report | None:
+        try:
+            report_model = await self.model.objects.aget(id=id)
+            return ReportModelMapper.to_entity(report_model)
+
+        except self.model.DoesNotExist:
+            return None
+
+    async def aget_version(self, id: UUID) -> ReportVersion | None:
+        row = (
+            await self.model.objects.filter(pk=id)
+            .values_list("version", "updated_at")
+            .afirst()
+        )
+        return None if row is None else ReportVersion(id, *row)
+
+    async def adelete(self, id: UUID) -> bool:
+        deleted, _ = await self.model.objects.filter(id=id).adelete()
+        return deleted > 0
+
+    async def alist(
+        self,
+        order_by: Optional[str] = None,
+        current_page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        search_query: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> List[Report]:
+        queryset = self._page_queryset(
+            order_by,
+            current_page,
+            per_page,
+            search_query,
+            cursor,
+            report_status,
+            report_type,
+        )
+        return [ReportModelMapper.to_entity(report) async for report in queryset]
+
+    async def acount(
+        self,
+        search_query: Optional[str] = None,
+        report_status: Optional[List[ReportStatus]] = None,
+        report_type: Optional[List[ReportType]] = None,
+    ) -> int:
+        return await self._filter(
+            self.model.objects.all(), search_query, report_status, report_type
+        ).acount()
+
+    async def aupdate(self, report: Report) -> bool:
+        changes = _report_changes(report)
+        if not changes:
+            return await self._matching(report.id, report.version).aexists()
+        updated_at = timezone.now()
+        updated = await self._matching(report.id, report.version).aupdate(
+            **_update_values(changes, updated_at)
+        )
+        if updated:
+            _written(report, updated_at)
+        return updated > 0
+
+    async def aupdate_fields(
+        self, id: UUID, changes: dict, version: Optional[int] = None
+    ) -> bool:
+        if not changes:
+            return await self._matching(id, version).aexists()
+        updated = await self._matching(id, version).aupdate(
+            **_update_values(changes, timezone.now())
+        )
+        return updated > 0
+
+
+def _stored(value):
+    # Enums are stored by member name, whether they come from the API or as members
+    return value.name if isinstance(value, StrEnum) else value
+
+
+def _stored_fields(changes: dict) -> dict:
+    return {field: _stored(value) for field, value in changes.items()}
+
+
+def _report_changes(report: Report) -> dict:
+    # Only the fields changed on the entity are written, untracked reports are
+    # written whole
+    if not report.tracks_changes:
+        return ReportModelMapper.to_fields(report)
+    return report.changes
+
+
+def _update_values(changes: dict, updated_at) -> dict:
+    # queryset.update() skips auto_now, so updated_at is set explicitly
+    return {
+        **_stored_fields(changes),
+        "version": F("version") + 1,
+        "updated_at": updated_at,
+    }
+
+
+def _written(report: Report, updated_at) -> None:
+    report.version += 1
+    report.updated_at = updated_at
+    report.clear_changes()
+
+
+def _member_lookup(field: str, members) -> dict:
+    # A single member is an equality, so the composite indexes are range scanned
+    names = sorted({_stored(member) for member in members})
+    if len(names) == 1:
+        return {field: names[0]}
+    return {f"{field}__in": names}
+
 
 class ReportModelMapper:
     @staticmethod
     def to_entity(model: ReportModel) -> Report:
-        return Report(
+        return Report.from_persistence(
             id=model.id,
             title=model.title,
             complaint=model.complaint,
@@ -86,8 +361,21 @@ class ReportModelMapper:
             email=model.email,
             report_type=model.report_type,
             report_status=model.report_status,
+            version=model.version,
+            updated_at=model.updated_at,
         )
 
+    @staticmethod
+    def to_fields(entity: Report) -> dict:
+        return {
+            "title": entity.title,
+            "complaint": entity.complaint,
+            "name": entity.name,
+            "email": str(entity.email),
+            "report_type": _stored(entity.report_type),
+            "report_status": _stored(entity.report_status),
+        }
+
     @staticmethod
     def to_model(entity: Report) -> ReportModel:
         return ReportModel(
@@ -96,6 +384,38 @@ class ReportModelMapper:
             complaint=entity.complaint,
             name=entity.name,
             email=entity.email,
-            report_type=entity.report_type,
-            report_status=entity.report_status,
+            report_type=_stored(entity.report_type),
+            report_status=_stored(entity.report_status),
+            version=entity.version,
         )
+
+
+def get_report_repository() -> ReportRepository:
+    return _cached(DjangoORMReportRepository())
+
+
+def get_async_report_repository() -> AsyncReportRepository:
+    # Shares the cache with the sync views, so that writes of either
+    # invalidate what the other cached
+    return _cached(DjangoORMReportRepository())
+
+
+def _cached(repository: DjangoORMReportRepository):
+    alias = getattr(settings, "REPORT_CACHE_ALIAS", None)
+    if alias is None:
+        return repository
+
+    return CachedReportRepository(
+        repository,
+        caches[alias],
+        timeout=getattr(settings, "REPORT_CACHE_TIMEOUT", None),
+        missing_timeout=getattr(settings, "REPORT_CACHE_MISSING_TIMEOUT", None),
+        list_timeout=getattr(settings, "REPORT_LIST_CACHE_TIMEOUT", None),
+        # Replicas may lag behind writes for as long as clients stick to the
+        # primary after writing
+        replication_lag=(
+            getattr(settings, "REPORT_STICKY_PRIMARY_SECONDS", 0)
+            if getattr(settings, "REPORT_REPLICA_DATABASES", None)
+            else 0
+        ),
+    )
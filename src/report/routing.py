@@ -0,0 +1,140 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+DEFAULT_STICKY_PRIMARY_COOKIE = "use_primary"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@dataclass
+class RoutingState:
+    # Reads go to the primary, e.g. right after the client wrote something
+    use_primary: bool = False
+    # A write was routed to the primary while handling the request
+    wrote: bool = False
+
+
+# The state is mutated rather than replaced, so that writes made inside
+# sync_to_async threads, which run on a copy of the context, are seen here
+_routing: ContextVar[Optional[RoutingState]] = ContextVar("routing", default=None)
+
+
+@contextmanager
+def use_primary():
+    """Routes every read in the block to the primary database."""
+    token = _routing.set(RoutingState(use_primary=True))
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+class ReplicaRouter:
+    """Sends reads of the report app to one of the REPORT_REPLICA_DATABASES
+    and writes to the primary. Reads stay on the primary within the request
+    routing state, see StickyPrimaryMiddleware."""
+
+    route_app_labels = {"report"}
+
+    primary = DEFAULT_DB_ALIAS
+
+    @property
+    def replicas(self) -> list[str]:
+        return getattr(settings, "REPORT_REPLICA_DATABASES", [])
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in self.route_app_labels:
+            return None
+
+        state = _routing.get()
+        if not self.replicas or (state is not None and state.use_primary):
+            return self.primary
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label not in self.route_app_labels:
+            return None
+
+        state = _routing.get()
+        if state is not None:
+            # Read your own writes for the rest of the request
+            state.use_primary = state.wrote = True
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {self.primary, *self.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        if db in self.replicas:
+            return False
+        return None
+
+
+class StickyPrimaryMiddleware:
+    """Keeps a client on the primary database for REPORT_STICKY_PRIMARY_SECONDS
+    after it wrote something, so that it reads its writes despite the
+    replication lag. Unsafe requests read from the primary throughout."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(
+            settings, "REPORT_STICKY_PRIMARY_COOKIE", DEFAULT_STICKY_PRIMARY_COOKIE
+        )
+        self.seconds = getattr(settings, "REPORT_STICKY_PRIMARY_SECONDS", 0)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = self._state(request)
+        token = _routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._stick(state, response)
+
+    async def __acall__(self, request):
+        state = self._state(request)
+        token = _routing.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._stick(state, response)
+
+    def _state(self, request) -> RoutingState:
+        return RoutingState(
+            use_primary=(
+                request.method not in SAFE_METHODS
+                or self.cookie_name in request.COOKIES
+            )
+        )
+
+    def _stick(self, state: RoutingState, response):
+        # The cookie expires with the window, every write extends it
+        if state.wrote and self.seconds:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=self.seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
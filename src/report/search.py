@@ -0,0 +1,148 @@
+from django.conf import settings
+from django.db.models import Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+DEFAULT_SEARCH_BACKEND = "src.report.search.IContainsSearchBackend"
+
+SEARCH_FIELDS = ("title", "complaint", "name", "email", "report_type", "report_status")
+
+# SQLite FTS5 external content table mirroring the searchable report columns.
+# The trigram tokenizer keeps the substring semantics of the icontains search.
+SQLITE_FTS_TABLE = "report_fts"
+
+SQLITE_FTS_SETUP = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        {", ".join(SEARCH_FIELDS)},
+        content='report',
+        content_rowid='rowid',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS report_fts_insert AFTER INSERT ON report BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, {", ".join(SEARCH_FIELDS)})
+        VALUES (new.rowid, {", ".join(f"new.{field}" for field in SEARCH_FIELDS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS report_fts_delete AFTER DELETE ON report BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {", ".join(SEARCH_FIELDS)})
+        VALUES ('delete', old.rowid, {", ".join(f"old.{field}" for field in SEARCH_FIELDS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS report_fts_update AFTER UPDATE ON report BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {", ".join(SEARCH_FIELDS)})
+        VALUES ('delete', old.rowid, {", ".join(f"old.{field}" for field in SEARCH_FIELDS)});
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, {", ".join(SEARCH_FIELDS)})
+        VALUES (new.rowid, {", ".join(f"new.{field}" for field in SEARCH_FIELDS)});
+    END
+    """,
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_FTS_TEARDOWN = [
+    "DROP TRIGGER IF EXISTS report_fts_insert",
+    "DROP TRIGGER IF EXISTS report_fts_delete",
+    "DROP TRIGGER IF EXISTS report_fts_update",
+    f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}",
+]
+
+# PostgreSQL expression index. Queries must use the exact same expression for the
+# planner to pick the GIN index.
+POSTGRES_SEARCH_VECTOR = "to_tsvector('simple', {})".format(
+    " || ' ' || ".join(f"coalesce({field}, '')" for field in SEARCH_FIELDS)
+)
+
+POSTGRES_SEARCH_SETUP = [
+    f"CREATE INDEX IF NOT EXISTS report_search_gin ON report "
+    f"USING GIN (({POSTGRES_SEARCH_VECTOR}))",
+]
+
+POSTGRES_SEARCH_TEARDOWN = [
+    "DROP INDEX IF EXISTS report_search_gin",
+]
+
+
+class ReportSearchBackend:
+    def filter(self, queryset, search_query: str):
+        raise NotImplementedError
+
+    def rank(self, queryset, search_query: str):
+        """Annotates `search_rank`, where a higher rank is a better match."""
+        return queryset.annotate(search_rank=Value(0))
+
+
+class IContainsSearchBackend(ReportSearchBackend):
+    def filter(self, queryset, search_query: str):
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f"{field}__icontains": search_query})
+        return queryset.filter(condition)
+
+
+class SQLiteFTS5SearchBackend(ReportSearchBackend):
+    # The trigram tokenizer cannot match queries shorter than three characters
+    min_query_length = 3
+
+    def __init__(self):
+        self.fallback = IContainsSearchBackend()
+
+    def filter(self, queryset, search_query: str):
+        if len(search_query) < self.min_query_length:
+            return self.fallback.filter(queryset, search_query)
+
+        return queryset.extra(
+            where=[
+                f"{self._rowid(queryset)} IN "
+                f"(SELECT rowid FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s)"
+            ],
+            params=[self._match_expression(search_query)],
+        )
+
+    def rank(self, queryset, search_query: str):
+        if len(search_query) < self.min_query_length:
+            return self.fallback.rank(queryset, search_query)
+
+        # bm25() is lower for better matches, hence the negation
+        return queryset.annotate(
+            search_rank=RawSQL(
+                f"(SELECT -bm25({SQLITE_FTS_TABLE}) FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s "
+                f"AND {SQLITE_FTS_TABLE}.rowid = {self._rowid(queryset)})",
+                [self._match_expression(search_query)],
+            )
+        )
+
+    @staticmethod
+    def _rowid(queryset) -> str:
+        return f'"{queryset.model._meta.db_table}".rowid'
+
+    @staticmethod
+    def _match_expression(search_query: str) -> str:
+        # A quoted FTS5 string is matched as a single phrase, i.e. a substring
+        return '"{}"'.format(search_query.replace('"', '""'))
+
+
+class PostgresFullTextSearchBackend(ReportSearchBackend):
+    def filter(self, queryset, search_query: str):
+        return queryset.extra(
+            where=[f"{POSTGRES_SEARCH_VECTOR} @@ plainto_tsquery('simple', %s)"],
+            params=[search_query],
+        )
+
+    def rank(self, queryset, search_query: str):
+        return queryset.annotate(
+            search_rank=RawSQL(
+                f"ts_rank({POSTGRES_SEARCH_VECTOR}, plainto_tsquery('simple', %s))",
+                [search_query],
+            )
+        )
+
+
+def get_search_backend() -> ReportSearchBackend:
+    backend = getattr(settings, "REPORT_SEARCH_BACKEND", DEFAULT_SEARCH_BACKEND)
+    return import_string(backend)()
@@ -16,7 +16,8 @@ class ReportResponseSerializer(serializers.Serializer):
 class ListOutputMetaSerializer(serializers.Serializer):
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
+    next_cursor = serializers.CharField(required=False, allow_null=True)
 
 
 class ListReportResponseSerializer(serializers.Serializer):
@@ -59,6 +60,15 @@ class CreateReportResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
 
+class BulkCreateReportResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField(allow_null=True)
+    errors = serializers.DictField(child=serializers.ListField())
+
+
+class BulkCreateReportResponseSerializer(serializers.Serializer):
+    data = BulkCreateReportResultSerializer(many=True)
+
+
 class UpdateReportRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField(required=True)
     name = serializers.CharField(
@@ -81,3 +91,37 @@ class UpdateReportRequestSerializer(serializers.Serializer):
 
 class DeleteReportRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
+
+
+# Plain dict builders rendering the same JSON as the response serializers
+# above, without instantiating and running serializer fields for every report.
+# The serializers still describe the responses in the API docs.
+
+
+def report_data(report) -> dict:
+    return {
+        "id": str(report.id),
+        "title": report.title,
+        "report_type": str(report.report_type),
+        "report_status": str(report.report_status),
+        "name": report.name,
+        "email": str(report.email),
+        "complaint": report.complaint,
+    }
+
+
+def list_report_data(output) -> dict:
+    meta = output.meta
+    return {
+        "data": [report_data(report) for report in output.data],
+        "meta": {
+            "current_page": meta.current_page,
+            "per_page": meta.per_page,
+            "total": meta.total,
+            "next_cursor": meta.next_cursor,
+        },
+    }
+
+
+def retrieve_report_data(output) -> dict:
+    return {"data": report_data(output)}
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+# When PRAGMA optimize last ran, per database alias, in this process
+_optimized_at: dict[str, float] = {}
+_optimize_lock = threading.Lock()
+
+
+def apply_sqlite_profile(sender, connection, **kwargs) -> None:
+    """Applies REPORT_SQLITE_PRAGMAS to every new SQLite connection, connected
+    to the connection_created signal."""
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas = getattr(settings, "REPORT_SQLITE_PRAGMAS", None) or {}
+    with connection.cursor() as cursor:
+        # Dict order is kept, journal_mode must come before the others
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+    optimize_if_due(connection)
+
+
+def optimize_sqlite_connections(**kwargs) -> None:
+    # Persistent connections (CONN_MAX_AGE) are optimized between requests
+    for connection in connections.all(initialized_only=True):
+        if connection.vendor == "sqlite" and connection.connection is not None:
+            optimize_if_due(connection)
+
+
+def optimize_if_due(connection) -> bool:
+    """Runs PRAGMA optimize at most once every REPORT_SQLITE_OPTIMIZE_INTERVAL
+    seconds per database, which keeps the query planner statistics fresh."""
+    interval = getattr(settings, "REPORT_SQLITE_OPTIMIZE_INTERVAL", None)
+    if interval is None:
+        return False
+
+    now = time.monotonic()
+    with _optimize_lock:
+        last = _optimized_at.get(connection.alias)
+        if last is not None and now - last < interval:
+            return False
+        _optimized_at[connection.alias] = now
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA optimize")
+    return True
@@ -0,0 +1,44 @@
+from src.report.application.use_cases.create_report import CreateReportRequest
+from src.report.application.use_cases.create_reports import (
+    CreateReports,
+    CreateReportsRequest,
+)
+from src.report.domain.value_objects import ReportType
+from src.report.infrastructure.in_memory_report_repository import (
+    InMemoryReportRepository,
+)
+
+
+class TestCreateReports:
+    def test_create_reports_saves_valid_reports_to_repository(self):
+        repository = InMemoryReportRepository()
+        create_reports_use_case = CreateReports(repository)
+
+        request = CreateReportsRequest(
+            reports=[
+                CreateReportRequest(
+                    title="First Report",
+                    complaint="First complaint",
+                    report_type=ReportType.DATA_LEAK,
+                ),
+                CreateReportRequest(
+                    title="Invalid Report",
+                    complaint="Invalid complaint",
+                    report_type=ReportType.OTHER,
+                    email="not-an-email",
+                ),
+                CreateReportRequest(
+                    title="Second Report",
+                    complaint="Second complaint",
+                    report_type=ReportType.OTHER,
+                ),
+            ]
+        )
+
+        response = create_reports_use_case.execute(request)
+
+        assert response.created == 2
+        assert response.results[1].errors == ["email is not valid"]
+        assert repository.get_by_id(response.results[0].id).title == "First Report"
+        assert repository.get_by_id(response.results[2].id).title == "Second Report"
+        assert repository.count() == 2
@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+import pytest
+
+from src.report.application.use_cases.export_reports import (
+    ExportReports,
+    ExportReportsRequest,
+)
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.infrastructure.in_memory_report_repository import (
+    InMemoryReportRepository,
+)
+
+
+class TestExportReports:
+    @pytest.fixture
+    def in_memory_repository(self) -> InMemoryReportRepository:
+        return InMemoryReportRepository(
+            [
+                Report(
+                    id=uuid4(),
+                    name=f"User {i}",
+                    email=f"user{i}@example.com",
+                    title=f"Report Title {i}",
+                    complaint=f"Complaint details {i}",
+                    report_type=ReportType.DATA_LEAK if i % 2 else ReportType.OTHER,
+                    report_status=ReportStatus.PENDING,
+                )
+                for i in range(5)
+            ]
+        )
+
+    def test_export_all_reports(self, in_memory_repository):
+        response = ExportReports(in_memory_repository).execute(
+            ExportReportsRequest(order_by="-title")
+        )
+
+        rows = list(response.rows)
+        assert [row[response.fields.index("title")] for row in rows] == [
+            f"Report Title {i}" for i in reversed(range(5))
+        ]
+        assert all(len(row) == len(response.fields) for row in rows)
+
+    def test_export_with_filters(self, in_memory_repository):
+        response = ExportReports(in_memory_repository).execute(
+            ExportReportsRequest(report_type=["DATA_LEAK"], search_query="user3")
+        )
+
+        rows = list(response.rows)
+        assert len(rows) == 1
+        assert rows[0][response.fields.index("email")] == "user3@example.com"
@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from src.report.application.use_cases.exceptions import InvalidListReportRequest
 from src.report.application.use_cases.list_report import ListReport, ListReportRequest
 from src.report.domain.report import Report
 from src.report.domain.value_objects import ReportStatus, ReportType
@@ -171,3 +172,142 @@ class TestListReports:
             ListReportRequest(search_query="nonexistent")
         )
         assert len(no_results_response.data) == 0
+
+    def test_list_reports_cursor_pagination(
+        self, list_report_use_case, in_memory_repository, sample_reports
+    ):
+        for report in sample_reports:
+            in_memory_repository.save(report)
+
+        seen_titles = []
+        cursor = None
+        while True:
+            response = list_report_use_case.execute(
+                ListReportRequest(per_page=3, cursor=cursor)
+            )
+            seen_titles.extend(report.title for report in response.data)
+            cursor = response.meta.next_cursor
+            if cursor is None:
+                break
+
+        assert seen_titles == sorted(report.title for report in sample_reports)
+
+    def test_list_reports_cursor_pagination_descending(
+        self, list_report_use_case, in_memory_repository, sample_reports
+    ):
+        for report in sample_reports:
+            in_memory_repository.save(report)
+
+        first_page = list_report_use_case.execute(
+            ListReportRequest(order_by="-title", per_page=4)
+        )
+        second_page = list_report_use_case.execute(
+            ListReportRequest(
+                order_by="-title", per_page=4, cursor=first_page.meta.next_cursor
+            )
+        )
+
+        assert [report.title for report in second_page.data] == [
+            "Report Title 5",
+            "Report Title 4",
+            "Report Title 3",
+            "Report Title 2",
+        ]
+        assert second_page.meta.next_cursor is not None
+
+    def test_list_reports_cursor_ties_are_broken_by_id(
+        self, list_report_use_case, in_memory_repository
+    ):
+        for _ in range(5):
+            in_memory_repository.save(
+                Report(
+                    id=uuid4(),
+                    title="Same Title",
+                    complaint="Same complaint",
+                    report_type=ReportType.DATA_LEAK,
+                )
+            )
+
+        first_page = list_report_use_case.execute(ListReportRequest(per_page=2))
+        second_page = list_report_use_case.execute(
+            ListReportRequest(per_page=3, cursor=first_page.meta.next_cursor)
+        )
+
+        ids = [report.id for report in first_page.data + second_page.data]
+        assert len(set(ids)) == 5
+        assert second_page.meta.next_cursor is None
+
+    def test_list_reports_cursor_must_match_order_by(
+        self, list_report_use_case, in_memory_repository, sample_reports
+    ):
+        for report in sample_reports:
+            in_memory_repository.save(report)
+
+        response = list_report_use_case.execute(ListReportRequest(per_page=2))
+
+        with pytest.raises(InvalidListReportRequest):
+            list_report_use_case.execute(
+                ListReportRequest(
+                    order_by="-title", per_page=2, cursor=response.meta.next_cursor
+                )
+            )
+
+    def test_list_reports_order_by_relevance(
+        self, list_report_use_case, in_memory_repository
+    ):
+        weak = Report(
+            id=uuid4(),
+            title="Report",
+            complaint="A leak",
+            report_type=ReportType.DATA_LEAK,
+        )
+        strong = Report(
+            id=uuid4(),
+            title="Leak",
+            complaint="Leak leak leak",
+            report_type=ReportType.DATA_LEAK,
+        )
+        in_memory_repository.save(weak)
+        in_memory_repository.save(strong)
+
+        response = list_report_use_case.execute(
+            ListReportRequest(order_by="relevance", search_query="leak", per_page=1)
+        )
+
+        assert [report.id for report in response.data] == [strong.id]
+        assert response.meta.total == 2
+        assert response.meta.next_cursor is None
+
+    def test_list_reports_filtered_by_status_and_type(
+        self, list_report_use_case, in_memory_repository, sample_reports
+    ):
+        for report in sample_reports:
+            in_memory_repository.save(report)
+
+        response = list_report_use_case.execute(
+            ListReportRequest(report_status=["PENDING"], report_type=["DATA_LEAK"])
+        )
+
+        assert [report.title for report in response.data] == [
+            "Report Title 0",
+            "Report Title 2",
+            "Report Title 4",
+        ]
+        assert response.meta.total == 3
+
+    def test_list_reports_filtered_by_several_statuses(
+        self, list_report_use_case, in_memory_repository, sample_reports
+    ):
+        for report in sample_reports:
+            in_memory_repository.save(report)
+
+        response = list_report_use_case.execute(
+            ListReportRequest(
+                report_status=["PENDING", "PROCESSING"],
+                report_type=["OTHER"],
+                search_query="Title 7",
+            )
+        )
+
+        assert [report.title for report in response.data] == ["Report Title 7"]
+        assert response.meta.total == 1
@@ -4,6 +4,7 @@ import pytest
 
 from src.report.application.use_cases.exceptions import ReportNotFound
 from src.report.application.use_cases.update_report import (
+    PartialUpdateReport,
     UpdateReport,
     UpdateReportRequest,
 )
@@ -90,3 +91,29 @@ class TestUpdateReport:
         assert updated_report.report_status == ReportStatus.PENDING
         assert updated_report.name == "John Doe"
         assert str(updated_report.email) == "john@example.com"
+
+
+class TestPartialUpdateReport:
+    def test_partial_update_report(self):
+        report = Report(
+            title="Original Title",
+            complaint="Original Complaint",
+            report_type=ReportType.DATA_LEAK,
+        )
+        repository = InMemoryReportRepository([report])
+        update_use_case = PartialUpdateReport(repository)
+
+        update_use_case.execute(
+            UpdateReportRequest(id=report.id, report_status=ReportStatus.COMPLETED)
+        )
+
+        updated_report = repository.get_by_id(report.id)
+        assert updated_report.title == "Original Title"
+        assert updated_report.report_status == ReportStatus.COMPLETED
+        assert repository.list(report_status=[ReportStatus.COMPLETED]) == [report]
+
+    def test_partial_update_report_not_found(self):
+        update_use_case = PartialUpdateReport(InMemoryReportRepository())
+
+        with pytest.raises(ReportNotFound):
+            update_use_case.execute(UpdateReportRequest(id=uuid4(), title="Title"))
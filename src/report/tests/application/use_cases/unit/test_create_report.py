@@ -1,13 +1,16 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
 from src.report.application.use_cases.create_report import (
+    AsyncCreateReport,
     CreateReport,
     CreateReportRequest,
     CreateReportResponse,
 )
 from src.report.application.use_cases.exceptions import InvalidReport
+from src.report.domain.async_report_repository import AsyncReportRepository
 from src.report.domain.report import Report
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
@@ -111,3 +114,33 @@ class TestCreateReport:
 
         with pytest.raises(Exception, match="Repository save failed"):
             create_report_use_case.execute(request)
+
+
+class TestAsyncCreateReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=AsyncReportRepository)
+
+    def test_create_report_successfully(self, mock_repository):
+        request = CreateReportRequest(
+            title="Test Report",
+            complaint="This is a test complaint",
+            report_type=ReportType.DATA_LEAK,
+        )
+
+        response = asyncio.run(AsyncCreateReport(mock_repository).execute(request))
+
+        mock_repository.asave.assert_awaited_once()
+        saved_report = mock_repository.asave.call_args[0][0]
+        assert isinstance(saved_report, Report)
+        assert response == CreateReportResponse(id=saved_report.id)
+
+    def test_create_invalid_report(self, mock_repository):
+        request = CreateReportRequest(
+            title="", complaint="Test complaint", report_type=ReportType.DATA_LEAK
+        )
+
+        with pytest.raises(InvalidReport):
+            asyncio.run(AsyncCreateReport(mock_repository).execute(request))
+
+        mock_repository.asave.assert_not_called()
@@ -0,0 +1,111 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src import config
+from src.report.application.use_cases.create_report import CreateReportRequest
+from src.report.application.use_cases.create_reports import (
+    CreateReports,
+    CreateReportsRequest,
+)
+from src.report.application.use_cases.exceptions import InvalidReport
+from src.report.domain.report import Report
+from src.report.domain.report_repository import ReportRepository
+from src.report.domain.value_objects import ReportType
+
+
+class TestCreateReports:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=ReportRepository)
+
+    @pytest.fixture
+    def create_reports_use_case(self, mock_repository):
+        return CreateReports(repository=mock_repository)
+
+    def test_create_reports_saves_all_valid_reports_at_once(
+        self, create_reports_use_case, mock_repository
+    ):
+        request = CreateReportsRequest(
+            reports=[
+                CreateReportRequest(
+                    title=f"Report {index}",
+                    complaint="Complaint",
+                    report_type=ReportType.DATA_LEAK,
+                )
+                for index in range(3)
+            ]
+        )
+
+        response = create_reports_use_case.execute(request)
+
+        assert response.created == 3
+        mock_repository.save_many.assert_called_once()
+        saved_reports = mock_repository.save_many.call_args[0][0]
+        assert all(isinstance(report, Report) for report in saved_reports)
+        assert [result.id for result in response.results] == [
+            report.id for report in saved_reports
+        ]
+        mock_repository.save.assert_not_called()
+
+    def test_create_reports_collects_errors_per_item(
+        self, create_reports_use_case, mock_repository
+    ):
+        request = CreateReportsRequest(
+            reports=[
+                CreateReportRequest(
+                    title="Valid",
+                    complaint="Complaint",
+                    report_type=ReportType.DATA_LEAK,
+                ),
+                CreateReportRequest(
+                    title="",
+                    complaint="Complaint",
+                    report_type="INVALID_TYPE",
+                ),
+            ]
+        )
+
+        response = create_reports_use_case.execute(request)
+
+        valid, invalid = response.results
+        assert valid.id is not None
+        assert valid.errors == []
+        assert invalid.id is None
+        assert invalid.errors == [
+            "title cannot be empty",
+            "report_type must be a valid ReportType",
+        ]
+        assert response.created == 1
+        assert len(mock_repository.save_many.call_args[0][0]) == 1
+
+    def test_create_reports_without_valid_reports_does_not_save(
+        self, create_reports_use_case, mock_repository
+    ):
+        request = CreateReportsRequest(
+            reports=[
+                CreateReportRequest(
+                    title="", complaint="", report_type=ReportType.DATA_LEAK
+                )
+            ]
+        )
+
+        response = create_reports_use_case.execute(request)
+
+        assert response.created == 0
+        mock_repository.save_many.assert_not_called()
+
+    def test_create_reports_rejects_oversized_batches(
+        self, create_reports_use_case, mock_repository
+    ):
+        item = CreateReportRequest(
+            title="Report", complaint="Complaint", report_type=ReportType.OTHER
+        )
+        request = CreateReportsRequest(
+            reports=[item] * (config.MAX_BULK_CREATE_SIZE + 1)
+        )
+
+        with pytest.raises(InvalidReport):
+            create_reports_use_case.execute(request)
+
+        mock_repository.save_many.assert_not_called()
@@ -1,13 +1,16 @@
+import asyncio
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
 from src.report.application.use_cases.delete_report import (
+    AsyncDeleteReport,
     DeleteReport,
     DeleteReportRequest,
 )
 from src.report.application.use_cases.exceptions import ReportNotFound
+from src.report.domain.async_report_repository import AsyncReportRepository
 from src.report.domain.report_repository import ReportRepository
 
 
@@ -23,20 +26,20 @@ def mock_report():
 class TestDeleteReport:
     def test_delete_report_successful(self, mock_report):
         mock_repository = Mock(spec=ReportRepository)
-        mock_repository.get_by_id.return_value = mock_report
+        mock_repository.delete.return_value = True
 
         delete_report_use_case = DeleteReport(mock_repository)
         request = DeleteReportRequest(id=mock_report.id)
 
         delete_report_use_case.execute(request)
 
-        mock_repository.get_by_id.assert_called_once_with(mock_report.id)
+        mock_repository.get_by_id.assert_not_called()
         mock_repository.delete.assert_called_once_with(mock_report.id)
 
     def test_delete_report_not_found(self):
         non_existent_id = uuid4()
         mock_repository = Mock(spec=ReportRepository)
-        mock_repository.get_by_id.return_value = None
+        mock_repository.delete.return_value = False
 
         delete_report_use_case = DeleteReport(mock_repository)
         request = DeleteReportRequest(id=non_existent_id)
@@ -45,12 +48,11 @@ class TestDeleteReport:
             delete_report_use_case.execute(request)
 
         assert str(exc_info.value) == f"Report with {non_existent_id} not found"
-        mock_repository.get_by_id.assert_called_once_with(non_existent_id)
-        mock_repository.delete.assert_not_called()
+        mock_repository.get_by_id.assert_not_called()
+        mock_repository.delete.assert_called_once_with(non_existent_id)
 
     def test_delete_report_repository_error(self, mock_report):
         mock_repository = Mock(spec=ReportRepository)
-        mock_repository.get_by_id.return_value = mock_report
         mock_repository.delete.side_effect = Exception("Repository error")
 
         delete_report_use_case = DeleteReport(mock_repository)
@@ -59,5 +61,23 @@ class TestDeleteReport:
         with pytest.raises(Exception, match="Repository error"):
             delete_report_use_case.execute(request)
 
-        mock_repository.get_by_id.assert_called_once_with(mock_report.id)
         mock_repository.delete.assert_called_once_with(mock_report.id)
+
+
+class TestAsyncDeleteReport:
+    def test_delete_report_successful(self, mock_report):
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.adelete.return_value = True
+
+        use_case = AsyncDeleteReport(mock_repository)
+        asyncio.run(use_case.execute(DeleteReportRequest(id=mock_report.id)))
+
+        mock_repository.adelete.assert_awaited_once_with(mock_report.id)
+
+    def test_delete_report_not_found(self, mock_report):
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.adelete.return_value = False
+
+        use_case = AsyncDeleteReport(mock_repository)
+        with pytest.raises(ReportNotFound):
+            asyncio.run(use_case.execute(DeleteReportRequest(id=mock_report.id)))
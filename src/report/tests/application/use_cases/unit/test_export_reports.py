@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.report.application.use_cases.exceptions import InvalidListReportRequest
+from src.report.application.use_cases.export_reports import (
+    ExportReports,
+    ExportReportsRequest,
+)
+from src.report.domain.report_repository import EXPORT_FIELDS
+from src.report.domain.value_objects import ReportStatus, ReportType
+
+
+class TestExportReports:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock()
+
+    def test_export_streams_repository_rows(self, mock_repository):
+        rows = iter([("id", "Title")])
+        mock_repository.export.return_value = rows
+        use_case = ExportReports(mock_repository)
+
+        response = use_case.execute(
+            ExportReportsRequest(
+                order_by="-email",
+                search_query="leak",
+                report_status=["PENDING"],
+                report_type=[ReportType.OTHER],
+            )
+        )
+
+        assert response.fields == EXPORT_FIELDS
+        assert response.rows is rows
+        mock_repository.export.assert_called_once_with(
+            "-email",
+            "leak",
+            report_status=[ReportStatus.PENDING],
+            report_type=[ReportType.OTHER],
+        )
+
+    @pytest.mark.parametrize(
+        "request_data",
+        [
+            {"order_by": "complaint"},
+            {"report_status": ["UNKNOWN"]},
+            {"report_type": ["UNKNOWN"]},
+        ],
+    )
+    def test_invalid_request(self, mock_repository, request_data):
+        use_case = ExportReports(mock_repository)
+
+        with pytest.raises(InvalidListReportRequest):
+            use_case.execute(ExportReportsRequest(**request_data))
+
+        mock_repository.export.assert_not_called()
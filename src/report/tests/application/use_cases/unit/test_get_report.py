@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 from uuid import uuid4
 
@@ -5,10 +6,15 @@ import pytest
 
 from src.report.application.use_cases.exceptions import ReportNotFound
 from src.report.application.use_cases.get_report import (
+    AsyncGetReport,
+    AsyncGetReportVersion,
     GetReport,
     GetReportRequest,
     GetReportResponse,
+    GetReportVersion,
 )
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.report import ReportVersion
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
@@ -109,3 +115,84 @@ class TestGetReportVariations:
         response = use_case.execute(request)
 
         assert response.report_status == report_status
+
+
+class TestGetReportVersion:
+    def test_returns_version_without_fetching_report(self):
+        mock_repository = Mock(spec=ReportRepository)
+        report_id = uuid4()
+        mock_repository.get_version.return_value = ReportVersion(report_id, 3)
+
+        response = GetReportVersion(mock_repository).execute(
+            GetReportRequest(id=report_id)
+        )
+
+        assert response.id == report_id
+        assert response.version == 3
+        mock_repository.get_by_id.assert_not_called()
+
+    def test_report_not_found(self):
+        mock_repository = Mock(spec=ReportRepository)
+        mock_repository.get_version.return_value = None
+
+        with pytest.raises(ReportNotFound):
+            GetReportVersion(mock_repository).execute(GetReportRequest(id=uuid4()))
+
+
+class TestAsyncGetReportVersion:
+    def test_returns_version_without_fetching_report(self):
+        mock_repository = Mock(spec=AsyncReportRepository)
+        report_id = uuid4()
+        mock_repository.aget_version.return_value = ReportVersion(report_id, 3)
+
+        response = asyncio.run(
+            AsyncGetReportVersion(mock_repository).execute(
+                GetReportRequest(id=report_id)
+            )
+        )
+
+        assert response.version == 3
+        mock_repository.aget_by_id.assert_not_called()
+
+    def test_report_not_found(self):
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.aget_version.return_value = None
+        use_case = AsyncGetReportVersion(mock_repository)
+
+        with pytest.raises(ReportNotFound):
+            asyncio.run(use_case.execute(GetReportRequest(id=uuid4())))
+
+
+class TestAsyncGetReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=AsyncReportRepository)
+
+    def test_successful_report_retrieval(self, mock_repository):
+        report = Mock(
+            id=uuid4(),
+            name="John Doe",
+            email="john.doe@example.com",
+            title="Sample Report",
+            complaint="This is a test complaint",
+            report_type=ReportType.DATA_LEAK,
+            report_status=ReportStatus.PENDING,
+            version=2,
+            updated_at=None,
+        )
+        mock_repository.aget_by_id.return_value = report
+        use_case = AsyncGetReport(mock_repository)
+
+        response = asyncio.run(use_case.execute(GetReportRequest(id=report.id)))
+
+        assert response.id == report.id
+        assert response.title == "Sample Report"
+        assert response.version == 2
+        mock_repository.aget_by_id.assert_awaited_once_with(report.id)
+
+    def test_report_not_found(self, mock_repository):
+        mock_repository.aget_by_id.return_value = None
+        use_case = AsyncGetReport(mock_repository)
+
+        with pytest.raises(ReportNotFound):
+            asyncio.run(use_case.execute(GetReportRequest(id=uuid4())))
@@ -1,14 +1,19 @@
+import asyncio
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
 from src import config
+from src.report.application.use_cases.exceptions import InvalidListReportRequest
 from src.report.application.use_cases.list_report import (
+    AsyncListReport,
     ListReport,
     ListReportRequest,
     ReportOutput,
 )
+from src.report.domain.async_report_repository import AsyncReportRepository
+from src.report.domain.cursor import Cursor
 from src.report.domain.report_repository import ReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
@@ -23,6 +28,8 @@ class MockReport:
         complaint="Test Complaint",
         report_type=ReportType.DATA_LEAK,
         report_status=ReportStatus.PENDING,
+        version=1,
+        updated_at=None,
     ):
         self.id = id or uuid4()
         self.name = name
@@ -31,6 +38,8 @@ class MockReport:
         self.complaint = complaint
         self.report_type = report_type
         self.report_status = report_status
+        self.version = version
+        self.updated_at = updated_at
 
 
 class TestListReport:
@@ -41,8 +50,9 @@ class TestListReport:
 
     def test_default_pagination(self):
 
-        mock_reports = [MockReport() for _ in range(15)]
+        mock_reports = [MockReport() for _ in range(config.DEFAULT_PAGINATION_SIZE)]
         self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 15
 
         request = ListReportRequest()
         response = self.list_report_use_case.execute(request)
@@ -52,12 +62,21 @@ class TestListReport:
         assert response.meta.per_page == config.DEFAULT_PAGINATION_SIZE
         assert response.meta.total == 15
         self.mock_repository.list.assert_called_once_with(
-            "title", 1, config.DEFAULT_PAGINATION_SIZE, None
+            "title",
+            1,
+            config.DEFAULT_PAGINATION_SIZE,
+            None,
+            report_status=None,
+            report_type=None,
+        )
+        self.mock_repository.count.assert_called_once_with(
+            None, report_status=None, report_type=None
         )
 
     def test_custom_pagination(self):
-        mock_reports = [MockReport() for _ in range(30)]
+        mock_reports = [MockReport() for _ in range(10)]
         self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 30
 
         request = ListReportRequest(
             current_page=2, per_page=10, order_by="report_type", search_query="test"
@@ -68,17 +87,45 @@ class TestListReport:
         assert response.meta.current_page == 2
         assert response.meta.per_page == 10
         assert response.meta.total == 30
-        self.mock_repository.list.assert_called_once_with("report_type", 2, 10, "test")
+        self.mock_repository.list.assert_called_once_with(
+            "report_type", 2, 10, "test", report_status=None, report_type=None
+        )
+        self.mock_repository.count.assert_called_once_with(
+            "test", report_status=None, report_type=None
+        )
+
+    def test_page_is_not_sliced_again(self):
+        mock_reports = [MockReport() for _ in range(5)]
+        self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 25
+
+        request = ListReportRequest(current_page=3, per_page=10)
+        response = self.list_report_use_case.execute(request)
+
+        assert [report.id for report in response.data] == [
+            report.id for report in mock_reports
+        ]
+        assert response.meta.total == 25
+        assert response.meta.next_cursor is None
 
     def test_max_pagination_size(self):
-        mock_reports = [MockReport() for _ in range(50)]
+        mock_reports = [MockReport() for _ in range(config.MAX_PAGINATION_SIZE)]
         self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 200
 
         request = ListReportRequest(per_page=config.MAX_PAGINATION_SIZE + 100)
         response = self.list_report_use_case.execute(request)
 
         assert len(response.data) == config.MAX_PAGINATION_SIZE
         assert response.meta.per_page == config.MAX_PAGINATION_SIZE
+        self.mock_repository.list.assert_called_once_with(
+            "title",
+            1,
+            config.MAX_PAGINATION_SIZE,
+            None,
+            report_status=None,
+            report_type=None,
+        )
 
     def test_output_mapping(self):
         report_id = uuid4()
@@ -94,6 +141,7 @@ class TestListReport:
             )
         ]
         self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 1
 
         request = ListReportRequest()
         response = self.list_report_use_case.execute(request)
@@ -108,6 +156,153 @@ class TestListReport:
         assert report_output.report_type == ReportType.DATA_LEAK
         assert report_output.report_status == ReportStatus.PENDING
 
+    def test_next_cursor_points_at_last_report_of_page(self):
+        mock_reports = [MockReport(title=f"Title {i}") for i in range(10)]
+        self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 15
+
+        response = self.list_report_use_case.execute(ListReportRequest())
+
+        cursor = Cursor.decode(response.meta.next_cursor)
+        assert cursor.order_by == "title"
+        assert cursor.value == "Title 9"
+        assert cursor.id == mock_reports[9].id
+
+    def test_no_next_cursor_on_last_page(self):
+        self.mock_repository.list.return_value = [MockReport() for _ in range(5)]
+        self.mock_repository.count.return_value = 5
+
+        response = self.list_report_use_case.execute(ListReportRequest())
+
+        assert response.meta.next_cursor is None
+
+    def test_cursor_pagination(self):
+        cursor = Cursor(order_by="title", value="Title 9", id=uuid4())
+        mock_reports = [MockReport() for _ in range(11)]
+        self.mock_repository.list.return_value = mock_reports
+        self.mock_repository.count.return_value = 40
+
+        request = ListReportRequest(per_page=10, cursor=cursor.encode())
+        response = self.list_report_use_case.execute(request)
+
+        assert len(response.data) == 10
+        assert response.meta.next_cursor is not None
+        self.mock_repository.list.assert_called_once_with(
+            "title",
+            None,
+            11,
+            None,
+            cursor=cursor,
+            report_status=None,
+            report_type=None,
+        )
+        self.mock_repository.count.assert_not_called()
+        assert response.meta.total is None
+
+    def test_cursor_pagination_with_total(self):
+        cursor = Cursor(order_by="title", value="Title 9", id=uuid4())
+        self.mock_repository.list.return_value = [MockReport() for _ in range(3)]
+        self.mock_repository.count.return_value = 40
+
+        request = ListReportRequest(
+            per_page=10, cursor=cursor.encode(), include_total=True
+        )
+        response = self.list_report_use_case.execute(request)
+
+        assert response.meta.total == 40
+        self.mock_repository.count.assert_called_once()
+
+    def test_filters_are_passed_as_members(self):
+        self.mock_repository.list.return_value = []
+        self.mock_repository.count.return_value = 0
+
+        request = ListReportRequest(
+            report_status=["PENDING", ReportStatus.PROCESSING],
+            report_type=["DATA_LEAK"],
+        )
+        self.list_report_use_case.execute(request)
+
+        self.mock_repository.list.assert_called_once_with(
+            "title",
+            1,
+            config.DEFAULT_PAGINATION_SIZE,
+            None,
+            report_status=[ReportStatus.PENDING, ReportStatus.PROCESSING],
+            report_type=[ReportType.DATA_LEAK],
+        )
+        self.mock_repository.count.assert_called_once_with(
+            None,
+            report_status=[ReportStatus.PENDING, ReportStatus.PROCESSING],
+            report_type=[ReportType.DATA_LEAK],
+        )
+
+    @pytest.mark.parametrize(
+        "filters",
+        [{"report_status": ["DONE"]}, {"report_type": ["DATA LEAK", "OTHER"]}],
+    )
+    def test_invalid_filters(self, filters):
+        request = ListReportRequest(**filters)
+
+        with pytest.raises(InvalidListReportRequest):
+            self.list_report_use_case.execute(request)
+
+        self.mock_repository.list.assert_not_called()
+
+    @pytest.mark.parametrize("order_by", ["complaint", "-name", "id", ""])
+    def test_order_by_must_be_sortable(self, order_by):
+        request = ListReportRequest(order_by=order_by)
+
+        with pytest.raises(InvalidListReportRequest):
+            self.list_report_use_case.execute(request)
+
+        self.mock_repository.list.assert_not_called()
+
+    def test_invalid_cursor(self):
+        request = ListReportRequest(cursor="not-a-cursor")
+
+        with pytest.raises(InvalidListReportRequest):
+            self.list_report_use_case.execute(request)
+
+        self.mock_repository.list.assert_not_called()
+
+
+class TestAsyncListReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=AsyncReportRepository)
+
+    def test_pages_like_list_report(self, mock_repository):
+        mock_repository.alist.return_value = [MockReport() for _ in range(3)]
+        mock_repository.acount.return_value = 5
+        use_case = AsyncListReport(mock_repository)
+
+        response = asyncio.run(
+            use_case.execute(ListReportRequest(per_page=3, report_status=["PENDING"]))
+        )
+
+        assert len(response.data) == 3
+        assert response.meta.total == 5
+        assert response.meta.next_cursor is not None
+        mock_repository.alist.assert_awaited_once_with(
+            "title",
+            1,
+            3,
+            None,
+            report_status=[ReportStatus.PENDING],
+            report_type=None,
+        )
+        mock_repository.acount.assert_awaited_once_with(
+            None, report_status=[ReportStatus.PENDING], report_type=None
+        )
+
+    def test_invalid_order_by(self, mock_repository):
+        use_case = AsyncListReport(mock_repository)
+
+        with pytest.raises(InvalidListReportRequest):
+            asyncio.run(use_case.execute(ListReportRequest(order_by="complaint")))
+
+        mock_repository.alist.assert_not_called()
+
 
 @pytest.fixture
 def mock_repository():
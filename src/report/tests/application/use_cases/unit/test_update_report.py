@@ -1,13 +1,22 @@
+import asyncio
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
-from src.report.application.use_cases.exceptions import InvalidReport, ReportNotFound
+from src.report.application.use_cases.exceptions import (
+    ConcurrentModification,
+    InvalidReport,
+    ReportNotFound,
+)
 from src.report.application.use_cases.update_report import (
+    AsyncPartialUpdateReport,
+    AsyncUpdateReport,
+    PartialUpdateReport,
     UpdateReport,
     UpdateReportRequest,
 )
+from src.report.domain.async_report_repository import AsyncReportRepository
 from src.report.domain.value_objects import ReportStatus, ReportType
 
 
@@ -122,3 +131,192 @@ class TestUpdateReport:
             name="John Doe",
             email="john@example.com",
         )
+
+    def test_update_report_deleted_before_update(
+        self, mock_repository, existing_report
+    ):
+        mock_repository.get_by_id.return_value = existing_report
+        mock_repository.update.return_value = False
+        mock_repository.get_version.return_value = None
+        update_use_case = UpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(id=existing_report.id, title="Title")
+
+        with pytest.raises(ReportNotFound):
+            update_use_case.execute(update_request)
+
+    def test_update_report_stale_version(self, mock_repository, existing_report):
+        existing_report.version = 3
+        mock_repository.get_by_id.return_value = existing_report
+        update_use_case = UpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(
+            id=existing_report.id, title="Title", version=2
+        )
+
+        with pytest.raises(ConcurrentModification) as exc_info:
+            update_use_case.execute(update_request)
+
+        assert str(exc_info.value) == (
+            f"Report with {existing_report.id} was modified, "
+            "expected version 2 but found 3"
+        )
+        mock_repository.update.assert_not_called()
+
+    def test_update_report_modified_before_update(
+        self, mock_repository, existing_report
+    ):
+        existing_report.version = 2
+        mock_repository.get_by_id.return_value = existing_report
+        mock_repository.update.return_value = False
+        mock_repository.get_version.return_value = Mock(version=3)
+        update_use_case = UpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(
+            id=existing_report.id, title="Title", version=2
+        )
+
+        with pytest.raises(ConcurrentModification):
+            update_use_case.execute(update_request)
+
+
+class TestAsyncUpdateReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=AsyncReportRepository)
+
+    def test_update_report_success(self, mock_repository):
+        report = Mock(id=uuid4(), version=1)
+        mock_repository.aget_by_id.return_value = report
+        mock_repository.aupdate.return_value = True
+        use_case = AsyncUpdateReport(mock_repository)
+
+        request = UpdateReportRequest(id=report.id, title="Updated Title", version=1)
+        asyncio.run(use_case.execute(request))
+
+        mock_repository.aupdate.assert_awaited_once_with(report)
+        assert report.update_report.call_args.kwargs["title"] == "Updated Title"
+
+    def test_update_report_not_found(self, mock_repository):
+        mock_repository.aget_by_id.return_value = None
+        use_case = AsyncUpdateReport(mock_repository)
+
+        with pytest.raises(ReportNotFound):
+            asyncio.run(use_case.execute(UpdateReportRequest(id=uuid4(), title="T")))
+
+        mock_repository.aupdate.assert_not_called()
+
+    def test_update_report_modified_before_update(self, mock_repository):
+        report = Mock(id=uuid4(), version=2)
+        mock_repository.aget_by_id.return_value = report
+        mock_repository.aupdate.return_value = False
+        mock_repository.aget_version.return_value = Mock(version=3)
+        use_case = AsyncUpdateReport(mock_repository)
+
+        request = UpdateReportRequest(id=report.id, title="Title", version=2)
+        with pytest.raises(ConcurrentModification):
+            asyncio.run(use_case.execute(request))
+
+
+class TestPartialUpdateReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock()
+
+    def test_partial_update_writes_only_given_fields(self, mock_repository):
+        mock_repository.update_fields.return_value = True
+        report_id = uuid4()
+        update_use_case = PartialUpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(
+            id=report_id, report_status=ReportStatus.COMPLETED, name=""
+        )
+
+        update_use_case.execute(update_request)
+
+        mock_repository.update_fields.assert_called_once_with(
+            report_id, {"report_status": ReportStatus.COMPLETED, "name": ""}
+        )
+        mock_repository.get_by_id.assert_not_called()
+
+    def test_partial_update_not_found(self, mock_repository):
+        mock_repository.update_fields.return_value = False
+        non_existent_id = uuid4()
+        update_use_case = PartialUpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(id=non_existent_id, title="Title")
+
+        with pytest.raises(ReportNotFound) as exc_info:
+            update_use_case.execute(update_request)
+
+        assert str(exc_info.value) == f"Report with {non_existent_id} not found"
+
+    def test_partial_update_invalid_report(self, mock_repository):
+        update_use_case = PartialUpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(id=uuid4(), report_type="WRONG")
+
+        with pytest.raises(InvalidReport) as exc_info:
+            update_use_case.execute(update_request)
+
+        assert str(exc_info.value) == "report_type must be a valid ReportType"
+        mock_repository.update_fields.assert_not_called()
+
+    def test_partial_update_with_version(self, mock_repository):
+        mock_repository.update_fields.return_value = True
+        report_id = uuid4()
+        update_use_case = PartialUpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(id=report_id, title="Title", version=4)
+
+        response = update_use_case.execute(update_request)
+
+        mock_repository.update_fields.assert_called_once_with(
+            report_id, {"title": "Title"}, version=4
+        )
+        assert response.version == 5
+
+    def test_partial_update_stale_version(self, mock_repository):
+        mock_repository.update_fields.return_value = False
+        mock_repository.get_version.return_value = Mock(version=5)
+        update_use_case = PartialUpdateReport(mock_repository)
+
+        update_request = UpdateReportRequest(id=uuid4(), title="Title", version=4)
+
+        with pytest.raises(ConcurrentModification):
+            update_use_case.execute(update_request)
+
+
+class TestAsyncPartialUpdateReport:
+    @pytest.fixture
+    def mock_repository(self):
+        return Mock(spec=AsyncReportRepository)
+
+    def test_partial_update_with_version(self, mock_repository):
+        mock_repository.aupdate_fields.return_value = True
+        report_id = uuid4()
+        use_case = AsyncPartialUpdateReport(mock_repository)
+
+        request = UpdateReportRequest(id=report_id, title="Title", version=1)
+        response = asyncio.run(use_case.execute(request))
+
+        mock_repository.aupdate_fields.assert_awaited_once_with(
+            report_id, {"title": "Title"}, version=1
+        )
+        assert response.version == 2
+
+    def test_partial_update_not_found(self, mock_repository):
+        mock_repository.aupdate_fields.return_value = False
+        use_case = AsyncPartialUpdateReport(mock_repository)
+
+        with pytest.raises(ReportNotFound):
+            asyncio.run(use_case.execute(UpdateReportRequest(id=uuid4(), name="")))
+
+    def test_partial_update_stale_version(self, mock_repository):
+        mock_repository.aupdate_fields.return_value = False
+        mock_repository.aget_version.return_value = Mock(version=3)
+        use_case = AsyncPartialUpdateReport(mock_repository)
+
+        request = UpdateReportRequest(id=uuid4(), title="Title", version=1)
+        with pytest.raises(ConcurrentModification):
+            asyncio.run(use_case.execute(request))
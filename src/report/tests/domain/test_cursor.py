@@ -0,0 +1,39 @@
+from uuid import uuid4
+
+import pytest
+
+from src.report.domain.cursor import Cursor
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportType
+
+
+class TestCursor:
+    def test_encode_and_decode_round_trip(self):
+        cursor = Cursor(order_by="-title", value="Some Title", id=uuid4())
+
+        decoded = Cursor.decode(cursor.encode())
+
+        assert decoded == cursor
+        assert decoded.field == "title"
+        assert decoded.descending
+
+    def test_for_report_uses_order_by_field_and_id(self):
+        report = Report(
+            id=uuid4(),
+            title="Report Title",
+            complaint="Complaint",
+            report_type=ReportType.DATA_LEAK,
+            email="john@example.com",
+        )
+
+        cursor = Cursor.for_report(report, "email")
+
+        assert cursor.value == "john@example.com"
+        assert cursor.id == report.id
+        assert not cursor.descending
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WzEsMl0"])
+    def test_decode_invalid_token_raises_error(self, token):
+        with pytest.raises(ValueError) as excinfo:
+            Cursor.decode(token)
+        assert "cursor is not valid" in str(excinfo.value)
@@ -25,6 +25,19 @@ class TestReportEntity:
         assert report.report_type == report_type
         assert report.report_status == ReportStatus.PENDING
 
+    def test_report_is_slotted(self):
+        report = Report(
+            title="Slotted Report",
+            complaint="Slotted complaint",
+            email="john.doe@example.com",
+            report_type=ReportType.DATA_LEAK,
+        )
+
+        assert not hasattr(report, "__dict__")
+        assert not hasattr(report.email, "__dict__")
+        with pytest.raises(AttributeError):
+            report.unknown = "value"
+
     def test_report_must_be_created_with_id_as_uuid_by_default(self):
         report_type = ReportType.DATA_LEAK
         report = Report(
@@ -122,6 +135,33 @@ class TestReportEntity:
             )
         assert "email cannot be longer than 255" in str(excinfo.value)
 
+    def test_from_persistence_skips_validation(self):
+        report = Report.from_persistence(
+            id="test-id",
+            title="",
+            complaint="Stored Complaint",
+            report_type="DATA_LEAK",
+            email="stored@example.com",
+        )
+
+        assert report.title == ""
+        assert str(report.email) == "stored@example.com"
+        assert report.report_status == ReportStatus.PENDING
+        assert not report.notification.has_errors
+        assert report.changes == {}
+
+    def test_from_persistence_report_can_be_updated(self):
+        report = Report.from_persistence(
+            id="test-id",
+            title="Stored Title",
+            complaint="Stored Complaint",
+            report_type="DATA_LEAK",
+        )
+
+        report.change(title="Updated Title")
+
+        assert report.changes == {"title": "Updated Title"}
+
 
 class TestUpdateReport:
     def test_update_report_method(self):
@@ -164,6 +204,40 @@ class TestUpdateReport:
                 report_type=report_type,  # Empty title should raise an error
             )
 
+    def test_update_report_tracks_changed_fields(self):
+        report = Report(
+            id="test-id",
+            title="Original Title",
+            complaint="Original Complaint",
+            report_type=ReportType.DATA_LEAK,
+            email="genesluna@gmail.com",
+        )
+        assert report.changes == {}
+
+        report.update_report(
+            title="Updated Title",
+            complaint="Original Complaint",
+            report_type=ReportType.DATA_LEAK,
+            report_status=ReportStatus.PROCESSING,
+            email="genesluna@gmail.com",
+        )
+
+        assert report.changes == {
+            "title": "Updated Title",
+            "report_status": ReportStatus.PROCESSING,
+        }
+
+        report.clear_changes()
+        assert report.changes == {}
+
+    def test_validate_changes_checks_only_given_fields(self):
+        Report.validate_changes({"report_status": ReportStatus.COMPLETED})
+
+        with pytest.raises(ValueError) as excinfo:
+            Report.validate_changes({"title": "", "email": "not-an-email"})
+
+        assert str(excinfo.value) == "title cannot be empty,email is not valid"
+
     def test_str_and_repr_methods(self):
         report_type = ReportType.DATA_LEAK
         report = Report(
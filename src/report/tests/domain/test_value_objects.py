@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from src.report.domain.value_objects import (
+    EMAIL_MAX_LENGTH,
+    Email,
+    _address_errors,
+)
+
+
+class TestEmail:
+    @pytest.mark.parametrize(
+        "address", ["", "john@example.com", "JOHN.DOE@Example.COM", "a@[127.0.0.1]"]
+    )
+    def test_valid_email(self, address):
+        assert Email(address).validate() == []
+
+    @pytest.mark.parametrize("address", ["plainaddress", "@example.com", "john@"])
+    def test_invalid_email(self, address):
+        assert Email(address).validate() == ["email is not valid"]
+
+    def test_email_too_long(self):
+        address = "a" * EMAIL_MAX_LENGTH + "@example.com"
+
+        assert Email(address).validate() == ["email cannot be longer than 255"]
+
+    def test_validation_results_are_cached(self):
+        _address_errors.cache_clear()
+
+        Email("cached@example.com").validate()
+        Email("cached@example.com").validate()
+
+        info = _address_errors.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_validate_returns_a_new_list(self):
+        errors = Email("not-an-email").validate()
+        errors.append("mutated")
+
+        assert Email("not-an-email").validate() == ["email is not valid"]
+
+    def test_pathological_input_is_rejected_quickly(self):
+        _address_errors.cache_clear()
+        address = "a@" + "a-" * 100_000 + "!"
+
+        start = time.perf_counter()
+        errors = Email(address).validate()
+        elapsed = time.perf_counter() - start
+
+        assert errors == ["email cannot be longer than 255"]
+        assert elapsed < 0.01
+        assert _address_errors.cache_info().currsize == 0
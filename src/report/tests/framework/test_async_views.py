@@ -0,0 +1,256 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+from rest_framework import status
+
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.models import ReportModel
+
+
+@pytest.mark.django_db
+class TestAsyncReportViews:
+    @pytest.fixture
+    def client(self):
+        return Client()
+
+    @pytest.fixture
+    def create_report(self):
+        def make_report(**kwargs):
+            data = {
+                "title": "Test Report",
+                "complaint": "This is a test complaint.",
+                "report_type": ReportType.OTHER.name,
+                "name": "Test User",
+                "email": "test@example.com",
+                "report_status": ReportStatus.PENDING.name,
+            }
+            return ReportModel.objects.create(**{**data, **kwargs})
+
+        return make_report
+
+    def test_list_reports_matches_sync_endpoint(self, client, create_report):
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+        params = {"per_page": 2, "order_by": "-title", "report_status": "PENDING"}
+
+        response = client.get(reverse("async-report-list"), params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        sync_response = client.get(reverse("report-list"), params)
+        assert response.json() == sync_response.json()
+        assert [report["title"] for report in response.json()["data"]] == [
+            "C Report",
+            "B Report",
+        ]
+
+    def test_list_reports_not_modified(self, client, create_report):
+        create_report()
+        url = reverse("async-report-list")
+
+        response = client.get(url)
+        assert response["ETag"] == client.get(reverse("report-list"))["ETag"]
+        assert "Last-Modified" in response
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_list_reports_with_invalid_filter(self, client):
+        response = client.get(reverse("async-report-list"), {"report_type": "WRONG"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "report_type must be a valid ReportType"}
+
+    def test_create_report(self, client):
+        data = {
+            "title": "New Report",
+            "complaint": "New complaint.",
+            "report_type": ReportType.DATA_LEAK.name,
+        }
+
+        response = client.post(
+            reverse("async-report-list"), data, content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        report = ReportModel.objects.get(id=response.json()["id"])
+        assert report.title == "New Report"
+
+    @pytest.mark.parametrize("body", ['{"title": ', "[]", '{"title": ""}'])
+    def test_create_report_invalid(self, client, body):
+        response = client.post(
+            reverse("async-report-list"), body, content_type="application/json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retrieve_report(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == f'"{report.id}-1"'
+        sync_url = reverse("report-detail", args=[report.id])
+        assert response.json() == client.get(sync_url).json()
+
+    def test_retrieve_report_not_modified(
+        self, client, create_report, django_assert_num_queries
+    ):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+        etag = client.get(url)["ETag"]
+
+        # Answered from the cached report's version
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+        client.patch(url, {"title": "Updated Report"}, content_type="application/json")
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == f'"{report.id}-2"'
+
+    def test_retrieve_report_not_found(self, client):
+        url = reverse(
+            "async-report-detail", args=["00000000-0000-0000-0000-000000000000"]
+        )
+        assert client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_partial_update_report(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+        data = {"report_status": ReportStatus.COMPLETED.name}
+
+        response = client.patch(
+            url, data, content_type="application/json", HTTP_IF_MATCH=f'"{report.id}-1"'
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == f'"{report.id}-2"'
+
+        response = client.patch(
+            url, data, content_type="application/json", HTTP_IF_MATCH=f'"{report.id}-1"'
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        report.refresh_from_db()
+        assert report.report_status == ReportStatus.COMPLETED.name
+
+    def test_update_report(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+        data = {
+            "title": "Updated Report",
+            "complaint": "Updated complaint.",
+            "report_type": ReportType.DATA_LEAK.name,
+            "report_status": ReportStatus.PROCESSING.name,
+        }
+
+        response = client.put(
+            url, data, content_type="application/json", HTTP_IF_MATCH=f'"{report.id}-1"'
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == f'"{report.id}-2"'
+
+        response = client.put(
+            url, data, content_type="application/json", HTTP_IF_MATCH=f'"{report.id}-1"'
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        report.refresh_from_db()
+        assert report.title == "Updated Report"
+        assert report.report_type == ReportType.DATA_LEAK.name
+        assert client.get(url).json()["data"]["title"] == "Updated Report"
+
+    def test_update_report_requires_every_field(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+
+        response = client.put(
+            url, {"title": "Updated Report"}, content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_update_report_not_found(self, client):
+        url = reverse(
+            "async-report-detail", args=["00000000-0000-0000-0000-000000000000"]
+        )
+        data = {
+            "title": "Updated Report",
+            "complaint": "Updated complaint.",
+            "report_type": ReportType.DATA_LEAK.name,
+            "report_status": ReportStatus.PROCESSING.name,
+        }
+
+        response = client.put(url, data, content_type="application/json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_partial_update_report_invalid(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+        response = client.patch(
+            url, {"report_type": "WRONG"}, content_type="application/json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_delete_report(self, client, create_report):
+        report = create_report()
+        url = reverse("async-report-detail", args=[report.id])
+
+        assert client.delete(url).status_code == status.HTTP_204_NO_CONTENT
+        assert client.delete(url).status_code == status.HTTP_404_NOT_FOUND
+        assert not ReportModel.objects.filter(id=report.id).exists()
+
+    def test_update_invalidates_sync_cache(self, client, create_report):
+        report = create_report()
+        sync_url = reverse("report-detail", args=[report.id])
+        stale_etag = client.get(sync_url)["ETag"]
+        client.get(reverse("report-list"))
+
+        response = client.patch(
+            reverse("async-report-detail", args=[report.id]),
+            {"title": "Updated Report"},
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = client.get(sync_url, HTTP_IF_NONE_MATCH=stale_etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["title"] == "Updated Report"
+        assert response["ETag"] == f'"{report.id}-2"'
+        listed = client.get(reverse("report-list")).json()["data"]
+        assert [item["title"] for item in listed] == ["Updated Report"]
+
+    def test_delete_invalidates_sync_cache(self, client, create_report):
+        report = create_report()
+        sync_url = reverse("report-detail", args=[report.id])
+        assert client.get(sync_url).status_code == status.HTTP_200_OK
+        client.get(reverse("report-list"))
+
+        response = client.delete(reverse("async-report-detail", args=[report.id]))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        assert client.get(sync_url).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(reverse("report-list")).json()["data"] == []
+
+    def test_create_invalidates_sync_list_cache(self, client, create_report):
+        create_report(title="A Report")
+        assert len(client.get(reverse("report-list")).json()["data"]) == 1
+
+        response = client.post(
+            reverse("async-report-list"),
+            {
+                "title": "B Report",
+                "complaint": "New complaint.",
+                "report_type": ReportType.DATA_LEAK.name,
+            },
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        listed = client.get(reverse("report-list")).json()["data"]
+        assert [item["title"] for item in listed] == ["A Report", "B Report"]
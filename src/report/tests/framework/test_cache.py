@@ -0,0 +1,450 @@
+import threading
+import time
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+
+from src.report import cache
+from src.report.cache import GENERATION_KEY, CacheStats, CachedReportRepository
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportStatus
+from src.report.infrastructure.in_memory_report_repository import (
+    InMemoryReportRepository,
+)
+from src.report.repository import (
+    DjangoORMReportRepository,
+    get_async_report_repository,
+    get_report_repository,
+)
+
+
+def make_report(**kwargs):
+    data = {
+        "id": uuid.uuid4(),
+        "title": "Test Report",
+        "complaint": "Sample complaint",
+        "name": "John Doe",
+        "email": "john@example.com",
+        "report_type": "DATA_LEAK",
+        "report_status": "PENDING",
+    }
+    return Report(**{**data, **kwargs})
+
+
+@pytest.fixture
+def stats():
+    return CacheStats()
+
+
+@pytest.fixture
+def repository(stats):
+    return CachedReportRepository(
+        DjangoORMReportRepository(),
+        caches["default"],
+        timeout=300,
+        missing_timeout=30,
+        stats=stats,
+    )
+
+
+@pytest.mark.django_db
+class TestCachedReportRepository:
+    def test_get_by_id_is_read_through(
+        self, repository, stats, django_assert_num_queries
+    ):
+        report = make_report()
+        repository.save(report)
+
+        with django_assert_num_queries(1):
+            first = repository.get_by_id(report.id)
+        with django_assert_num_queries(0):
+            second = repository.get_by_id(report.id)
+
+        assert first == second == report
+        assert second.title == "Test Report"
+        assert str(second.email) == "john@example.com"
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_ratio == 0.5
+
+    def test_missing_ids_are_cached(self, repository, stats, django_assert_num_queries):
+        missing_id = uuid.uuid4()
+
+        with django_assert_num_queries(1):
+            assert repository.get_by_id(missing_id) is None
+        with django_assert_num_queries(0):
+            assert repository.get_by_id(missing_id) is None
+
+        assert stats.hits == 1
+
+    def test_missing_ids_are_not_cached_without_timeout(
+        self, stats, django_assert_num_queries
+    ):
+        repository = CachedReportRepository(
+            DjangoORMReportRepository(), caches["default"], stats=stats
+        )
+        missing_id = uuid.uuid4()
+
+        repository.get_by_id(missing_id)
+        with django_assert_num_queries(1):
+            assert repository.get_by_id(missing_id) is None
+
+    def test_save_invalidates_missing_id(self, repository):
+        report = make_report()
+        assert repository.get_by_id(report.id) is None
+
+        repository.save(report)
+
+        assert repository.get_by_id(report.id) == report
+
+    def test_created_ids_are_not_cached_within_the_replication_lag(
+        self, repository, django_assert_num_queries
+    ):
+        repository.replication_lag = 10
+        report = make_report()
+        repository.save(report)
+
+        # A replica without the report would cache it as missing
+        with django_assert_num_queries(2):
+            assert repository.get_by_id(report.id) == report
+            assert repository.get_by_id(report.id) == report
+
+    def test_save_many_invalidates(self, repository):
+        reports = [make_report(), make_report()]
+        for report in reports:
+            repository.get_by_id(report.id)
+
+        repository.save_many(reports)
+
+        assert all(repository.get_by_id(report.id) is not None for report in reports)
+
+    def test_update_invalidates(self, repository):
+        report = make_report()
+        repository.save(report)
+        cached = repository.get_by_id(report.id)
+
+        cached.change(title="Updated Report")
+        repository.update(cached)
+
+        assert repository.get_by_id(report.id).title == "Updated Report"
+
+    def test_update_fields_invalidates(self, repository):
+        report = make_report()
+        repository.save(report)
+        repository.get_by_id(report.id)
+
+        assert repository.update_fields(report.id, {"report_status": "COMPLETED"})
+
+        assert repository.get_by_id(report.id).report_status == "COMPLETED"
+
+    def test_delete_invalidates(self, repository):
+        report = make_report()
+        repository.save(report)
+        repository.get_by_id(report.id)
+
+        assert repository.delete(report.id) is True
+
+        assert repository.get_by_id(report.id) is None
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda repository, report: repository.update_fields(
+                report.id, {"title": "Renamed"}
+            ),
+            lambda repository, report: repository.delete(report.id),
+        ],
+    )
+    def test_read_racing_a_write_does_not_cache_stale_report(self, repository, write):
+        report = make_report()
+        repository.save(report)
+        inner = repository.repository
+        load = inner.get_by_id
+
+        def load_then_write(id):
+            # The row is read before the write commits, and cached after it
+            stale = load(id)
+            write(repository, report)
+            return stale
+
+        inner.get_by_id = load_then_write
+        assert repository.get_by_id(report.id).title == "Test Report"
+        inner.get_by_id = load
+
+        current = repository.get_by_id(report.id)
+        version = repository.get_version(report.id)
+        if current is None:
+            assert version is None
+        else:
+            assert current.title == "Renamed"
+            assert version.version == 2
+
+    def test_reads_are_cached_again_after_invalidation(
+        self, repository, monkeypatch, django_assert_num_queries
+    ):
+        monkeypatch.setattr(cache, "INVALIDATION_TIMEOUT", 0.05)
+        report = make_report()
+        repository.save(report)
+        repository.update_fields(report.id, {"title": "Renamed"})
+
+        time.sleep(0.1)
+        repository.get_by_id(report.id)
+        with django_assert_num_queries(0):
+            assert repository.get_by_id(report.id).title == "Renamed"
+
+    def test_async_get_by_id_shares_the_cache(
+        self, repository, stats, django_assert_num_queries
+    ):
+        report = make_report()
+        repository.save(report)
+        repository.get_by_id(report.id)
+
+        with django_assert_num_queries(0):
+            cached = async_to_sync(repository.aget_by_id)(report.id)
+
+        assert cached == report
+        assert stats.hits == 1
+
+    def test_async_writes_invalidate(self, repository):
+        report = make_report()
+        repository.save(report)
+        repository.get_by_id(report.id)
+
+        assert async_to_sync(repository.aupdate_fields)(report.id, {"title": "Renamed"})
+        assert repository.get_by_id(report.id).title == "Renamed"
+
+        assert async_to_sync(repository.adelete)(report.id) is True
+        assert repository.get_by_id(report.id) is None
+
+    def test_async_update_and_save_many_invalidate(self, repository):
+        report = make_report()
+        repository.save(report)
+        cached = repository.get_by_id(report.id)
+        missing = make_report(title="Created")
+        assert repository.get_by_id(missing.id) is None
+
+        cached.change(title="Renamed")
+        assert async_to_sync(repository.aupdate)(cached)
+        async_to_sync(repository.asave_many)([missing])
+
+        assert repository.get_by_id(report.id).title == "Renamed"
+        assert repository.get_by_id(missing.id).title == "Created"
+
+    def test_get_version_is_served_from_cached_report(
+        self, repository, django_assert_num_queries
+    ):
+        report = make_report()
+        repository.save(report)
+
+        with django_assert_num_queries(1):
+            assert repository.get_version(report.id).version == 1
+        repository.get_by_id(report.id)
+        with django_assert_num_queries(0):
+            assert repository.get_version(report.id).version == 1
+
+        repository.update_fields(report.id, {"title": "Updated Report"})
+        assert repository.get_version(report.id).version == 2
+
+    def test_list_and_count_are_not_cached_without_timeout(
+        self, repository, django_assert_num_queries
+    ):
+        report = make_report()
+        repository.save(report)
+        repository.list(order_by="title")
+
+        with django_assert_num_queries(2):
+            assert repository.list(order_by="title") == [report]
+            assert repository.count() == 1
+
+
+@pytest.fixture
+def list_repository(stats):
+    return CachedReportRepository(
+        DjangoORMReportRepository(),
+        caches["default"],
+        list_timeout=60,
+        stats=stats,
+    )
+
+
+class SlowInMemoryReportRepository(InMemoryReportRepository):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.list_calls = 0
+
+    def list(self, *args, **kwargs):
+        self.list_calls += 1
+        time.sleep(0.05)
+        return super().list(*args, **kwargs)
+
+
+@pytest.mark.django_db
+class TestCachedReportRepositoryListing:
+    def test_list_and_count_are_cached(
+        self, list_repository, stats, django_assert_num_queries
+    ):
+        report = make_report()
+        list_repository.save(report)
+
+        with django_assert_num_queries(2):
+            assert list_repository.list("title", 1, 10) == [report]
+            assert list_repository.count() == 1
+        with django_assert_num_queries(0):
+            cached = list_repository.list("title", 1, 10)
+            assert list_repository.count() == 1
+
+        assert cached[0].title == report.title
+        assert stats.hits == 2
+        assert stats.misses == 2
+
+    def test_requests_are_cached_separately(
+        self, list_repository, django_assert_num_queries
+    ):
+        pending = make_report(title="Pending")
+        completed = make_report(title="Completed", report_status="COMPLETED")
+        list_repository.save_many([pending, completed])
+
+        with django_assert_num_queries(3):
+            assert list_repository.list("title", 1, 10) == [completed, pending]
+            assert list_repository.list("title", 1, 1) == [completed]
+            assert list_repository.list(
+                "title", 1, 10, report_status=[ReportStatus.PENDING]
+            ) == [pending]
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda repository, report: repository.save(make_report()),
+            lambda repository, report: repository.update_fields(
+                report.id, {"title": "Renamed"}
+            ),
+            lambda repository, report: repository.delete(report.id),
+        ],
+    )
+    def test_writes_invalidate_lists(
+        self, list_repository, django_assert_num_queries, write
+    ):
+        report = make_report()
+        list_repository.save(report)
+        list_repository.list("title", 1, 10)
+        list_repository.count()
+
+        write(list_repository, report)
+
+        with django_assert_num_queries(2):
+            list_repository.list("title", 1, 10)
+            list_repository.count()
+
+    def test_pages_are_not_cached_within_the_replication_lag(
+        self, stats, django_assert_num_queries
+    ):
+        repository = CachedReportRepository(
+            DjangoORMReportRepository(),
+            caches["default"],
+            list_timeout=60,
+            stats=stats,
+            replication_lag=10,
+        )
+        report = make_report()
+        repository.save(report)
+
+        with django_assert_num_queries(2):
+            repository.list("title", 1, 10)
+            repository.list("title", 1, 10)
+
+        caches["default"].delete(cache.WRITTEN_KEY)
+        repository.list("title", 1, 10)
+        with django_assert_num_queries(0):
+            assert repository.list("title", 1, 10) == [report]
+
+    def test_evicted_generation_does_not_reuse_old_pages(self, list_repository):
+        report = make_report()
+        list_repository.save(report)
+        list_repository.list("title", 1, 10)
+
+        caches["default"].delete(GENERATION_KEY)
+        list_repository.delete(report.id)
+
+        assert list_repository.list("title", 1, 10) == []
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_run_a_single_query(self, stats):
+        inner = SlowInMemoryReportRepository([make_report()])
+        repository = CachedReportRepository(
+            inner, caches["default"], list_timeout=60, stats=stats
+        )
+        results = []
+
+        def list_reports():
+            results.append(repository.list("title", 1, 10))
+
+        threads = [threading.Thread(target=list_reports) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert inner.list_calls == 1
+        assert len(results) == 8
+        assert stats.misses == 1
+        assert stats.hits == 7
+
+    def test_waits_for_a_load_in_another_process(self, stats):
+        inner = SlowInMemoryReportRepository([make_report()])
+        repository = CachedReportRepository(
+            inner, caches["default"], list_timeout=60, stats=stats
+        )
+        key = repository._query_key("count", None, None, None)
+        caches["default"].add(f"{key}:lock", 1)
+
+        def load_elsewhere():
+            time.sleep(0.1)
+            caches["default"].set(key, 42)
+
+        thread = threading.Thread(target=load_elsewhere)
+        thread.start()
+        count = repository.count()
+        thread.join()
+
+        assert count == 42
+        assert stats.hits == 1
+
+
+class TestGetReportRepository:
+    def test_cached_when_cache_alias_is_set(self, settings):
+        settings.REPORT_CACHE_ALIAS = "default"
+        settings.REPORT_CACHE_TIMEOUT = 60
+        settings.REPORT_LIST_CACHE_TIMEOUT = 5
+
+        repository = get_report_repository()
+
+        assert isinstance(repository, CachedReportRepository)
+        assert isinstance(repository.repository, DjangoORMReportRepository)
+        assert repository.timeout == 60
+        assert repository.list_timeout == 5
+        assert repository.replication_lag == 0
+
+    def test_replication_lag_is_the_sticky_primary_window(self, settings):
+        settings.REPORT_CACHE_ALIAS = "default"
+        settings.REPORT_REPLICA_DATABASES = ["replica"]
+        settings.REPORT_STICKY_PRIMARY_SECONDS = 10
+
+        assert get_report_repository().replication_lag == 10
+        assert get_async_report_repository().replication_lag == 10
+
+    def test_async_repository_is_cached(self, settings):
+        settings.REPORT_CACHE_ALIAS = "default"
+
+        repository = get_async_report_repository()
+
+        assert isinstance(repository, CachedReportRepository)
+        assert isinstance(repository.repository, DjangoORMReportRepository)
+
+    def test_not_cached_without_cache_alias(self, settings):
+        settings.REPORT_CACHE_ALIAS = None
+
+        assert isinstance(get_report_repository(), DjangoORMReportRepository)
+        assert isinstance(get_async_report_repository(), DjangoORMReportRepository)
@@ -0,0 +1,231 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from rest_framework import status
+
+from src import metrics
+from src.metrics import (
+    Counter,
+    FunctionMetric,
+    Histogram,
+    Registry,
+    aexecute_use_case,
+    execute_use_case,
+)
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.models import ReportModel
+
+
+class TestRegistry:
+    def test_histogram_buckets_are_cumulative(self):
+        registry = Registry()
+        histogram = registry.register(
+            Histogram("latency_seconds", "Latency.", ("view",), buckets=(0.1, 1))
+        )
+
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.labels("list").observe(value)
+
+        assert registry.render().splitlines() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{view="list",le="0.1"} 2',
+            'latency_seconds_bucket{view="list",le="1"} 3',
+            'latency_seconds_bucket{view="list",le="+Inf"} 4',
+            'latency_seconds_sum{view="list"} 2.65',
+            'latency_seconds_count{view="list"} 4',
+        ]
+
+    def test_label_sets_are_created_once(self):
+        counter = Counter("requests_total", "Requests.", ("view", "status"))
+
+        child = counter.labels("list", 200)
+        child.inc()
+        counter.labels("list", 200).inc(2)
+
+        assert counter.labels("list", 200) is child
+        assert child.value == 3
+
+    def test_label_values_are_escaped(self):
+        registry = Registry()
+        registry.register(Counter("requests_total", "Requests.", ("view",)))
+        registry.metrics[0].labels('say "hi"\n').inc()
+
+        assert 'requests_total{view="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_function_metric_is_read_at_scrape(self):
+        registry = Registry()
+        values = iter([1, 5])
+        registry.register(
+            FunctionMetric("hits_total", "Hits.", "counter", lambda: next(values))
+        )
+
+        assert "hits_total 1" in registry.render()
+        assert "hits_total 5" in registry.render()
+
+
+class FakeUseCase:
+    def execute(self, request):
+        return request
+
+
+class AsyncFakeUseCase:
+    async def execute(self, request):
+        return request
+
+
+class TestUseCaseTiming:
+    def test_execution_time_is_recorded(self):
+        child = metrics.USE_CASE_DURATION.labels("FakeUseCase")
+        count = sum(child.counts)
+
+        assert execute_use_case(FakeUseCase(), "input") == "input"
+        assert sum(child.counts) == count + 1
+
+    def test_async_execution_time_is_recorded(self):
+        child = metrics.USE_CASE_DURATION.labels("AsyncFakeUseCase")
+        count = sum(child.counts)
+
+        assert async_to_sync(aexecute_use_case)(AsyncFakeUseCase(), "input") == "input"
+        assert sum(child.counts) == count + 1
+
+
+@pytest.mark.django_db
+class TestMetricsMiddleware:
+    @pytest.fixture(autouse=True)
+    def middleware(self, settings):
+        settings.MIDDLEWARE = ["src.metrics.MetricsMiddleware"]
+
+    @pytest.fixture
+    def create_report(self):
+        def make_report(**kwargs):
+            data = {
+                "title": "Test Report",
+                "complaint": "This is a test complaint.",
+                "report_type": ReportType.OTHER.name,
+                "name": "Test User",
+                "email": "test@example.com",
+                "report_status": ReportStatus.PENDING.name,
+            }
+            return ReportModel.objects.create(**{**data, **kwargs})
+
+        return make_report
+
+    @staticmethod
+    def snapshot(view, action, status_code):
+        labels = (view, action)
+        queries = metrics.REQUEST_QUERIES.labels(*labels)
+        return (
+            metrics.REQUESTS.labels(view, action, status_code).value,
+            sum(metrics.REQUEST_DURATION.labels(*labels).counts),
+            queries.sum,
+            metrics.RESPONSE_SIZE.labels(*labels).sum,
+        )
+
+    def test_records_viewset_action(self, create_report):
+        create_report()
+        before = self.snapshot("report-list", "list", 200)
+
+        response = Client().get(reverse("report-list"))
+
+        requests, durations, queries, size = self.snapshot("report-list", "list", 200)
+        assert requests == before[0] + 1
+        assert durations == before[1] + 1
+        # One query for the page and one for the total
+        assert queries == before[2] + 2
+        assert size == before[3] + len(response.content)
+
+    def test_records_async_view_queries(self, create_report):
+        report = create_report()
+        before = self.snapshot("async-report-detail", "GET", 200)
+
+        response = async_to_sync(AsyncClient().get)(
+            reverse("async-report-detail", args=[report.id])
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        after = self.snapshot("async-report-detail", "GET", 200)
+        assert after[0] == before[0] + 1
+        assert after[2] == before[2] + 1
+
+    def test_records_streamed_response_size_once_sent(self, create_report):
+        create_report()
+        before = self.snapshot("report-export", "export", 200)
+
+        response = Client().get(reverse("report-export"), {"format": "ndjson"})
+        content = b"".join(response.streaming_content)
+
+        after = self.snapshot("report-export", "export", 200)
+        assert after[3] == before[3] + len(content)
+
+    def test_records_async_streamed_response_size(self, create_report):
+        create_report()
+        before = self.snapshot("report-export", "export", 200)
+
+        async def export():
+            response = await AsyncClient().get(reverse("report-export"))
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        content = async_to_sync(export)()
+
+        after = self.snapshot("report-export", "export", 200)
+        assert after[3] == before[3] + len(content)
+
+    def test_records_queries_run_while_streaming(self, create_report):
+        create_report()
+        before = self.snapshot("report-export", "export", 200)
+
+        response = Client().get(reverse("report-export"), {"format": "ndjson"})
+        assert self.snapshot("report-export", "export", 200)[1] == before[1]
+        b"".join(response.streaming_content)
+
+        after = self.snapshot("report-export", "export", 200)
+        assert after[1] == before[1] + 1
+        # The export rows are only queried once the body is sent
+        assert after[2] >= before[2] + 1
+
+    def test_records_queries_run_while_streaming_async(self, create_report):
+        create_report()
+        before = self.snapshot("report-export", "export", 200)
+
+        async def export():
+            response = await AsyncClient().get(reverse("report-export"))
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        async_to_sync(export)()
+
+        after = self.snapshot("report-export", "export", 200)
+        assert after[1] == before[1] + 1
+        assert after[2] >= before[2] + 1
+
+    def test_records_unmatched_requests(self):
+        before = self.snapshot("unmatched", "GET", 404)
+
+        Client().get("/missing/")
+
+        assert self.snapshot("unmatched", "GET", 404)[0] == before[0] + 1
+
+    def test_unknown_methods_share_a_label(self):
+        before = self.snapshot("unmatched", "other", 404)
+
+        for index in range(3):
+            Client().generic(f"XMETH{index}", "/missing/")
+        Client().generic("XMETH0", reverse("report-list"))
+
+        assert self.snapshot("unmatched", "other", 404)[0] == before[0] + 3
+        assert "XMETH" not in metrics.REGISTRY.render()
+
+    def test_metrics_endpoint(self):
+        Client().get(reverse("report-list"))
+
+        response = Client().get(reverse("metrics"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == metrics.CONTENT_TYPE
+        body = response.content.decode()
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert 'http_requests_total{view="report-list",action="list",status="200"}' in (
+            body
+        )
+        assert "report_cache_hits_total" in body
@@ -0,0 +1,88 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from src import renderers
+from src.renderers import CSVRenderer, NDJSONRenderer, ORJSONRenderer
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def with_orjson(request, monkeypatch):
+    # Runs a test against both the orjson and the standard library branch
+    if not request.param:
+        monkeypatch.setattr(renderers, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"data": [{"id": str(uuid.uuid4()), "title": "Relatório ção"}]},
+        {"id": uuid.uuid4(), "total": 10, "next_cursor": None},
+        {"detail": ErrorDetail("Invalid", code="invalid"), 1: [True, 1.5]},
+        {"updated_at": datetime.datetime(2025, 1, 2, 3, 4, 5, 678901)},
+        {"amount": Decimal("1.10")},
+        [],
+    ],
+)
+def test_renders_like_json_renderer(with_orjson, data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renders_nothing_for_none(with_orjson):
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_indented_output_uses_json_renderer():
+    data = {"data": [1, 2]}
+    media_type = "application/json; indent=2"
+
+    assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(
+        data, media_type
+    )
+
+
+FIELDS = ("id", "title")
+ROWS = [(uuid.UUID(int=index), f"Relatório {index}") for index in range(3)]
+
+
+def test_ndjson_stream(with_orjson):
+    chunks = list(NDJSONRenderer().stream(FIELDS, iter(ROWS), batch_size=2))
+
+    assert len(chunks) == 2
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == [
+        {"id": str(id), "title": title} for id, title in ROWS
+    ]
+
+
+def test_ndjson_render(with_orjson):
+    data = {"detail": "Invalid", "title": "Relatório"}
+
+    assert [
+        json.loads(line) for line in NDJSONRenderer().render(data).splitlines()
+    ] == [data]
+
+
+def test_csv_stream():
+    chunks = list(CSVRenderer().stream(FIELDS, iter(ROWS), batch_size=2))
+
+    assert len(chunks) == 2
+    assert b"".join(chunks).decode().splitlines() == ["id,title"] + [
+        f"{id},{title}" for id, title in ROWS
+    ]
+
+
+def test_csv_stream_without_rows():
+    assert list(CSVRenderer().stream(FIELDS, iter([]), batch_size=2)) == [
+        b"id,title\r\n"
+    ]
+
+
+def test_csv_render():
+    data = {"detail": "Invalid, really"}
+    assert CSVRenderer().render(data) == b'detail\r\n"Invalid, really"\r\n'
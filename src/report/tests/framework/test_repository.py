@@ -1,9 +1,17 @@
+import importlib
 import uuid
 from unittest.mock import Mock
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.apps import apps as django_apps
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from src.report.application.use_cases.list_report import SORTABLE_FIELDS
+from src.report.domain.cursor import Cursor
 from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportStatus, ReportType
 from src.report.models import ReportModel
 from src.report.repository import DjangoORMReportRepository, ReportModelMapper
 
@@ -46,6 +54,14 @@ class TestReportModelMapper:
         assert report.report_type == mock_report_model.report_type
         assert report.report_status == mock_report_model.report_status
 
+    def test_to_entity_skips_validation(self, mock_report_model, mocker):
+        validate = mocker.patch.object(Report, "validate")
+
+        report = ReportModelMapper.to_entity(mock_report_model)
+
+        validate.assert_not_called()
+        assert report.changes == {}
+
     def test_to_model(self, sample_report):
         report_model = ReportModelMapper.to_model(sample_report)
 
@@ -57,6 +73,15 @@ class TestReportModelMapper:
         assert report_model.report_type == sample_report.report_type
         assert report_model.report_status == sample_report.report_status
 
+    def test_to_model_stores_member_names(self, sample_report):
+        sample_report.report_type = ReportType.DATA_LEAK
+        sample_report.report_status = ReportStatus.PENDING
+
+        report_model = ReportModelMapper.to_model(sample_report)
+
+        assert report_model.report_type == "DATA_LEAK"
+        assert report_model.report_status == "PENDING"
+
 
 class TestDjangoORMReportRepository:
     @pytest.mark.django_db
@@ -68,6 +93,24 @@ class TestDjangoORMReportRepository:
         assert saved_report is not None
         assert saved_report.title == sample_report.title
 
+    @pytest.mark.django_db
+    def test_save_many_in_batches(self, db, django_assert_num_queries):
+        repository = DjangoORMReportRepository(batch_size=2)
+        reports = [
+            Report(
+                id=uuid.uuid4(),
+                title=f"Report {index}",
+                complaint="Sample complaint",
+                report_type="DATA_LEAK",
+            )
+            for index in range(5)
+        ]
+
+        with django_assert_num_queries(3):
+            repository.save_many(reports)
+
+        assert ReportModel.objects.count() == 5
+
     @pytest.mark.django_db
     def test_get_by_id(self, db, sample_report):
         repository = DjangoORMReportRepository()
@@ -90,10 +133,23 @@ class TestDjangoORMReportRepository:
         repository = DjangoORMReportRepository()
         repository.save(sample_report)
 
-        repository.delete(sample_report.id)
+        assert repository.delete(sample_report.id) is True
         with pytest.raises(ReportModel.DoesNotExist):
             ReportModel.objects.get(id=sample_report.id)
 
+    @pytest.mark.django_db
+    def test_delete_is_a_single_query(
+        self, db, sample_report, django_assert_num_queries
+    ):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+
+        with django_assert_num_queries(1):
+            assert repository.delete(sample_report.id) is True
+
+        with django_assert_num_queries(1):
+            assert repository.delete(sample_report.id) is False
+
     @pytest.mark.django_db
     def test_list_no_filters(self, db, sample_report):
         repository = DjangoORMReportRepository()
@@ -131,6 +187,179 @@ class TestDjangoORMReportRepository:
         reports = repository.list(current_page=1, per_page=10)
         assert len(reports) > 0
 
+    @pytest.mark.django_db
+    def test_list_second_page(self, db):
+        repository = DjangoORMReportRepository()
+        for index in range(3):
+            repository.save(
+                Report(
+                    id=uuid.uuid4(),
+                    title=f"Report {index}",
+                    complaint="Sample complaint",
+                    report_type="DATA_LEAK",
+                )
+            )
+
+        reports = repository.list(order_by="title", current_page=2, per_page=2)
+        assert [report.title for report in reports] == ["Report 2"]
+
+    @pytest.mark.django_db
+    def test_export_streams_rows_in_chunks(self, db):
+        repository = DjangoORMReportRepository(export_chunk_size=2)
+        repository.save_many(
+            [
+                Report(
+                    id=uuid.uuid4(),
+                    title=f"Report {index}",
+                    complaint="Sample complaint",
+                    email=f"user{index}@example.com",
+                    report_type="DATA_LEAK",
+                    report_status="COMPLETED" if index else "PENDING",
+                )
+                for index in range(5)
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = repository.export(
+                order_by="-title", report_status=[ReportStatus.COMPLETED]
+            )
+            assert len(queries) == 0
+            first = next(rows)
+            remaining = list(rows)
+
+        assert len(queries) == 1
+        assert first[1:4] == ("Report 4", "DATA_LEAK", "COMPLETED")
+        assert [row[1] for row in remaining] == ["Report 3", "Report 2", "Report 1"]
+        assert isinstance(first[0], uuid.UUID)
+        assert first[5] == "user4@example.com"
+
+    @pytest.mark.django_db
+    def test_export_by_relevance(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+
+        rows = list(repository.export(order_by="relevance", search_query="John"))
+
+        assert [row[0] for row in rows] == [sample_report.id]
+
+    @pytest.mark.django_db
+    def test_count(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+
+        assert repository.count() == 1
+        assert repository.count(search_query="John") == 1
+        assert repository.count(search_query="nonexistent") == 0
+
+    @pytest.mark.django_db
+    def test_list_and_count_with_filters(self, db):
+        repository = DjangoORMReportRepository()
+        for report_type, report_status in [
+            ("DATA_LEAK", "PENDING"),
+            ("DATA_LEAK", "COMPLETED"),
+            ("OTHER", "PENDING"),
+        ]:
+            repository.save(
+                Report(
+                    id=uuid.uuid4(),
+                    title=f"{report_type} {report_status}",
+                    complaint="Sample complaint",
+                    report_type=report_type,
+                    report_status=report_status,
+                )
+            )
+
+        reports = repository.list(
+            order_by="title",
+            report_status=[ReportStatus.PENDING],
+            report_type=[ReportType.DATA_LEAK, ReportType.SUSPICIOUS_ACTIVITIES],
+        )
+
+        assert [report.title for report in reports] == ["DATA_LEAK PENDING"]
+        assert repository.count(report_status=[ReportStatus.PENDING]) == 2
+        assert repository.count(report_type=[ReportType.OTHER]) == 1
+
+    @pytest.mark.django_db
+    def test_members_are_stored_and_filtered_by_name(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+        sample_report.report_type = ReportType.DATA_LEAK
+        repository.save(sample_report)
+        repository.update_fields(
+            sample_report.id, {"report_type": ReportType.SUSPICIOUS_ACTIVITIES}
+        )
+
+        stored = ReportModel.objects.values_list("report_type", flat=True)
+        assert list(stored) == ["SUSPICIOUS_ACTIVITIES"]
+        assert repository.count(report_type=[ReportType.SUSPICIOUS_ACTIVITIES]) == 1
+
+    @pytest.mark.django_db
+    def test_migration_stores_member_names(self, db, sample_report):
+        migration = importlib.import_module(
+            "src.report.migrations.0005_report_enum_member_names"
+        )
+        ReportModel.objects.create(
+            id=sample_report.id,
+            title=sample_report.title,
+            complaint=sample_report.complaint,
+            report_type=ReportType.DATA_LEAK.value,
+            report_status=ReportStatus.PENDING.value,
+        )
+
+        migration.store_member_names(django_apps, None)
+
+        report_model = ReportModel.objects.get(id=sample_report.id)
+        assert report_model.report_type == "DATA_LEAK"
+        assert report_model.report_status == "PENDING"
+        assert report_model.version == 2
+
+    @pytest.mark.django_db
+    def test_list_with_cursor(self, db):
+        repository = DjangoORMReportRepository()
+        reports = [
+            Report(
+                id=uuid.uuid4(),
+                title=title,
+                complaint="Sample complaint",
+                report_type="DATA_LEAK",
+            )
+            for title in ["B Report", "A Report", "B Report", "C Report"]
+        ]
+        for report in reports:
+            repository.save(report)
+
+        first_page = repository.list(order_by="title", current_page=1, per_page=2)
+        cursor = Cursor.for_report(first_page[-1], "title")
+        second_page = repository.list(order_by="title", per_page=2, cursor=cursor)
+
+        listed = first_page + second_page
+        assert [report.title for report in listed] == [
+            "A Report",
+            "B Report",
+            "B Report",
+            "C Report",
+        ]
+        assert len({report.id for report in listed}) == 4
+
+    @pytest.mark.django_db
+    def test_list_with_cursor_descending(self, db):
+        repository = DjangoORMReportRepository()
+        for title in ["A Report", "B Report", "C Report"]:
+            repository.save(
+                Report(
+                    id=uuid.uuid4(),
+                    title=title,
+                    complaint="Sample complaint",
+                    report_type="DATA_LEAK",
+                )
+            )
+
+        first_page = repository.list(order_by="-title", current_page=1, per_page=1)
+        cursor = Cursor.for_report(first_page[-1], "-title")
+        next_page = repository.list(order_by="-title", per_page=5, cursor=cursor)
+
+        assert [report.title for report in next_page] == ["B Report", "A Report"]
+
     @pytest.mark.django_db
     def test_update(self, db, sample_report):
         repository = DjangoORMReportRepository()
@@ -151,3 +380,257 @@ class TestDjangoORMReportRepository:
         retrieved_report = repository.get_by_id(sample_report.id)
         assert retrieved_report.title == "Updated Report"
         assert retrieved_report.report_status == "COMPLETED"
+
+    @pytest.mark.django_db
+    def test_update_writes_only_changed_fields(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+        report = repository.get_by_id(sample_report.id)
+
+        report.update_report(
+            title=report.title,
+            complaint=report.complaint,
+            report_type=report.report_type,
+            report_status="COMPLETED",
+            name=report.name,
+            email=report.email,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            assert repository.update(report) is True
+
+        assert len(queries) == 1
+        sql = queries[0]["sql"]
+        assert '"report_status"' in sql
+        assert '"title"' not in sql
+        assert report.changes == {}
+        assert repository.get_by_id(report.id).report_status == "COMPLETED"
+
+    @pytest.mark.django_db
+    def test_update_without_changes_keeps_the_version(
+        self, db, sample_report, django_assert_num_queries
+    ):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+        report = repository.get_by_id(sample_report.id)
+        report.change(title=report.title)
+
+        # A single existence check for the optimistic lock, and no UPDATE
+        with django_assert_num_queries(1):
+            assert repository.update(report) is True
+
+        stored = repository.get_by_id(report.id)
+        assert report.version == stored.version == 1
+        assert stored.updated_at == sample_report.updated_at
+
+    @pytest.mark.django_db
+    def test_update_fields(self, db, sample_report, django_assert_num_queries):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+
+        with django_assert_num_queries(1):
+            updated = repository.update_fields(
+                sample_report.id, {"report_status": "PROCESSING"}
+            )
+
+        assert updated is True
+        assert repository.get_by_id(sample_report.id).report_status == "PROCESSING"
+
+    @pytest.mark.django_db
+    def test_updates_bump_version(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+        saved_at = sample_report.updated_at
+
+        assert repository.get_version(sample_report.id).version == 1
+        assert repository.get_version(sample_report.id).updated_at == saved_at
+
+        report = repository.get_by_id(sample_report.id)
+        report.change(title="Updated Report")
+        repository.update(report)
+        assert report.version == 2
+        assert repository.get_version(report.id).version == 2
+
+        repository.update_fields(report.id, {"report_status": "COMPLETED"})
+        repository.update_fields(report.id, {})
+        version = repository.get_version(report.id)
+        assert version.version == 3
+        assert version.updated_at > saved_at
+
+    @pytest.mark.django_db
+    def test_get_version_is_a_single_query(
+        self, db, sample_report, django_assert_num_queries
+    ):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+
+        with django_assert_num_queries(1):
+            assert repository.get_version(sample_report.id).version == 1
+
+        assert repository.get_version(uuid.uuid4()) is None
+
+    @pytest.mark.django_db
+    def test_update_fields_not_found(self, db):
+        repository = DjangoORMReportRepository()
+
+        assert repository.update_fields(uuid.uuid4(), {"title": "Title"}) is False
+        assert repository.update_fields(uuid.uuid4(), {}) is False
+
+    @pytest.mark.django_db
+    def test_stale_updates_are_rejected(
+        self, db, sample_report, django_assert_num_queries
+    ):
+        repository = DjangoORMReportRepository()
+        repository.save(sample_report)
+        stale = repository.get_by_id(sample_report.id)
+        repository.update_fields(sample_report.id, {"title": "Renamed"})
+
+        stale.change(title="Stale")
+        with django_assert_num_queries(1):
+            assert repository.update(stale) is False
+        assert stale.version == 1
+        assert repository.update_fields(sample_report.id, {}, version=1) is False
+        assert repository.update_fields(sample_report.id, {"name": "Jane"}, version=2)
+
+        report = repository.get_by_id(sample_report.id)
+        assert report.title == "Renamed"
+        assert report.version == 3
+
+
+@pytest.mark.django_db
+class TestDjangoORMReportRepositoryAsync:
+    def test_async_methods(self, db, sample_report):
+        repository = DjangoORMReportRepository()
+
+        @async_to_sync
+        async def run():
+            await repository.asave(sample_report)
+            assert sample_report.updated_at is not None
+
+            report = await repository.aget_by_id(sample_report.id)
+            assert report == sample_report
+            assert report.title == "Test Report"
+            assert await repository.aget_by_id(uuid.uuid4()) is None
+
+            reports = await repository.alist(
+                order_by="title",
+                current_page=1,
+                per_page=10,
+                search_query="John",
+                report_status=[ReportStatus.PENDING],
+            )
+            assert reports == [sample_report]
+            assert await repository.acount(search_query="John") == 1
+            assert await repository.acount(report_type=[ReportType.OTHER]) == 0
+
+            assert await repository.aupdate_fields(
+                sample_report.id, {"title": "Renamed"}, version=1
+            )
+            assert not await repository.aupdate_fields(
+                sample_report.id, {"title": "Stale"}, version=1
+            )
+            version = await repository.aget_version(sample_report.id)
+            assert version.version == 2
+
+            assert await repository.adelete(sample_report.id) is True
+            assert await repository.adelete(sample_report.id) is False
+
+        run()
+
+    def test_async_keyset_pagination(self, db):
+        repository = DjangoORMReportRepository()
+        reports = [
+            Report(
+                id=uuid.uuid4(),
+                title=f"Report {index}",
+                complaint="Sample complaint",
+                report_type="DATA_LEAK",
+            )
+            for index in range(3)
+        ]
+        repository.save_many(reports)
+        cursor = Cursor.for_report(reports[0], "title")
+
+        page = async_to_sync(repository.alist)(per_page=1, cursor=cursor)
+
+        assert page == [reports[1]]
+
+    def test_async_save_many_and_update(self, db):
+        repository = DjangoORMReportRepository()
+        reports = [
+            Report(
+                id=uuid.uuid4(),
+                title=f"Report {index}",
+                complaint="Sample complaint",
+                report_type=ReportType.DATA_LEAK,
+            )
+            for index in range(2)
+        ]
+
+        @async_to_sync
+        async def run():
+            await repository.asave_many(reports)
+            assert all(report.updated_at is not None for report in reports)
+
+            report = await repository.aget_by_id(reports[0].id)
+            report.change(title="Renamed")
+            assert await repository.aupdate(report)
+            assert report.version == 2
+            assert report.changes == {}
+
+            # Nothing changed, the version is only checked
+            assert await repository.aupdate(report)
+            assert report.version == 2
+            stale = await repository.aget_by_id(reports[1].id)
+            stale.version = 3
+            stale.change(title="Stale")
+            assert not await repository.aupdate(stale)
+
+        run()
+
+        assert list(
+            ReportModel.objects.order_by("title").values_list(
+                "title", "report_type", "version"
+            )
+        ) == [("Renamed", "DATA_LEAK", 2), ("Report 1", "DATA_LEAK", 1)]
+
+
+@pytest.mark.django_db
+class TestReportModelIndexes:
+    @pytest.mark.parametrize("field", SORTABLE_FIELDS)
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_sortable_fields_are_ordered_by_index(self, db, field, descending):
+        prefix = "-" if descending else ""
+        queryset = ReportModel.objects.order_by(f"{prefix}{field}", f"{prefix}id")
+
+        plan = queryset[:10].explain()
+
+        assert f"report_{field.removeprefix('report_')}_id_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.parametrize("field", ["report_status", "report_type"])
+    def test_filtered_title_order_uses_composite_index(self, db, field):
+        queryset = ReportModel.objects.filter(**{f"{field}__in": ["A", "B"]})
+        queryset = queryset.order_by("title", "id")
+
+        plan = queryset[:10].explain()
+
+        assert f"{field}_title_id_idx" in plan
+
+    @pytest.mark.parametrize(
+        ("field", "member"),
+        [
+            ("report_status", ReportStatus.PENDING),
+            ("report_type", ReportType.DATA_LEAK),
+        ],
+    )
+    def test_single_filter_is_range_scanned(self, db, field, member):
+        queryset = DjangoORMReportRepository()._filter(
+            ReportModel.objects.all(), None, **{field: [member]}
+        )
+        queryset = queryset.order_by("title", "id")
+
+        plan = queryset[:10].explain()
+
+        assert f"{field}_title_id_idx" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,193 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connections
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.report.models import ReportModel
+from src.report.routing import (
+    ReplicaRouter,
+    RoutingState,
+    _routing,
+    use_primary,
+)
+
+ROUTING_SETTINGS = {
+    "DATABASE_ROUTERS": ["src.report.routing.ReplicaRouter"],
+    "MIDDLEWARE": ["src.report.routing.StickyPrimaryMiddleware"],
+    "REPORT_REPLICA_DATABASES": ["replica"],
+    "REPORT_STICKY_PRIMARY_SECONDS": 10,
+}
+
+REPORT_DATA = {
+    "title": "Test Report",
+    "complaint": "This is a test complaint.",
+    "report_type": "OTHER",
+    "name": "Test User",
+    "email": "test@example.com",
+    "report_status": "PENDING",
+}
+
+
+def replicate():
+    # Simulated replication step, copies the primary into the replica
+    for alias in ("default", "replica"):
+        connections[alias].ensure_connection()
+    connections["default"].connection.backup(connections["replica"].connection)
+
+
+class TestReplicaRouter:
+    @pytest.fixture
+    def router(self, settings):
+        settings.REPORT_REPLICA_DATABASES = ["replica"]
+        return ReplicaRouter()
+
+    def test_reads_go_to_a_replica(self, router):
+        assert router.db_for_read(ReportModel) == "replica"
+
+    def test_reads_go_to_the_primary_without_replicas(self, settings):
+        settings.REPORT_REPLICA_DATABASES = []
+        assert ReplicaRouter().db_for_read(ReportModel) == "default"
+
+    def test_reads_go_to_the_primary_when_pinned(self, router):
+        with use_primary():
+            assert router.db_for_read(ReportModel) == "default"
+
+    def test_write_pins_reads_to_the_primary(self, router):
+        state = RoutingState()
+        token = _routing.set(state)
+        try:
+            assert router.db_for_write(ReportModel) == "default"
+            assert router.db_for_read(ReportModel) == "default"
+        finally:
+            _routing.reset(token)
+
+        assert state.wrote
+
+    def test_other_apps_are_not_routed(self, router):
+        from django.contrib.auth.models import User
+
+        assert router.db_for_read(User) is None
+        assert router.db_for_write(User) is None
+
+    def test_replicas_are_not_migrated(self, router):
+        assert router.allow_migrate("replica", "report") is False
+        assert router.allow_migrate("default", "report") is None
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestStickyPrimary:
+    cookie = "use_primary"
+
+    @pytest.fixture(autouse=True)
+    def routing(self, settings):
+        for name, value in ROUTING_SETTINGS.items():
+            setattr(settings, name, value)
+
+    def test_client_reads_its_write_before_replication(self):
+        writer, reader = APIClient(), APIClient()
+        replicate()
+
+        response = writer.post(reverse("report-list"), REPORT_DATA, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.cookies[self.cookie]["max-age"] == 10
+        url = reverse("report-detail", args=[response.json()["id"]])
+
+        assert writer.get(url).status_code == status.HTTP_200_OK
+        # Exports are never cached, they show what the replica has
+        export = reverse("report-export")
+        assert b"".join(reader.get(export).streaming_content) == b""
+
+        replicate()
+        assert b"".join(reader.get(export).streaming_content) != b""
+
+    def test_cache_misses_are_loaded_from_a_replica(self):
+        report = ReportModel.objects.create(**REPORT_DATA)
+        replicate()
+        url = reverse("report-detail", args=[report.pk])
+
+        with CaptureQueriesContext(connections["replica"]) as queries:
+            assert APIClient().get(url).status_code == status.HTTP_200_OK
+            assert APIClient().get(url).status_code == status.HTTP_200_OK
+
+        # The second read is served from the cache
+        assert len(queries) == 1
+
+    def test_replica_reads_do_not_fill_the_cache(self):
+        writer, reader = APIClient(), APIClient()
+        replicate()
+
+        response = writer.post(reverse("report-list"), REPORT_DATA, format="json")
+        url = reverse("report-detail", args=[response.json()["id"]])
+
+        # The lagging replica does not have the report yet, which is not cached
+        # as missing
+        assert reader.get(url).status_code == status.HTTP_404_NOT_FOUND
+        assert writer.get(url).status_code == status.HTTP_200_OK
+
+        replicate()
+        assert reader.get(url).status_code == status.HTTP_200_OK
+
+    def test_replica_reads_do_not_cache_an_older_version(self):
+        report = ReportModel.objects.create(**REPORT_DATA)
+        replicate()
+        writer, reader = APIClient(), APIClient()
+        url = reverse("report-detail", args=[report.pk])
+        reader.get(url)
+        reader.get(reverse("report-list"))
+
+        response = writer.patch(url, {"title": "Updated Report"}, format="json")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        # The reader sees the replica until it catches up, without caching it
+        assert reader.get(url).json()["data"]["title"] == "Test Report"
+        assert writer.get(url).json()["data"]["title"] == "Updated Report"
+        listed = reader.get(reverse("report-list")).json()["data"]
+        assert [item["title"] for item in listed] == ["Test Report"]
+
+        replicate()
+        assert reader.get(url).json()["data"]["title"] == "Updated Report"
+        listed = reader.get(reverse("report-list")).json()["data"]
+        assert [item["title"] for item in listed] == ["Updated Report"]
+
+    def test_reads_do_not_start_the_window(self):
+        replicate()
+        response = APIClient().get(reverse("report-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.cookie not in response.cookies
+
+    def test_unsafe_request_reads_from_the_primary(self):
+        report = ReportModel.objects.create(**REPORT_DATA)
+        replicate()
+        ReportModel.objects.filter(pk=report.pk).update(version=2)
+
+        # The replica still has version 1, which would fail the version check
+        response = APIClient().put(
+            reverse("report-detail", args=[report.pk]),
+            {**REPORT_DATA, "complaint": "Updated complaint.", "version": 2},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        with use_primary():
+            assert (
+                ReportModel.objects.get(pk=report.pk).complaint == "Updated complaint."
+            )
+
+    def test_async_view_write_starts_the_window(self):
+        replicate()
+        client = AsyncClient()
+
+        response = async_to_sync(client.post)(
+            reverse("async-report-list"), REPORT_DATA, content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.cookies[self.cookie]["max-age"] == 10
+        url = reverse("async-report-detail", args=[response.json()["id"]])
+        response = async_to_sync(client.get)(url)
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,115 @@
+import uuid
+
+import pytest
+
+from src.report.domain.report import Report
+from src.report.models import ReportModel
+from src.report.repository import DjangoORMReportRepository
+from src.report.search import (
+    IContainsSearchBackend,
+    SQLiteFTS5SearchBackend,
+    get_search_backend,
+)
+
+
+def make_report(**kwargs):
+    data = {
+        "id": uuid.uuid4(),
+        "title": "Test Report",
+        "complaint": "Sample complaint",
+        "name": "John Doe",
+        "email": "john@example.com",
+        "report_type": "DATA_LEAK",
+        "report_status": "PENDING",
+    }
+    return Report(**{**data, **kwargs})
+
+
+@pytest.fixture(params=[SQLiteFTS5SearchBackend, IContainsSearchBackend])
+def repository(request):
+    return DjangoORMReportRepository(search_backend=request.param())
+
+
+@pytest.mark.django_db
+class TestSearchBackends:
+    def test_search_matches_substrings_case_insensitively(self, repository):
+        report = make_report(complaint="Leaked credentials on pastebin")
+        repository.save(report)
+        repository.save(make_report(complaint="Nothing to see here"))
+
+        reports = repository.list(search_query="CREDENTIAL")
+
+        assert [found.id for found in reports] == [report.id]
+        assert repository.count(search_query="CREDENTIAL") == 1
+
+    def test_search_covers_every_searchable_column(self, repository):
+        repository.save(
+            make_report(
+                title="Phishing",
+                name="Alice",
+                email="alice@corp.io",
+                report_type="OTHER",
+                report_status="COMPLETED",
+            )
+        )
+
+        for query in ["phish", "alice", "corp.io", "OTHER", "COMPLETED"]:
+            assert repository.count(search_query=query) == 1
+
+    def test_search_short_query(self, repository):
+        repository.save(make_report(title="Leak at XY Corp"))
+
+        assert repository.count(search_query="xy") == 1
+
+    def test_search_index_follows_update_and_delete(self, repository):
+        report = make_report(title="Original title")
+        repository.save(report)
+
+        report.update_report(
+            title="Renamed title",
+            complaint=report.complaint,
+            report_type=report.report_type,
+        )
+        repository.update(report)
+
+        assert repository.count(search_query="Original") == 0
+        assert repository.count(search_query="Renamed") == 1
+
+        repository.delete(report.id)
+
+        assert repository.count(search_query="Renamed") == 0
+
+    def test_order_by_relevance(self, repository):
+        weak = make_report(title="Report", complaint="A leak")
+        strong = make_report(title="Leak", complaint="Leak leak leak")
+        repository.save(weak)
+        repository.save(strong)
+
+        reports = repository.list(order_by="relevance", search_query="leak")
+
+        assert {report.id for report in reports} == {weak.id, strong.id}
+        if isinstance(repository.search_backend, SQLiteFTS5SearchBackend):
+            assert reports[0].id == strong.id
+
+
+@pytest.mark.django_db
+class TestSQLiteFTS5SearchBackend:
+    def test_search_uses_fts_table(self):
+        backend = SQLiteFTS5SearchBackend()
+
+        queryset = backend.filter(ReportModel.objects.all(), "leak")
+
+        assert "report_fts MATCH" in str(queryset.query)
+
+    def test_quotes_in_query_are_escaped(self):
+        repository = DjangoORMReportRepository(search_backend=SQLiteFTS5SearchBackend())
+        repository.save(make_report(title='The "quoted" report'))
+
+        assert repository.count(search_query='"quoted"') == 1
+
+
+class TestGetSearchBackend:
+    def test_backend_is_selected_by_settings(self, settings):
+        settings.REPORT_SEARCH_BACKEND = "src.report.search.IContainsSearchBackend"
+
+        assert isinstance(get_search_backend(), IContainsSearchBackend)
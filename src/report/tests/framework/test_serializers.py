@@ -2,8 +2,14 @@ import os
 import uuid
 
 import django
+import pytest
 
-from src.report.domain.value_objects import ReportStatus
+from src.report.application.use_cases.list_report import (
+    ListOutputMeta,
+    ListReportResponse,
+    ReportOutput,
+)
+from src.report.domain.value_objects import Email, ReportStatus, ReportType
 from src.report.serializers import (
     CreateReportRequestSerializer,
     CreateReportResponseSerializer,
@@ -14,6 +20,8 @@ from src.report.serializers import (
     RetrieveReportRequestSerializer,
     RetrieveReportResponseSerializer,
     UpdateReportRequestSerializer,
+    list_report_data,
+    retrieve_report_data,
 )
 
 # Set up Django settings for testing
@@ -196,3 +204,50 @@ class TestDeleteReportRequestSerializer:
         serializer = DeleteReportRequestSerializer(data=data)
         assert not serializer.is_valid()
         assert "id" in serializer.errors
+
+
+def make_output(**kwargs):
+    data = {
+        "id": uuid.uuid4(),
+        "title": "Test Report",
+        "complaint": "Sample complaint text",
+        "report_type": "DATA_LEAK",
+        "name": "John Doe",
+        "email": "john@example.com",
+        "report_status": "PENDING",
+    }
+    return ReportOutput(**{**data, **kwargs})
+
+
+class TestReportData:
+    @pytest.mark.parametrize(
+        "output",
+        [
+            make_output(),
+            make_output(name="", email=""),
+            make_output(
+                report_type=ReportType.DATA_LEAK,
+                report_status=ReportStatus.COMPLETED,
+                email=Email("jane@example.com"),
+            ),
+        ],
+    )
+    def test_retrieve_report_data_matches_serializer(self, output):
+        expected = RetrieveReportResponseSerializer(output).data
+
+        assert retrieve_report_data(output) == expected
+
+    @pytest.mark.parametrize("next_cursor", [None, "cursor"])
+    def test_list_report_data_matches_serializer(self, next_cursor):
+        output = ListReportResponse(
+            data=[make_output(), make_output(report_type=ReportType.OTHER)],
+            meta=ListOutputMeta(
+                current_page=2, per_page=2, total=5, next_cursor=next_cursor
+            ),
+        )
+        expected = ListReportResponseSerializer(output).data
+
+        data = list_report_data(output)
+
+        assert data == expected
+        assert list(data["data"][0]) == list(expected["data"][0])
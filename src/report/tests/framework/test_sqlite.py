@@ -0,0 +1,96 @@
+import pytest
+from django.db import connection
+from django.db.utils import ConnectionHandler
+
+from src.report import sqlite
+
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 1024 * 1024,
+    "cache_size": -2048,
+    "temp_store": "MEMORY",
+    "busy_timeout": 2500,
+}
+
+
+def pragma(wrapper, name):
+    with wrapper.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+class TestSQLiteProfile:
+    @pytest.fixture
+    def open_database(self, tmp_path):
+        handlers = []
+
+        def open():
+            handler = ConnectionHandler(
+                {
+                    "default": {
+                        "ENGINE": "django.db.backends.sqlite3",
+                        "NAME": tmp_path / "reports.sqlite3",
+                    }
+                }
+            )
+            handlers.append(handler)
+            return handler["default"]
+
+        yield open
+        for handler in handlers:
+            handler.close_all()
+
+    @pytest.fixture(autouse=True)
+    def reset_optimize(self, monkeypatch):
+        monkeypatch.setattr(sqlite, "_optimized_at", {})
+
+    def test_pragmas_are_applied_to_new_connections(self, settings, open_database):
+        settings.REPORT_SQLITE_PRAGMAS = PRAGMAS
+
+        wrapper = open_database()
+
+        assert pragma(wrapper, "journal_mode") == "wal"
+        assert pragma(wrapper, "synchronous") == 1
+        assert pragma(wrapper, "mmap_size") == 1024 * 1024
+        assert pragma(wrapper, "cache_size") == -2048
+        assert pragma(wrapper, "temp_store") == 2
+        assert pragma(wrapper, "busy_timeout") == 2500
+
+    def test_sqlite_defaults_are_kept_without_a_profile(self, settings, open_database):
+        settings.REPORT_SQLITE_PRAGMAS = None
+
+        wrapper = open_database()
+
+        assert pragma(wrapper, "journal_mode") == "delete"
+        assert pragma(wrapper, "synchronous") == 2
+
+    def test_optimize_runs_once_per_interval(self, settings, open_database):
+        settings.REPORT_SQLITE_OPTIMIZE_INTERVAL = 3600
+
+        wrapper = open_database()
+        wrapper.ensure_connection()
+
+        assert "default" in sqlite._optimized_at
+        assert not sqlite.optimize_if_due(open_database())
+
+        settings.REPORT_SQLITE_OPTIMIZE_INTERVAL = 0
+        assert sqlite.optimize_if_due(wrapper)
+
+    def test_optimize_is_disabled_without_an_interval(self, settings):
+        settings.REPORT_SQLITE_OPTIMIZE_INTERVAL = None
+
+        assert not sqlite.optimize_if_due(connection)
+        assert sqlite._optimized_at == {}
+
+    # Every open connection is optimized, including the replica's
+    @pytest.mark.django_db(databases=["default", "replica"])
+    def test_persistent_connections_are_optimized_between_requests(
+        self, settings, client
+    ):
+        settings.REPORT_SQLITE_OPTIMIZE_INTERVAL = 0
+
+        client.get("/api/reports/")
+
+        assert "default" in sqlite._optimized_at
@@ -1,8 +1,15 @@
+import csv
+import io
+import json
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from src import config
 from src.report.domain.value_objects import ReportStatus, ReportType
 from src.report.models import ReportModel
 
@@ -39,6 +46,194 @@ class TestReportViews:
         assert response.status_code == status.HTTP_200_OK
         assert "data" in response.json()
 
+    def test_list_reports_second_page(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+        url = reverse("report-list")
+
+        # One LIMIT query for the page and one COUNT(*) for the total
+        with django_assert_num_queries(2):
+            response = api_client.get(url, {"per_page": 2, "current_page": 2})
+
+        assert [report["title"] for report in response.json()["data"]] == ["C Report"]
+        assert response.json()["meta"]["total"] == 3
+
+    def test_list_reports_polling_is_cached_until_a_write(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        create_report(title="A Report")
+        url = reverse("report-list")
+        params = {"order_by": "-report_status", "current_page": 1}
+        api_client.get(url, params)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, params)
+        assert response.json()["meta"]["total"] == 1
+
+        api_client.post(
+            url,
+            {"title": "B Report", "complaint": "New.", "report_type": "OTHER"},
+            format="json",
+        )
+        response = api_client.get(url, params)
+        assert response.json()["meta"]["total"] == 2
+
+    def test_list_reports_with_cursor(self, api_client, create_report):
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+        url = reverse("report-list")
+
+        first_page = api_client.get(url, {"per_page": 2}).json()
+        next_cursor = first_page["meta"]["next_cursor"]
+        second_page = api_client.get(url, {"per_page": 2, "cursor": next_cursor})
+
+        assert second_page.status_code == status.HTTP_200_OK
+        assert [report["title"] for report in second_page.json()["data"]] == [
+            "C Report"
+        ]
+        assert second_page.json()["meta"]["next_cursor"] is None
+
+    def test_list_reports_with_cursor_skips_the_count(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+        url = reverse("report-list")
+        params = {"per_page": 1, "order_by": "-title"}
+        params["cursor"] = api_client.get(url, params).json()["meta"]["next_cursor"]
+
+        # Only the page query, without a COUNT(*) for the total
+        with django_assert_num_queries(1) as queries:
+            response = api_client.get(url, params)
+        assert "COUNT" not in queries.captured_queries[0]["sql"]
+        assert response.json()["meta"]["total"] is None
+        assert response.json()["meta"]["next_cursor"] is not None
+
+        response = api_client.get(url, {**params, "include_total": "1"})
+        assert response.json()["meta"]["total"] == 3
+
+    def test_list_reports_with_filters(self, api_client, create_report):
+        create_report(title="Pending leak", report_type=ReportType.DATA_LEAK.name)
+        create_report(
+            title="Completed leak",
+            report_type=ReportType.DATA_LEAK.name,
+            report_status=ReportStatus.COMPLETED.name,
+        )
+        create_report(title="Pending other", report_type=ReportType.OTHER.name)
+        url = reverse("report-list")
+
+        response = api_client.get(
+            f"{url}?report_status=PENDING,PROCESSING&report_type=DATA_LEAK"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [report["title"] for report in response.json()["data"]] == [
+            "Pending leak"
+        ]
+
+    def test_list_reports_with_invalid_filter(self, api_client):
+        url = reverse("report-list")
+        response = api_client.get(url, {"report_status": "DONE"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_reports_with_unsortable_field(self, api_client):
+        url = reverse("report-list")
+        response = api_client.get(url, {"order_by": "complaint"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_reports_with_invalid_cursor(self, api_client):
+        url = reverse("report-list")
+        response = api_client.get(url, {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_reports_as_ndjson(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        reports = [create_report(title=title) for title in ["B Report", "A Report"]]
+        url = reverse("report-export")
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+            lines = b"".join(response.streaming_content).splitlines()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+        assert (
+            response["Content-Disposition"] == 'attachment; filename="reports.ndjson"'
+        )
+        assert [json.loads(line) for line in lines] == [
+            {
+                "id": str(report.id),
+                "title": report.title,
+                "report_type": "OTHER",
+                "report_status": "PENDING",
+                "name": "Test User",
+                "email": "test@example.com",
+                "complaint": "This is a test complaint.",
+            }
+            for report in reversed(reports)
+        ]
+
+    def test_export_reports_as_csv(self, api_client, create_report):
+        create_report(title="Relatório, com vírgula", report_status="COMPLETED")
+        create_report(title="Pending Report")
+        url = reverse("report-export")
+
+        response = api_client.get(
+            url, {"format": "csv", "report_status": "COMPLETED", "order_by": "-title"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert [row["title"] for row in rows] == ["Relatório, com vírgula"]
+        assert rows[0]["report_status"] == "COMPLETED"
+
+    def test_export_reports_negotiates_accept(self, api_client, create_report):
+        url = reverse("report-export")
+        response = api_client.get(url, HTTP_ACCEPT="text/csv")
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content).decode().splitlines() == [
+            "id,title,report_type,report_status,name,email,complaint"
+        ]
+
+    def test_export_reports_in_chunks(self, api_client, create_report, monkeypatch):
+        monkeypatch.setattr("src.config.EXPORT_CHUNK_SIZE", 2)
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+        url = reverse("report-export")
+
+        response = api_client.get(url)
+        chunks = list(response.streaming_content)
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+    def test_export_reports_streams_under_asgi(
+        self, create_report, monkeypatch, recwarn
+    ):
+        monkeypatch.setattr("src.config.EXPORT_CHUNK_SIZE", 2)
+        for title in ["A Report", "B Report", "C Report"]:
+            create_report(title=title)
+
+        async def export():
+            response = await AsyncClient().get(reverse("report-export"))
+            return response, [chunk async for chunk in response.streaming_content]
+
+        response, chunks = async_to_sync(export)()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.is_async
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+        assert not [w for w in recwarn if "synchronous iterators" in str(w.message)]
+
+    def test_export_reports_with_invalid_filter(self, api_client):
+        url = reverse("report-export")
+        response = api_client.get(url, {"report_type": "WRONG"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_retrieve_report(self, api_client, create_report):
         report = create_report()
         url = reverse("report-detail", args=[report.id])
@@ -46,6 +241,85 @@ class TestReportViews:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["data"]["id"] == str(report.id)
 
+    def test_retrieve_report_validators(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        response = api_client.get(url)
+        assert response["ETag"] == f'"{report.id}-1"'
+        assert "Last-Modified" in response
+
+    def test_retrieve_report_not_modified(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        etag = f'"{report.id}-1"'
+
+        # Only the version is looked up, the report itself is not fetched
+        with django_assert_num_queries(1) as queries:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert '"version", "report"."updated_at"' in queries[0]["sql"]
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert not response.content
+
+        api_client.patch(url, {"title": "Patched Report"}, format="json")
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == f'"{report.id}-2"'
+
+    def test_retrieve_report_not_modified_since(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        last_modified = api_client.get(url)["Last-Modified"]
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_retrieve_missing_report_conditionally(self, api_client):
+        url = reverse("report-detail", args=["00000000-0000-0000-0000-000000000000"])
+        response = api_client.get(url, HTTP_IF_NONE_MATCH='"etag"')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_reports_not_modified(self, api_client, create_report):
+        create_report(title="A Report")
+        url = reverse("report-list")
+        response = api_client.get(url)
+        etag = response["ETag"]
+        assert "Last-Modified" in response
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+
+        api_client.post(
+            url,
+            {"title": "B Report", "complaint": "New.", "report_type": "OTHER"},
+            format="json",
+        )
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_retrieve_report_is_cached(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        api_client.get(url)
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["title"] == report.title
+
+    def test_retrieve_report_after_partial_update(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        api_client.get(url)
+        api_client.patch(url, {"title": "Patched Report"}, format="json")
+        response = api_client.get(url)
+        assert response.json()["data"]["title"] == "Patched Report"
+
     def test_create_report(self, api_client):
         url = reverse("report-list")
         data = {
@@ -57,6 +331,68 @@ class TestReportViews:
         assert response.status_code == status.HTTP_201_CREATED
         assert "id" in response.json()
 
+    def test_bulk_create_reports(self, api_client):
+        url = reverse("report-bulk-create")
+        data = [
+            {
+                "title": f"Report {index}",
+                "complaint": "Bulk complaint.",
+                "report_type": ReportType.DATA_LEAK.name,
+            }
+            for index in range(3)
+        ]
+        response = api_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        results = response.json()["data"]
+        assert len(results) == 3
+        assert all(result["errors"] == {} for result in results)
+        assert (
+            ReportModel.objects.filter(id__in=[r["id"] for r in results]).count() == 3
+        )
+
+    def test_bulk_create_reports_with_invalid_items(self, api_client):
+        url = reverse("report-bulk-create")
+        data = [
+            {"title": "", "complaint": "Missing title.", "report_type": "OTHER"},
+            {"title": "Valid", "complaint": "Valid.", "report_type": "OTHER"},
+            {"title": "Bad type", "complaint": "Bad type.", "report_type": "WRONG"},
+        ]
+        response = api_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        missing_title, valid, bad_type = response.json()["data"]
+        assert missing_title["id"] is None
+        assert "title" in missing_title["errors"]
+        assert valid["id"] is not None
+        assert bad_type["errors"] == {
+            "non_field_errors": ["report_type must be a valid ReportType"]
+        }
+        assert ReportModel.objects.count() == 1
+
+    def test_bulk_create_reports_requires_a_list(self, api_client):
+        url = reverse("report-bulk-create")
+        response = api_client.post(url, {"title": "Not a list"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_reports_over_the_limit(self, api_client, monkeypatch):
+        monkeypatch.setattr(config, "MAX_BULK_CREATE_SIZE", 3)
+        url = reverse("report-bulk-create")
+        data = [{"title": "Invalid"}] * 3 + [
+            {
+                "title": "Valid",
+                "complaint": "A complaint.",
+                "report_type": ReportType.OTHER.name,
+                "name": "Test User",
+                "email": "test@example.com",
+                "report_status": ReportStatus.PENDING.name,
+            }
+        ]
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "detail" in response.json()
+        assert ReportModel.objects.count() == 0
+
     def test_update_report(self, api_client, create_report):
         report = create_report()
         url = reverse("report-detail", args=[report.id])
@@ -69,6 +405,25 @@ class TestReportViews:
         response = api_client.put(url, data, format="json")
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
+    def test_update_report_without_changes_keeps_the_version(
+        self, api_client, create_report
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        data = {
+            "title": report.title,
+            "complaint": report.complaint,
+            "report_type": report.report_type,
+            "report_status": report.report_status,
+        }
+
+        for _ in range(2):
+            response = api_client.put(url, data, format="json")
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            assert response["ETag"] == f'"{report.id}-1"'
+
+        assert api_client.get(url)["ETag"] == f'"{report.id}-1"'
+
     def test_partial_update_report(self, api_client, create_report):
         report = create_report()
         url = reverse("report-detail", args=[report.id])
@@ -78,9 +433,91 @@ class TestReportViews:
         response = api_client.patch(url, data, format="json")
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
+    def test_partial_update_report_if_match(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        etag = api_client.get(url)["ETag"]
+        data = {"report_status": ReportStatus.COMPLETED.name}
+
+        response = api_client.patch(url, data, format="json", HTTP_IF_MATCH=etag)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == f'"{report.id}-2"'
+
+        response = api_client.patch(url, data, format="json", HTTP_IF_MATCH=etag)
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert api_client.get(url)["ETag"] == f'"{report.id}-2"'
+
+    @pytest.mark.parametrize("etag", ['"other-1"', 'W/"{id}-1"', '"{id}-one"'])
+    def test_partial_update_report_unmatchable_if_match(
+        self, api_client, create_report, etag
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        data = {"report_status": ReportStatus.COMPLETED.name}
+        response = api_client.patch(
+            url, data, format="json", HTTP_IF_MATCH=etag.format(id=report.id)
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    def test_update_report_if_match(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        data = {
+            "title": "Updated Report",
+            "complaint": "Updated complaint.",
+            "report_type": ReportType.INAPPROPRIATE_PRACTICES.name,
+            "report_status": ReportStatus.PROCESSING.name,
+        }
+
+        response = api_client.put(url, data, format="json", HTTP_IF_MATCH="*")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == f'"{report.id}-2"'
+
+        stale = f'"{report.id}-1"'
+        response = api_client.put(url, data, format="json", HTTP_IF_MATCH=stale)
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    def test_partial_update_report_is_a_single_query(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        data = {"report_status": ReportStatus.PROCESSING.name}
+        with django_assert_num_queries(1):
+            response = api_client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        report.refresh_from_db()
+        assert report.report_status == ReportStatus.PROCESSING.name
+
+    def test_partial_update_report_not_found(self, api_client):
+        url = reverse("report-detail", args=["00000000-0000-0000-0000-000000000000"])
+        data = {"report_status": ReportStatus.COMPLETED.name}
+        response = api_client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_partial_update_report_invalid(self, api_client, create_report):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        response = api_client.patch(url, {"report_type": "WRONG"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_delete_report(self, api_client, create_report):
         report = create_report()
         url = reverse("report-detail", args=[report.id])
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not ReportModel.objects.filter(id=report.id).exists()
+
+    def test_delete_report_is_a_single_query(
+        self, api_client, create_report, django_assert_num_queries
+    ):
+        report = create_report()
+        url = reverse("report-detail", args=[report.id])
+        with django_assert_num_queries(1):
+            response = api_client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_delete_report_not_found(self, api_client):
+        url = reverse("report-detail", args=["00000000-0000-0000-0000-000000000000"])
+        response = api_client.delete(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid4
 
 import pytest
@@ -33,6 +34,86 @@ class TestInMemoryReportRepository:
         assert retrieved_report.id == sample_report.id
         assert retrieved_report.title == sample_report.title
 
+    def test_updates_bump_version(self, report_repository, sample_report):
+        report_repository.save(sample_report)
+        saved_at = report_repository.get_version(sample_report.id).updated_at
+
+        report_repository.update_fields(sample_report.id, {"title": "Renamed"})
+        report_repository.update_fields(sample_report.id, {})
+        report_repository.update(
+            Report(
+                id=sample_report.id,
+                title="Updated Report",
+                complaint="Updated Complaint",
+                report_type=ReportType.OTHER,
+                version=2,
+            )
+        )
+
+        version = report_repository.get_version(sample_report.id)
+        assert version.version == 3
+        assert version.updated_at >= saved_at
+        assert report_repository.get_version(uuid4()) is None
+
+    def test_stale_updates_are_rejected(self, report_repository, sample_report):
+        report_repository.save(sample_report)
+        report_repository.update_fields(sample_report.id, {"title": "Renamed"})
+
+        stale = Report(
+            id=sample_report.id,
+            title="Stale",
+            complaint=sample_report.complaint,
+            report_type=sample_report.report_type,
+        )
+        assert report_repository.update(stale) is False
+        assert report_repository.update_fields(sample_report.id, {}, version=1) is False
+        assert report_repository.update_fields(
+            sample_report.id, {"name": "Jane"}, version=2
+        )
+        assert report_repository.get_by_id(sample_report.id).title == "Renamed"
+
+    def test_export(self, report_repository, sample_report):
+        report_repository.save(sample_report)
+
+        assert list(report_repository.export()) == [
+            (
+                sample_report.id,
+                sample_report.title,
+                sample_report.report_type,
+                sample_report.report_status,
+                sample_report.name,
+                str(sample_report.email),
+                sample_report.complaint,
+            )
+        ]
+
+    def test_async_methods(self, report_repository, sample_report):
+        async def run():
+            await report_repository.asave(sample_report)
+            assert await report_repository.aget_by_id(sample_report.id) == sample_report
+            assert await report_repository.alist(search_query="test") == [sample_report]
+            assert await report_repository.acount() == 1
+            assert await report_repository.aupdate_fields(
+                sample_report.id, {"title": "Renamed"}, version=1
+            )
+            assert (await report_repository.aget_version(sample_report.id)).version == 2
+
+            report = await report_repository.aget_by_id(sample_report.id)
+            report.change(title="Updated")
+            assert await report_repository.aupdate(report)
+            assert (await report_repository.aget_version(sample_report.id)).version == 3
+            assert await report_repository.adelete(sample_report.id)
+
+            await report_repository.asave_many(
+                [
+                    Report(title=title, complaint="Complaint", report_type="OTHER")
+                    for title in ["A Report", "B Report"]
+                ]
+            )
+            assert await report_repository.acount() == 2
+
+        asyncio.run(run())
+
     def test_delete(self, report_repository, sample_report):
         report_repository.save(sample_report)
         report_repository.delete(sample_report.id)
@@ -58,6 +139,21 @@ class TestInMemoryReportRepository:
         assert retrieved_report.title == "Updated Report"
         assert retrieved_report.name == "Jane Doe"
 
+    def test_failed_change_leaves_stored_report_and_indexes(
+        self, report_repository, sample_report
+    ):
+        report_repository.save(sample_report)
+        report = report_repository.get_by_id(sample_report.id)
+
+        with pytest.raises(ValueError):
+            report.change(title="Z Report", complaint="")
+
+        assert report_repository.get_by_id(sample_report.id).title == "Test Report"
+        assert report_repository.list(order_by="title", search_query="test") == [
+            sample_report
+        ]
+        assert report_repository.list(search_query="z report") == []
+
     def test_list_without_filters(self, report_repository):
         reports = [
             Report(
@@ -138,3 +234,111 @@ class TestInMemoryReportRepository:
         assert len(ordered_reports) == 2
         assert ordered_reports[0].title == "A Report"
         assert ordered_reports[1].title == "B Report"
+
+    def test_list_with_pagination(self, report_repository):
+        for title in ["C Report", "A Report", "B Report"]:
+            report_repository.save(
+                Report(
+                    id=uuid4(),
+                    title=title,
+                    complaint="Complaint",
+                    report_type=ReportType.DATA_LEAK,
+                )
+            )
+
+        second_page = report_repository.list(
+            order_by="title", current_page=2, per_page=2
+        )
+        assert [report.title for report in second_page] == ["C Report"]
+
+    def test_count(self, report_repository, sample_report):
+        report_repository.save(sample_report)
+
+        assert report_repository.count() == 1
+        assert report_repository.count(search_query="JOHN") == 1
+        assert report_repository.count(search_query="nonexistent") == 0
+
+    def test_sorted_index_follows_updates_and_deletes(self, report_repository):
+        reports = {
+            title: Report(
+                id=uuid4(),
+                title=title,
+                complaint="Complaint",
+                report_type=ReportType.DATA_LEAK,
+            )
+            for title in ["A Report", "B Report", "C Report"]
+        }
+        for report in reports.values():
+            report_repository.save(report)
+
+        # Reports returned by get_by_id may be mutated before update
+        report = report_repository.get_by_id(reports["A Report"].id)
+        report.update_report(
+            title="D Report", complaint="Complaint", report_type=ReportType.OTHER
+        )
+        report_repository.update(report)
+        report_repository.delete(reports["B Report"].id)
+
+        ordered_reports = report_repository.list(order_by="title")
+        assert [report.title for report in ordered_reports] == [
+            "C Report",
+            "D Report",
+        ]
+
+    def test_save_existing_report_replaces_it(self, report_repository, sample_report):
+        report_repository.save(sample_report)
+        report_repository.save(sample_report)
+
+        assert report_repository.count() == 1
+        assert len(report_repository.list(order_by="title")) == 1
+
+    def test_list_descending_pages_from_index(self, report_repository):
+        for index in range(5):
+            report_repository.save(
+                Report(
+                    id=uuid4(),
+                    title=f"Report {index}",
+                    complaint="Complaint",
+                    report_type=ReportType.DATA_LEAK,
+                )
+            )
+
+        second_page = report_repository.list(
+            order_by="-title", current_page=2, per_page=2
+        )
+        last_page = report_repository.list(
+            order_by="-title", current_page=3, per_page=2
+        )
+        assert [report.title for report in second_page] == ["Report 2", "Report 1"]
+        assert [report.title for report in last_page] == ["Report 0"]
+
+    def test_list_with_search_query_pages_over_matches(self, report_repository):
+        for index in range(6):
+            report_repository.save(
+                Report(
+                    id=uuid4(),
+                    title=f"Report {index}",
+                    complaint="Leak" if index % 2 else "Other",
+                    report_type=ReportType.DATA_LEAK,
+                )
+            )
+
+        second_page = report_repository.list(
+            order_by="title", current_page=2, per_page=2, search_query="leak"
+        )
+        assert [report.title for report in second_page] == ["Report 5"]
+
+    def test_list_by_field_without_index(self, report_repository):
+        for name in ["Bob", "Alice"]:
+            report_repository.save(
+                Report(
+                    id=uuid4(),
+                    title="Report",
+                    complaint="Complaint",
+                    report_type=ReportType.DATA_LEAK,
+                    name=name,
+                )
+            )
+
+        ordered_reports = report_repository.list(order_by="-name")
+        assert [report.name for report in ordered_reports] == ["Bob", "Alice"]
@@ -0,0 +1,108 @@
+from uuid import uuid4
+
+import pytest
+
+from src.report.domain.report import Report
+from src.report.domain.value_objects import ReportType
+from src.report.infrastructure.in_memory_report_repository import (
+    InMemoryReportRepository,
+)
+from src.report.infrastructure.in_memory_search_index import ReportSearchIndex
+
+
+def make_report(**kwargs):
+    data = {
+        "id": uuid4(),
+        "title": "Report",
+        "complaint": "Complaint",
+        "report_type": ReportType.DATA_LEAK,
+    }
+    return Report(**{**data, **kwargs})
+
+
+class TestReportSearchIndex:
+    def test_search_matches_substrings_case_insensitively(self):
+        leaked = make_report(complaint="Leaked credentials")
+        index = ReportSearchIndex([leaked, make_report(complaint="Other issue")])
+
+        assert index.search("CREDENTIAL") == {leaked.id}
+        assert index.search("eaked cred") == {leaked.id}
+
+    def test_search_confirms_ngram_candidates(self):
+        report = make_report(title="abcd xbcy")
+        index = ReportSearchIndex([report])
+
+        # Every trigram of "abcy" is indexed, but not the substring itself
+        assert index.search("bcy") == {report.id}
+        assert index.search("abcy") == set()
+
+    def test_search_does_not_match_across_fields(self):
+        report = make_report(title="Data", complaint="Leak")
+        index = ReportSearchIndex([report])
+
+        assert index.search("ataLeak") == set()
+
+    def test_short_queries_are_not_answered(self):
+        index = ReportSearchIndex([make_report(name="Al")])
+
+        assert index.search("al") is None
+
+    def test_common_queries_are_left_to_a_scan(self):
+        index = ReportSearchIndex(make_report(complaint="Leak") for _ in range(1500))
+
+        assert index.search("leak") is None
+
+    def test_remove_and_readd(self):
+        report = make_report(title="Phishing attempt")
+        index = ReportSearchIndex([report])
+
+        index.remove(report.id)
+        assert index.search("phishing") == set()
+
+        report.update_report(
+            title="Spam", complaint="Complaint", report_type=ReportType.OTHER
+        )
+        index.add(report)
+        index.add(report)
+        assert index.search("phishing") == set()
+        assert index.search("spam") == {report.id}
+
+
+class TestInMemoryReportRepositoryWithSearchIndex:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryReportRepository(search_index=ReportSearchIndex())
+
+    def test_list_and_count_use_index(self, repository):
+        reports = [
+            make_report(title=f"Report {index}", complaint=complaint)
+            for index, complaint in enumerate(["Leak", "Other", "Leak", "Leak"])
+        ]
+        for report in reports:
+            repository.save(report)
+
+        page = repository.list(
+            order_by="-title", current_page=1, per_page=2, search_query="LEAK"
+        )
+
+        assert [report.title for report in page] == ["Report 3", "Report 2"]
+        assert repository.count(search_query="leak") == 3
+
+    def test_index_follows_update_and_delete(self, repository):
+        report = make_report(title="Original")
+        repository.save(report)
+
+        report.update_report(
+            title="Renamed", complaint="Complaint", report_type=ReportType.OTHER
+        )
+        repository.update(report)
+        assert repository.count(search_query="original") == 0
+        assert repository.count(search_query="renamed") == 1
+
+        repository.delete(report.id)
+        assert repository.list(search_query="renamed") == []
+
+    def test_short_query_falls_back_to_scan(self, repository):
+        repository.save(make_report(name="Al"))
+
+        assert repository.count(search_query="al") == 1
@@ -1,39 +1,85 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List
 from uuid import UUID
 
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, QueryDict, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date, parse_etags, quote_etag
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_207_MULTI_STATUS,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
+    HTTP_412_PRECONDITION_FAILED,
 )
 
 from src import config
+from src.metrics import aexecute_use_case, execute_use_case
+from src.renderers import CSVRenderer, NDJSONRenderer, ORJSONRenderer
 from src.report.application.use_cases.create_report import (
+    AsyncCreateReport,
     CreateReport,
     CreateReportRequest,
 )
+from src.report.application.use_cases.create_reports import (
+    CreateReports,
+    CreateReportsRequest,
+)
 from src.report.application.use_cases.delete_report import (
+    AsyncDeleteReport,
     DeleteReport,
     DeleteReportRequest,
 )
-from src.report.application.use_cases.exceptions import ReportNotFound
-from src.report.application.use_cases.get_report import GetReport, GetReportRequest
+from src.report.application.use_cases.exceptions import (
+    ConcurrentModification,
+    InvalidListReportRequest,
+    InvalidReport,
+    ReportNotFound,
+)
+from src.report.application.use_cases.export_reports import (
+    ExportReports,
+    ExportReportsRequest,
+)
+from src.report.application.use_cases.get_report import (
+    AsyncGetReport,
+    AsyncGetReportVersion,
+    GetReport,
+    GetReportRequest,
+    GetReportVersion,
+)
 from src.report.application.use_cases.list_report import (
+    AsyncListReport,
     ListReport,
     ListReportRequest,
     ListReportResponse,
 )
 from src.report.application.use_cases.update_report import (
+    AsyncPartialUpdateReport,
+    AsyncUpdateReport,
+    PartialUpdateReport,
     UpdateReport,
     UpdateReportRequest,
 )
-from src.report.repository import DjangoORMReportRepository
+from src.report.domain.value_objects import ReportStatus, ReportType
+from src.report.repository import get_async_report_repository, get_report_repository
 from src.report.serializers import (
+    BulkCreateReportResponseSerializer,
     CreateReportRequestSerializer,
     CreateReportResponseSerializer,
     DeleteReportRequestSerializer,
@@ -41,6 +87,169 @@ from src.report.serializers import (
     RetrieveReportRequestSerializer,
     RetrieveReportResponseSerializer,
     UpdateReportRequestSerializer,
+    list_report_data,
+    retrieve_report_data,
+)
+
+
+def _report_etag(id: UUID, version: int) -> str:
+    return quote_etag(f"{id}-{version}")
+
+
+def _list_etag(output: ListReportResponse) -> str:
+    # Every change to a report bumps its version, so the ids and versions of
+    # a page together with its meta identify its content
+    meta = output.meta
+    content = (
+        meta.current_page,
+        meta.per_page,
+        meta.total,
+        meta.next_cursor,
+        [(str(report.id), report.version) for report in output.data],
+    )
+    return quote_etag(hashlib.sha1(repr(content).encode()).hexdigest())
+
+
+def _last_modified(output: ListReportResponse) -> datetime | None:
+    return max(
+        (report.updated_at for report in output.data if report.updated_at),
+        default=None,
+    )
+
+
+def _with_validators(response, etag: str, updated_at: datetime | None):
+    response["ETag"] = etag
+    if updated_at is not None:
+        response["Last-Modified"] = http_date(updated_at.timestamp())
+    return response
+
+
+def _not_modified(request: Request, etag: str, updated_at: datetime | None = None):
+    """Returns a 304 (or 412) response when the request's preconditions allow
+    it, or None when the full response must be sent."""
+    # HTTP dates have a one second resolution
+    last_modified = int(updated_at.timestamp()) if updated_at is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return _with_validators(response, etag, updated_at)
+
+
+def _is_conditional(request: Request) -> bool:
+    return any(
+        header in request.META
+        for header in ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+    )
+
+
+def _list_param(params: QueryDict, name: str) -> List[str] | None:
+    values = [
+        value.strip()
+        for param in params.getlist(name)
+        for value in param.split(",")
+        if value.strip()
+    ]
+    return values or None
+
+
+def _list_report_request(params: QueryDict) -> ListReportRequest:
+    return ListReportRequest(
+        order_by=params.get("order_by", "title"),
+        current_page=int(params.get("current_page", 1)),
+        per_page=int(params.get("per_page", config.DEFAULT_PAGINATION_SIZE)),
+        search_query=params.get("search_query", None),
+        cursor=params.get("cursor", None),
+        report_status=_list_param(params, "report_status"),
+        report_type=_list_param(params, "report_type"),
+        include_total=params.get("include_total", "").lower() in ("1", "true"),
+    )
+
+
+def _if_match_version(request: Request, id: UUID) -> int | None:
+    """Returns the version an If-Match header requires the report to be at,
+    or None when the update is unconditional. Raises ValueError for ETags
+    that can never match the report."""
+    header = request.META.get("HTTP_IF_MATCH")
+    if header is None:
+        return None
+    etags = parse_etags(header)
+    if etags == ["*"]:
+        return None
+
+    # The update is a single conditional query on one version, so only one
+    # of the report's ETags can be given
+    prefix = f'"{id}-'
+    versions = [
+        etag.removeprefix(prefix).rstrip('"')
+        for etag in etags
+        if etag.startswith(prefix)
+    ]
+    if len(versions) != 1 or not versions[0].isdigit():
+        raise ValueError(f"If-Match does not match report {id}")
+    return int(versions[0])
+
+
+def _updated(response, id: UUID, version: int | None):
+    if version is not None:
+        response["ETag"] = _report_etag(id, version)
+    return response
+
+
+ORDER_BY_PARAMETER = openapi.Parameter(
+    "order_by",
+    openapi.IN_QUERY,
+    description="Field to order by: title, report_type, report_status or email. "
+    "Prefix with '-' for descending order (e.g. '-title'). "
+    "Use 'relevance' to rank search results by how well they match 'search_query'",
+    type=openapi.TYPE_STRING,
+    required=False,
+    example="title",
+)
+
+SEARCH_QUERY_PARAMETER = openapi.Parameter(
+    "search_query",
+    openapi.IN_QUERY,
+    description="Search in title, complaint, name, email, report_type and status",
+    type=openapi.TYPE_STRING,
+    required=False,
+)
+
+REPORT_STATUS_PARAMETER = openapi.Parameter(
+    "report_status",
+    openapi.IN_QUERY,
+    description="Only reports with one of these statuses "
+    "(repeat the parameter or separate values with commas)",
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Items(
+        type=openapi.TYPE_STRING,
+        enum=[status.name for status in ReportStatus],
+    ),
+    collection_format="multi",
+    required=False,
+)
+
+REPORT_TYPE_PARAMETER = openapi.Parameter(
+    "report_type",
+    openapi.IN_QUERY,
+    description="Only reports with one of these types "
+    "(repeat the parameter or separate values with commas)",
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Items(
+        type=openapi.TYPE_STRING,
+        enum=[report_type.name for report_type in ReportType],
+    ),
+    collection_format="multi",
+    required=False,
+)
+
+# The first one is used when neither ?format= nor Accept asks for another
+EXPORT_RENDERERS = [NDJSONRenderer, CSVRenderer]
+
+IF_MATCH_PARAMETER = openapi.Parameter(
+    "If-Match",
+    openapi.IN_HEADER,
+    description="ETag of the report the changes are based on",
+    type=openapi.TYPE_STRING,
 )
 
 
@@ -48,14 +257,7 @@ class ReportViewSet(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
-            openapi.Parameter(
-                "order_by",
-                openapi.IN_QUERY,
-                description="Field to order by. Prefix with '-' for descending order (e.g. '-title')",
-                type=openapi.TYPE_STRING,
-                required=False,
-                example="title",
-            ),
+            ORDER_BY_PARAMETER,
             openapi.Parameter(
                 "current_page",
                 openapi.IN_QUERY,
@@ -72,43 +274,120 @@ class ReportViewSet(viewsets.ViewSet):
                 required=False,
                 default=10,
             ),
+            SEARCH_QUERY_PARAMETER,
+            REPORT_STATUS_PARAMETER,
+            REPORT_TYPE_PARAMETER,
             openapi.Parameter(
-                "search_query",
+                "cursor",
                 openapi.IN_QUERY,
-                description="Search in title, complaint, email, report_type and status",
+                description="Opaque cursor from 'meta.next_cursor'. When given, "
+                "'current_page' is ignored and the page after the cursor is returned",
                 type=openapi.TYPE_STRING,
                 required=False,
             ),
+            openapi.Parameter(
+                "include_total",
+                openapi.IN_QUERY,
+                description="Count the matching reports for 'meta.total' on cursor "
+                "pages, where it is null otherwise. Offset pages always include it",
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+                default=False,
+            ),
         ],
         responses={
             200: ListReportResponseSerializer,
+            304: "Not modified",
+            400: "Invalid order_by, filter or cursor",
         },
         operation_description="List and filter reports with pagination support",
     )
     def list(self, request: Request) -> Response:
-        use_case = ListReport(repository=DjangoORMReportRepository())
-        output: ListReportResponse = use_case.execute(
-            request=ListReportRequest(
-                order_by=request.query_params.get("order_by", "title"),
-                current_page=int(request.query_params.get("current_page", 1)),
-                per_page=int(
-                    request.query_params.get(
-                        "per_page",
-                        config.DEFAULT_PAGINATION_SIZE,
-                    )
-                ),
-                search_query=request.query_params.get("search_query", None),
+        use_case = ListReport(repository=get_report_repository())
+        try:
+            output: ListReportResponse = execute_use_case(
+                use_case, request=_list_report_request(request.query_params)
             )
-        )
-        response_serializer = ListReportResponseSerializer(output)
+        except InvalidListReportRequest as error:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"detail": str(error)})
 
-        return Response(
+        etag = _list_etag(output)
+        last_modified = _last_modified(output)
+        # Only the ETag is checked: removing a report from a page does not
+        # move its last modification date forward
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return _with_validators(not_modified, etag, last_modified)
+
+        response = Response(
             status=HTTP_200_OK,
-            data=response_serializer.data,
+            data=list_report_data(output),
         )
+        return _with_validators(response, etag, last_modified)
 
     @swagger_auto_schema(
-        responses={200: RetrieveReportResponseSerializer, 404: "Report not found"},
+        manual_parameters=[
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                description="Export format, also negotiated from the Accept header",
+                type=openapi.TYPE_STRING,
+                enum=[renderer.format for renderer in EXPORT_RENDERERS],
+                required=False,
+                default=EXPORT_RENDERERS[0].format,
+            ),
+            ORDER_BY_PARAMETER,
+            SEARCH_QUERY_PARAMETER,
+            REPORT_STATUS_PARAMETER,
+            REPORT_TYPE_PARAMETER,
+        ],
+        responses={
+            200: "Every matching report",
+            400: "Invalid order_by or filter",
+        },
+        operation_description="Export all reports matching the list filters as "
+        "newline delimited JSON or CSV, streamed without pagination",
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=EXPORT_RENDERERS,
+    )
+    def export(self, request: Request):
+        use_case = ExportReports(repository=get_report_repository())
+        try:
+            output = execute_use_case(
+                use_case,
+                request=ExportReportsRequest(
+                    order_by=request.query_params.get("order_by", "title"),
+                    search_query=request.query_params.get("search_query", None),
+                    report_status=_list_param(request.query_params, "report_status"),
+                    report_type=_list_param(request.query_params, "report_type"),
+                ),
+            )
+        except InvalidListReportRequest as error:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"detail": str(error)})
+
+        renderer = request.accepted_renderer
+        chunks = renderer.stream(output.fields, output.rows, config.EXPORT_CHUNK_SIZE)
+        if isinstance(request._request, ASGIRequest):
+            chunks = _async_chunks(chunks)
+        response = StreamingHttpResponse(
+            chunks,
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="reports.{renderer.format}"'
+        )
+        return response
+
+    @swagger_auto_schema(
+        responses={
+            200: RetrieveReportResponseSerializer,
+            304: "Not modified",
+            404: "Report not found",
+        },
         operation_description="Get a specific report",
     )
     def retrieve(self, request: Request, pk: UUID = None) -> Response:
@@ -116,17 +395,39 @@ class ReportViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         input = GetReportRequest(**serializer.validated_data)
-        use_case = GetReport(repository=DjangoORMReportRepository())
+        repository = get_report_repository()
+
+        # Conditional requests are answered from the version before the
+        # report itself is fetched
+        if _is_conditional(request):
+            try:
+                version = execute_use_case(
+                    GetReportVersion(repository=repository), input
+                )
+            except ReportNotFound:
+                return Response(status=HTTP_404_NOT_FOUND)
+
+            not_modified = _not_modified(
+                request,
+                _report_etag(version.id, version.version),
+                version.updated_at,
+            )
+            if not_modified is not None:
+                return not_modified
+
+        use_case = GetReport(repository=repository)
 
         try:
-            output = use_case.execute(request=input)
+            output = execute_use_case(use_case, request=input)
         except ReportNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
-        response_serializer = RetrieveReportResponseSerializer(output)
-        return Response(
+        response = Response(
             status=HTTP_200_OK,
-            data=response_serializer.data,
+            data=retrieve_report_data(output),
+        )
+        return _with_validators(
+            response, _report_etag(output.id, output.version), output.updated_at
         )
 
     @swagger_auto_schema(
@@ -139,17 +440,85 @@ class ReportViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         input = CreateReportRequest(**serializer.validated_data)
-        use_case = CreateReport(repository=DjangoORMReportRepository())
-        output = use_case.execute(request=input)
+        use_case = CreateReport(repository=get_report_repository())
+        output = execute_use_case(use_case, request=input)
 
         return Response(
             status=HTTP_201_CREATED,
             data=CreateReportResponseSerializer(output).data,
         )
 
+    @swagger_auto_schema(
+        request_body=CreateReportRequestSerializer(many=True),
+        responses={
+            201: BulkCreateReportResponseSerializer,
+            207: BulkCreateReportResponseSerializer,
+            400: BulkCreateReportResponseSerializer,
+        },
+        operation_description="Create reports in bulk. Every item is validated on "
+        "its own and gets a result with either its id or its errors, in request "
+        "order (201: all created, 207: some created, 400: none created)",
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        if not isinstance(request.data, list):
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"detail": "Expected a list of reports"},
+            )
+
+        # Checked before any item is validated, so that the cap bounds the work
+        if len(request.data) > config.MAX_BULK_CREATE_SIZE:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={
+                    "detail": "Cannot create more than "
+                    f"{config.MAX_BULK_CREATE_SIZE} reports at once"
+                },
+            )
+
+        results = [None] * len(request.data)
+        valid_positions, valid_inputs = [], []
+        for position, item in enumerate(request.data):
+            serializer = CreateReportRequestSerializer(data=item)
+            if serializer.is_valid():
+                valid_positions.append(position)
+                valid_inputs.append(CreateReportRequest(**serializer.validated_data))
+            else:
+                results[position] = {"id": None, "errors": serializer.errors}
+
+        use_case = CreateReports(repository=get_report_repository())
+        try:
+            output = execute_use_case(
+                use_case, CreateReportsRequest(reports=valid_inputs)
+            )
+        except InvalidReport as error:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"detail": str(error)})
+
+        for position, result in zip(valid_positions, output.results):
+            errors = {"non_field_errors": result.errors} if result.errors else {}
+            results[position] = {"id": result.id, "errors": errors}
+
+        if output.created == len(results):
+            response_status = HTTP_201_CREATED
+        elif output.created:
+            response_status = HTTP_207_MULTI_STATUS
+        else:
+            response_status = HTTP_400_BAD_REQUEST
+
+        return Response(
+            status=response_status,
+            data=BulkCreateReportResponseSerializer({"data": results}).data,
+        )
+
     @swagger_auto_schema(
         request_body=UpdateReportRequestSerializer,
-        responses={204: "No content", 404: "Report not found"},
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={
+            204: "No content",
+            404: "Report not found",
+            412: "Report was modified",
+        },
         operation_description="Update a report",
     )
     def update(self, request: Request, pk: UUID = None):
@@ -161,18 +530,31 @@ class ReportViewSet(viewsets.ViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        input = UpdateReportRequest(**serializer.validated_data)
-        use_case = UpdateReport(repository=DjangoORMReportRepository())
         try:
-            use_case.execute(request=input)
+            version = _if_match_version(request, serializer.validated_data["id"])
+        except ValueError:
+            return Response(status=HTTP_412_PRECONDITION_FAILED)
+
+        input = UpdateReportRequest(**serializer.validated_data, version=version)
+        use_case = UpdateReport(repository=get_report_repository())
+        try:
+            output = execute_use_case(use_case, request=input)
         except ReportNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
+        except ConcurrentModification as error:
+            return Response({"detail": str(error)}, status=HTTP_412_PRECONDITION_FAILED)
 
-        return Response(status=HTTP_204_NO_CONTENT)
+        return _updated(Response(status=HTTP_204_NO_CONTENT), output.id, output.version)
 
     @swagger_auto_schema(
         request_body=UpdateReportRequestSerializer,
-        responses={204: "No content", 404: "Report not found"},
+        manual_parameters=[IF_MATCH_PARAMETER],
+        responses={
+            204: "No content",
+            400: "Invalid report",
+            404: "Report not found",
+            412: "Report was modified",
+        },
         operation_description="Partially update a report",
     )
     def partial_update(self, request, pk: UUID = None):
@@ -185,14 +567,23 @@ class ReportViewSet(viewsets.ViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        input = UpdateReportRequest(**serializer.validated_data)
-        use_case = UpdateReport(repository=DjangoORMReportRepository())
         try:
-            use_case.execute(request=input)
+            version = _if_match_version(request, serializer.validated_data["id"])
+        except ValueError:
+            return Response(status=HTTP_412_PRECONDITION_FAILED)
+
+        input = UpdateReportRequest(**serializer.validated_data, version=version)
+        use_case = PartialUpdateReport(repository=get_report_repository())
+        try:
+            output = execute_use_case(use_case, request=input)
+        except InvalidReport as error:
+            return Response({"detail": str(error)}, status=HTTP_400_BAD_REQUEST)
         except ReportNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
+        except ConcurrentModification as error:
+            return Response({"detail": str(error)}, status=HTTP_412_PRECONDITION_FAILED)
 
-        return Response(status=HTTP_204_NO_CONTENT)
+        return _updated(Response(status=HTTP_204_NO_CONTENT), output.id, output.version)
 
     @swagger_auto_schema(
         responses={204: "No content", 404: "Report not found"},
@@ -203,10 +594,169 @@ class ReportViewSet(viewsets.ViewSet):
         request_data.is_valid(raise_exception=True)
 
         input = DeleteReportRequest(**request_data.validated_data)
-        use_case = DeleteReport(repository=DjangoORMReportRepository())
+        use_case = DeleteReport(repository=get_report_repository())
         try:
-            use_case.execute(input)
+            execute_use_case(use_case, input)
         except ReportNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
         return Response(status=HTTP_204_NO_CONTENT)
+
+
+async def _async_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Produces the chunks one at a time in the request's sync thread. ASGI
+    servers would otherwise read a sync iterator whole before sending it."""
+    end = object()
+    try:
+        while (chunk := await sync_to_async(next)(chunks, end)) is not end:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close)()
+
+
+def _json_response(data, status: int = HTTP_200_OK) -> HttpResponse:
+    return HttpResponse(
+        ORJSONRenderer().render(data), status=status, content_type="application/json"
+    )
+
+
+def _json_body(request: HttpRequest) -> dict:
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError as error:
+        raise ValueError(f"JSON parse error - {error}") from error
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return data
+
+
+# Async endpoints for ASGI servers. Django runs async views without holding a
+# worker thread while a request waits, they are plain Django views since DRF
+# views are synchronous. Responses have the same shape as ReportViewSet's.
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncReportListView(View):
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        use_case = AsyncListReport(repository=get_async_report_repository())
+        try:
+            output = await aexecute_use_case(
+                use_case, _list_report_request(request.GET)
+            )
+        except InvalidListReportRequest as error:
+            return _json_response({"detail": str(error)}, HTTP_400_BAD_REQUEST)
+
+        etag = _list_etag(output)
+        last_modified = _last_modified(output)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return _with_validators(not_modified, etag, last_modified)
+
+        return _with_validators(
+            _json_response(list_report_data(output)), etag, last_modified
+        )
+
+    async def post(self, request: HttpRequest) -> HttpResponse:
+        try:
+            data = _json_body(request)
+        except ValueError as error:
+            return _json_response({"detail": str(error)}, HTTP_400_BAD_REQUEST)
+
+        serializer = CreateReportRequestSerializer(data=data)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, HTTP_400_BAD_REQUEST)
+
+        input = CreateReportRequest(**serializer.validated_data)
+        use_case = AsyncCreateReport(repository=get_async_report_repository())
+        try:
+            output = await aexecute_use_case(use_case, request=input)
+        except InvalidReport as error:
+            return _json_response({"detail": str(error)}, HTTP_400_BAD_REQUEST)
+
+        return _json_response(
+            CreateReportResponseSerializer(output).data, HTTP_201_CREATED
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncReportDetailView(View):
+    async def get(self, request: HttpRequest, pk: UUID) -> HttpResponse:
+        input = GetReportRequest(id=pk)
+        repository = get_async_report_repository()
+
+        if _is_conditional(request):
+            try:
+                version = await aexecute_use_case(
+                    AsyncGetReportVersion(repository=repository), input
+                )
+            except ReportNotFound:
+                return HttpResponse(status=HTTP_404_NOT_FOUND)
+
+            not_modified = _not_modified(
+                request,
+                _report_etag(version.id, version.version),
+                version.updated_at,
+            )
+            if not_modified is not None:
+                return not_modified
+
+        use_case = AsyncGetReport(repository=repository)
+        try:
+            output = await aexecute_use_case(use_case, input)
+        except ReportNotFound:
+            return HttpResponse(status=HTTP_404_NOT_FOUND)
+
+        return _with_validators(
+            _json_response(retrieve_report_data(output)),
+            _report_etag(output.id, output.version),
+            output.updated_at,
+        )
+
+    async def put(self, request: HttpRequest, pk: UUID) -> HttpResponse:
+        return await self._update(request, pk, AsyncUpdateReport, partial=False)
+
+    async def patch(self, request: HttpRequest, pk: UUID) -> HttpResponse:
+        return await self._update(request, pk, AsyncPartialUpdateReport, partial=True)
+
+    async def _update(
+        self, request: HttpRequest, pk: UUID, use_case_class, partial: bool
+    ) -> HttpResponse:
+        try:
+            data = _json_body(request)
+        except ValueError as error:
+            return _json_response({"detail": str(error)}, HTTP_400_BAD_REQUEST)
+
+        serializer = UpdateReportRequestSerializer(
+            data={**data, "id": pk}, partial=partial
+        )
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, HTTP_400_BAD_REQUEST)
+
+        try:
+            version = _if_match_version(request, pk)
+        except ValueError:
+            return HttpResponse(status=HTTP_412_PRECONDITION_FAILED)
+
+        input = UpdateReportRequest(**serializer.validated_data, version=version)
+        use_case = use_case_class(repository=get_async_report_repository())
+        try:
+            output = await aexecute_use_case(use_case, request=input)
+        except InvalidReport as error:
+            return _json_response({"detail": str(error)}, HTTP_400_BAD_REQUEST)
+        except ReportNotFound:
+            return HttpResponse(status=HTTP_404_NOT_FOUND)
+        except ConcurrentModification as error:
+            return _json_response({"detail": str(error)}, HTTP_412_PRECONDITION_FAILED)
+
+        return _updated(
+            HttpResponse(status=HTTP_204_NO_CONTENT), output.id, output.version
+        )
+
+    async def delete(self, request: HttpRequest, pk: UUID) -> HttpResponse:
+        use_case = AsyncDeleteReport(repository=get_async_report_repository())
+        try:
+            await aexecute_use_case(use_case, DeleteReportRequest(id=pk))
+        except ReportNotFound:
+            return HttpResponse(status=HTTP_404_NOT_FOUND)
+
+        return HttpResponse(status=HTTP_204_NO_CONTENT)
@@ -37,6 +37,7 @@ THIRD_PARTY_APPS = [
 INSTALLED_APPS += THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    "src.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -45,6 +46,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "src.report.routing.StickyPrimaryMiddleware",
 ]
 
 ROOT_URLCONF = "src.urls"
@@ -78,6 +80,65 @@ DATABASES = {
     }
 }
 
+# SQLite performance profile, applied to every new SQLite connection. WAL lets
+# readers run alongside a writer, synchronous=NORMAL only syncs the WAL at
+# checkpoints, and the busy timeout (ms) makes concurrent writers wait for the
+# lock instead of failing. Set it to None to keep SQLite's defaults.
+# PRAGMA optimize runs at most once per interval (seconds) per database and
+# process, set the interval to None to disable it.
+
+REPORT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    # Negative sizes are in KiB
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+REPORT_SQLITE_OPTIMIZE_INTERVAL = 3600
+
+# Read replicas
+# Reports are read from one of the REPORT_REPLICA_DATABASES and written to
+# "default". A client that wrote a report keeps reading from "default" for
+# REPORT_STICKY_PRIMARY_SECONDS, which should cover the replication lag. Reads
+# do not fill the report cache for as long after a write.
+# To try it locally with SQLite, add a "replica" database with NAME
+# BASE_DIR / "replica.sqlite3", list it below and run "make replicate".
+
+DATABASE_ROUTERS = ["src.report.routing.ReplicaRouter"]
+
+REPORT_REPLICA_DATABASES = []
+REPORT_STICKY_PRIMARY_SECONDS = 10
+
+# Full-text search backend used by the report repository. Use
+# "src.report.search.PostgresFullTextSearchBackend" on PostgreSQL or
+# "src.report.search.IContainsSearchBackend" for plain substring matching.
+
+REPORT_SEARCH_BACKEND = "src.report.search.SQLiteFTS5SearchBackend"
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Use "django.core.cache.backends.redis.RedisCache" with a LOCATION such as
+# "redis://127.0.0.1:6379" in production, so that every worker shares the cache.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Reports read by id are cached in this cache, set it to None to disable caching.
+# Timeouts are in seconds, missing ids are cached for a shorter time. List pages
+# and counts are invalidated on every write, set their timeout to None to
+# disable list caching.
+
+REPORT_CACHE_ALIAS = "default"
+REPORT_CACHE_TIMEOUT = 300
+REPORT_CACHE_MISSING_TIMEOUT = 30
+REPORT_LIST_CACHE_TIMEOUT = 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -97,7 +158,15 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
-REST_FRAMEWORK = {}
+# Responses are rendered with orjson when it is installed (pip install orjson),
+# the renderer falls back to DRF's JSONRenderer otherwise
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "src.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
 
 
 # Internationalization
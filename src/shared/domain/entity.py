@@ -9,7 +9,7 @@ from src.shared.domain.notification import Notification
 logger = logging.getLogger(__name__)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Entity(ABC):
     id: UUID = field(default_factory=uuid.uuid4)
     notification: Notification = field(default_factory=Notification, init=False)
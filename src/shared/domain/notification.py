@@ -1,21 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
-    def __init__(self) -> None:
-        self._errors: List[str] = []
+    # Allocated on the first error, most notifications never hold any
+    _errors: List[str] | None = field(default=None, init=False, repr=False)
 
     def add_error(self, error: str) -> None:
+        if self._errors is None:
+            self._errors = []
         self._errors.append(error)
 
     def add_errors(self, errors: list[str]) -> None:
+        if not errors:
+            return
+        if self._errors is None:
+            self._errors = []
         self._errors.extend(errors)
 
     @property
     def messages(self) -> str:
-        return ",".join(self._errors)
+        return ",".join(self._errors or ())
 
     @property
     def has_errors(self) -> bool:
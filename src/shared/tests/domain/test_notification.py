@@ -29,3 +29,13 @@ class TestNotification:
         assert notification.has_errors
         assert notification.messages == "Error 1,Error 2,Error 3"
         assert str(notification) == "Error 1,Error 2,Error 3"
+
+    def test_errors_are_allocated_on_first_error(self):
+        notification = Notification()
+        notification.add_errors([])
+        assert notification._errors is None
+        notification.add_error("Error 1")
+        assert notification._errors == ["Error 1"]
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(Notification(), "__dict__")
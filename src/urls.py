@@ -5,7 +5,12 @@ from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 from rest_framework.routers import DefaultRouter
 
-from src.report.views import ReportViewSet
+from src.metrics import metrics_view
+from src.report.views import (
+    AsyncReportDetailView,
+    AsyncReportListView,
+    ReportViewSet,
+)
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -26,5 +31,16 @@ urlpatterns = [
         schema_view.with_ui("swagger", cache_timeout=0),
         name="swagger-ui",
     ),
+    path("metrics", metrics_view, name="metrics"),
     path("api/redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="redoc"),
+    path(
+        "api/async/reports/",
+        AsyncReportListView.as_view(),
+        name="async-report-list",
+    ),
+    path(
+        "api/async/reports/<uuid:pk>/",
+        AsyncReportDetailView.as_view(),
+        name="async-report-detail",
+    ),
 ] + router.urls